@@ -0,0 +1,37 @@
+"""
+Benchmark do tempo do batch GCD sobre módulos sintéticos (inteiros aleatórios de `--bits` bits).
+
+Execução:
+    python -m rsa.bench.batch_gcd --keys 100000 --bits 2048 --chunk-size 1024 --workers 8
+"""
+import time
+from argparse import ArgumentParser
+from random import getrandbits
+
+from rsa.utils.BatchGCD import CHUNK_SIZE, chunked_batch_gcd, mpz
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--keys', type=int, default=100000)
+    parser.add_argument('--bits', type=int, default=2048)
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+
+    top = 1 << (args.bits - 1)
+    moduli = [getrandbits(args.bits) | top | 1 for _ in range(args.keys)]
+
+    begin = time.perf_counter()
+    for _ in chunked_batch_gcd(
+        moduli, chunk_size=args.chunk_size, workers=args.workers
+    ):
+        pass
+    elapsed = time.perf_counter() - begin
+
+    print(f'inteiros: {mpz.__module__}.{mpz.__name__}')
+    print(f'{args.keys} módulos em {elapsed:.1f}s')
+
+
+if __name__ == '__main__':
+    main()
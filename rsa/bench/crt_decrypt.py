@@ -0,0 +1,41 @@
+"""
+Benchmark das decifrações por segundo com a exponenciação direta (`c ^ d mod n`) e via CRT.
+
+Execução:
+    python -m rsa.bench.crt_decrypt --key-size 1024 --rounds 200
+"""
+import time
+from argparse import ArgumentParser
+from random import randrange
+
+from rsa.core.RSA import RSA
+from rsa.core.RSAKey import load_private_key
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--key-size', type=int, default=1024)
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+
+    private_key, _ = RSA(key_size=args.key_size).generate_keys()
+    key = load_private_key(private_key)
+    criptograms = [randrange(key.n) for _ in range(args.rounds)]
+
+    begin = time.perf_counter()
+    direct = [pow(c, key.d, key.n) for c in criptograms]
+    direct_rate = args.rounds / (time.perf_counter() - begin)
+
+    begin = time.perf_counter()
+    crt = [key.decrypt_int(c) for c in criptograms]
+    crt_rate = args.rounds / (time.perf_counter() - begin)
+
+    assert direct == crt
+    print(f'direta: {direct_rate:.1f} decifrações/s')
+    print(
+        f'CRT:    {crt_rate:.1f} decifrações/s ({crt_rate / direct_rate:.2f}x)'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark da codificação e da decodificação DER das chaves, com o `pyasn1` e com o codec nativo.
+
+Compara, para a chave pública e para a chave privada (com os valores do CRT) do projeto, o tempo
+médio por operação do `pyasn1` com o do `rsa.utils.der.codec`.
+
+Execução:
+    python -m rsa.bench.der_codec --bits 2048 --loops 2000
+"""
+import time
+from argparse import ArgumentParser
+from typing import Any, Callable, Dict
+
+from pyasn1.codec.der.decoder import decode
+from pyasn1.codec.der.encoder import encode
+
+from rsa.utils.decode_rsa_key import crt_params
+from rsa.utils.der import codec
+from rsa.utils.der.DataTypes.PrivateKey import PrivateKey
+from rsa.utils.der.DataTypes.PublicKey import PublicKey
+from rsa.utils.GenPrimeNumber import generate_prime
+
+
+def measure(operation: Callable[[], Any], loops: int) -> float:
+    """
+    Mede a média de tempo por execução da operação.
+
+    Arguments:
+        operation (Callable[[], Any]): A operação
+        loops (int): Quantidade de execuções
+
+    Returns:
+        float: A média de segundos por execução
+    """
+    begin = time.perf_counter()
+    for _ in range(loops):
+        operation()
+    return (time.perf_counter() - begin) / loops
+
+
+def operations(bits: int) -> Dict[str, Dict[str, Callable[[], Any]]]:
+    """
+    Monta as operações do benchmark, com o `pyasn1` e com o codec nativo, para uma chave de
+    `bits` bits.
+
+    Arguments:
+        bits (int): Número de bits do módulo
+
+    Returns:
+        Dict[str, Dict[str, Callable[[], Any]]]: As operações de cada implementação, por nome
+    """
+    p, q = generate_prime(nbit=bits // 2), generate_prime(nbit=bits // 2)
+    phi = (p - 1) * (q - 1)
+    e = 65537
+    d = pow(e, -1, phi)
+    private_infos = dict(
+        n=p * q, d=d, p=p, q=q, phi=phi, **crt_params(d, p, q)
+    )
+
+    public_der = codec.encode_public_key(n=p * q, e=e)
+    private_der = codec.encode_private_key(**private_infos)
+    public_asn1, _ = decode(public_der, asn1Spec=PublicKey())
+    private_asn1, _ = decode(private_der, asn1Spec=PrivateKey())
+
+    return {
+        'pyasn1': {
+            'encode.public': lambda: encode(public_asn1),
+            'decode.public': lambda: decode(public_der, asn1Spec=PublicKey()),
+            'encode.private': lambda: encode(private_asn1),
+            'decode.private': lambda: decode(
+                private_der, asn1Spec=PrivateKey()
+            ),
+        },
+        'nativo': {
+            'encode.public': lambda: codec.encode_public_key(n=p * q, e=e),
+            'decode.public': lambda: codec.decode_public_key(public_der),
+            'encode.private': lambda: codec.encode_private_key(
+                **private_infos
+            ),
+            'decode.private': lambda: codec.decode_private_key(private_der),
+        },
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--bits', type=int, default=2048)
+    parser.add_argument('--loops', type=int, default=2000)
+    args = parser.parse_args()
+
+    implementations = operations(args.bits)
+    for name in implementations['pyasn1']:
+        pyasn1, native = (
+            measure(implementations[impl][name], args.loops)
+            for impl in ('pyasn1', 'nativo')
+        )
+        print(
+            f'{name:<15} pyasn1={pyasn1 * 1e6:.1f} µs '
+            f'nativo={native * 1e6:.1f} µs ({pyasn1 / native:.1f}x)'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Micro-benchmark do custo do teste de Miller Rabin por número composto e por número primo.
+
+Compara o teste original (todas as rodadas, mesmo após a primeira base provar que o número é
+composto) com o teste atual (saída antecipada e rodadas pelo número de bits). Os compostos são
+sobreviventes da peneira (ver `rsa.utils.Sieve`), como na geração de primos.
+
+Execução:
+    python -m rsa.bench.miller_rabin --bits 1024 2048 --samples 200
+"""
+import time
+from argparse import ArgumentParser
+from itertools import islice
+from random import getrandbits, randint, seed
+from typing import Callable, Dict, List
+
+from rsa.utils.GenPrimeNumber import generate_prime
+from rsa.utils.MillerRabin import MillerRabin
+from rsa.utils.Sieve import candidates
+
+
+def legacy_verify(num: int, iterations: int = 3) -> bool:
+    """
+    Teste original, utilizado como referência do benchmark: executa todas as rodadas.
+
+    Arguments:
+        num (int): O número que será verificado
+        iterations (int): Quantidade de rodadas
+
+    Returns:
+        bool: True para números primos e False para números compostos
+    """
+    exp, multiple = MillerRabin()._factorization(num)
+    bases: List[int] = []
+    while len(bases) < iterations:
+        base = randint(2, num - 1)
+        if base not in bases:
+            bases.append(base)
+
+    result = {}
+    for a in bases:
+        x = pow(a, multiple, num)
+        result[a] = 1 if x in (1, num - 1) else 0
+        if not result[a]:
+            for _ in range(exp):
+                x = pow(x, 2, num)
+                if x == num - 1:
+                    result[a] = 1
+                    break
+    return 0 not in result.values()
+
+
+def measure(verify: Callable[[int], bool], values: List[int]) -> float:
+    """
+    Mede o custo médio, em microssegundos, da verificação de cada valor.
+
+    Arguments:
+        verify (Callable[[int], bool]): A função de verificação
+        values (List[int]): Os valores verificados
+
+    Returns:
+        float: Microssegundos por valor
+    """
+    begin = time.perf_counter()
+    for value in values:
+        verify(value)
+    return (time.perf_counter() - begin) / len(values) * 1e6
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--bits', type=int, nargs='+', default=[1024, 2048])
+    parser.add_argument('--samples', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    seed(args.seed)
+    miller_rabin = MillerRabin()
+    for bits in args.bits:
+        start = getrandbits(bits) | (1 << (bits - 1))
+        composites = [
+            num
+            for num in islice(candidates(start=start), args.samples * 2)
+            if not miller_rabin.verify(num)
+        ][: args.samples]
+        primes = [
+            generate_prime(nbit=bits)
+            for _ in range(max(args.samples // 10, 1))
+        ]
+
+        results: Dict[str, Dict[str, float]] = {}
+        for name, verify in (
+            ('original', legacy_verify),
+            ('atual', miller_rabin.verify),
+        ):
+            results[name] = {
+                'composto': measure(verify, composites),
+                'primo': measure(verify, primes),
+            }
+            print(
+                f'{name:<9} bits={bits} '
+                f'µs/composto={results[name]["composto"]:.1f} '
+                f'µs/primo={results[name]["primo"]:.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark do inverso modular com o JBR, com o `inv_mod` e com o `batch_inv_mod`.
+
+Execução:
+    python -m rsa.bench.mod_inverse --bits 4096 --count 1000
+"""
+import time
+from argparse import ArgumentParser
+from random import getrandbits
+
+from rsa.utils.GenPrimeNumber import generate_prime
+from rsa.utils.JBR import JBR
+from rsa.utils.ModArith import batch_inv_mod, egcd, inv_mod
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--bits', type=int, default=4096)
+    parser.add_argument('--count', type=int, default=1000)
+    args = parser.parse_args()
+
+    # Com um módulo primo, todos os valores não nulos possuem inverso
+    mod = generate_prime(nbit=args.bits)
+    nums = [getrandbits(args.bits) % (mod - 1) + 1 for _ in range(args.count)]
+
+    def jbr(values):
+        return [JBR(mod=mod).invMod(num=num) for num in values]
+
+    def extended(values):
+        return [egcd(num, mod)[1] % mod for num in values]
+
+    def iterative(values):
+        return [inv_mod(num=num, mod=mod) for num in values]
+
+    def batch(values):
+        return batch_inv_mod(values, mod)
+
+    results = {}
+    for name, func in [
+        ('JBR', jbr),
+        ('egcd', extended),
+        ('inv_mod', iterative),
+        ('batch_inv_mod', batch),
+    ]:
+        begin = time.perf_counter()
+        results[name] = func(nums)
+        elapsed = time.perf_counter() - begin
+        print(f'{name:<14} {args.count / elapsed:>12.1f} inversos/s')
+
+    assert all(result == results['JBR'] for result in results.values())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark da vazão da decifração por blocos em paralelo, por quantidade de processos.
+
+Execução:
+    python -m rsa.bench.parallel_decrypt --size-mb 100 --key-size 512 --workers 1 2 4 8
+"""
+import os
+import time
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+
+from rsa.core.RSA import RSA
+from rsa.utils.cli.read_files import read_criptograms
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--size-mb', type=float, default=100)
+    parser.add_argument('--key-size', type=int, default=512)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+
+    rsa = RSA(key_size=args.key_size)
+    private_key, public_key = rsa.generate_keys()
+    size = int(args.size_mb * 1024 * 1024)
+
+    with TemporaryDirectory() as tmp:
+        message_path = os.path.join(tmp, 'message.bin')
+        criptogram_path = os.path.join(tmp, 'criptogram.txt')
+        with open(message_path, 'wb') as file:
+            file.write(os.urandom(size))
+
+        with open(message_path, 'rb') as source, open(
+            criptogram_path, 'w'
+        ) as output:
+            for cif in rsa.encrypt_stream(public_key, source):
+                output.write(f'{cif}\n')
+
+        for workers in args.workers:
+            begin = time.perf_counter()
+            for _ in rsa.decrypt_stream(
+                private_key, read_criptograms(criptogram_path), workers=workers
+            ):
+                pass
+            elapsed = time.perf_counter() - begin
+            print(
+                f'workers={workers:<3} {args.size_mb / elapsed:.3f} MB/s '
+                f'({elapsed:.2f}s)'
+            )
+
+
+if __name__ == '__main__':
+    main()
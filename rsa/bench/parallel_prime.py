@@ -0,0 +1,58 @@
+"""
+Benchmark da latência (p50/p99) para gerar um número primo com a busca especulativa em paralelo.
+
+Execução:
+    python -m rsa.bench.parallel_prime --bits 2048 --samples 20 --workers 1 4 8
+"""
+import time
+from argparse import ArgumentParser
+from statistics import median, quantiles
+from typing import Dict, List
+
+from rsa.utils.GenPrimeNumber import generate_rsa_prime
+from rsa.utils.ParallelPrime import generate_prime_parallel
+
+
+def measure(bits: int, samples: int, workers: int) -> Dict[str, float]:
+    """
+    Mede a latência para a geração de um primo.
+
+    Arguments:
+        bits (int): Número de bits dos primos
+        samples (int): Quantidade de primos gerados
+        workers (int): Quantidade de processos da busca
+
+    Returns:
+        Dict[str, float]: Os valores de p50 e p99, em segundos
+    """
+    latencies: List[float] = []
+    for _ in range(samples):
+        begin = time.perf_counter()
+        if workers == 1:
+            generate_rsa_prime(nbit=bits)
+        else:
+            generate_prime_parallel(nbit=bits, workers=workers)
+        latencies.append(time.perf_counter() - begin)
+    return {
+        'p50': median(latencies),
+        'p99': quantiles(latencies, n=100)[-1],
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--bits', type=int, default=2048)
+    parser.add_argument('--samples', type=int, default=20)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4])
+    args = parser.parse_args()
+
+    for workers in args.workers:
+        result = measure(args.bits, args.samples, workers)
+        print(
+            f'workers={workers:<3} bits={args.bits} '
+            f'p50={result["p50"]:.3f}s p99={result["p99"]:.3f}s'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark dos testes de primalidade na geração de primos: Miller Rabin e Baillie-PSW.
+
+Para cada teste são medidos, por primo gerado, as exponenciações modulares (`pow`), os testes
+fortes de Lucas (somente no Baillie-PSW) e o tempo.
+
+Execução:
+    python -m rsa.bench.primality --bits 1024 2048 --primes 10
+"""
+import time
+from argparse import ArgumentParser
+from random import seed
+from typing import Dict
+
+from rsa.bench.prime_candidates import count_modexp
+from rsa.utils.BPSW import BPSW
+from rsa.utils.GenPrimeNumber import PRIMALITY_TESTS, generate_prime
+
+
+def measure(primality: str, bits: int, primes: int) -> Dict[str, float]:
+    """
+    Mede as médias por primo gerado com o teste `primality`.
+
+    Arguments:
+        primality (str): O teste de primalidade (ver `generate_prime`)
+        bits (int): Número de bits dos primos
+        primes (int): Quantidade de primos gerados
+
+    Returns:
+        Dict[str, float]: As médias de exponenciações, testes de Lucas e segundos por primo
+    """
+    lucas = [0]
+    is_strong_lucas_prp = BPSW._is_strong_lucas_prp
+
+    def _counted(self, num):
+        lucas[0] += 1
+        return is_strong_lucas_prp(self, num)
+
+    BPSW._is_strong_lucas_prp = _counted
+    try:
+        with count_modexp() as counter:
+            begin = time.perf_counter()
+            for _ in range(primes):
+                generate_prime(nbit=bits, primality=primality)
+            elapsed = time.perf_counter() - begin
+    finally:
+        BPSW._is_strong_lucas_prp = is_strong_lucas_prp
+    return {
+        'modexp_per_prime': counter[0] / primes,
+        'lucas_per_prime': lucas[0] / primes,
+        'seconds_per_prime': elapsed / primes,
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--bits', type=int, nargs='+', default=[1024, 2048])
+    parser.add_argument('--primes', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for bits in args.bits:
+        for primality in PRIMALITY_TESTS:
+            seed(args.seed)
+            result = measure(primality, bits=bits, primes=args.primes)
+            print(
+                f'{primality:<13} bits={bits} '
+                f'modexp/primo={result["modexp_per_prime"]:.1f} '
+                f'lucas/primo={result["lucas_per_prime"]:.1f} '
+                f'segundos/primo={result["seconds_per_prime"]:.4f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark da quantidade de exponenciações modulares gastas para gerar cada número primo.
+
+Compara a busca sequencial original (`num += 1` com Miller Rabin em todos os inteiros) com a
+busca atual, que peneira os candidatos antes do teste de Miller Rabin.
+
+Execução:
+    python -m rsa.bench.prime_candidates --bits 1024 --primes 5
+"""
+import builtins
+import time
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from random import randint, seed
+from typing import Callable, Dict, Iterator, List
+
+import rsa.utils.MillerRabin as miller_rabin_module
+from rsa.utils.GenPrimeNumber import generate_prime
+from rsa.utils.MillerRabin import MillerRabin
+
+
+@contextmanager
+def count_modexp() -> Iterator[List[int]]:
+    """
+    Conta as chamadas de `pow` com módulo realizadas pelo teste de Miller Rabin.
+
+    Returns:
+        Iterator[List[int]]: Uma lista de um elemento com o contador de exponenciações
+    """
+    counter = [0]
+
+    def _pow(base, exp, mod=None):
+        if mod is not None:
+            counter[0] += 1
+        return builtins.pow(base, exp, mod)
+
+    miller_rabin_module.pow = _pow
+    try:
+        yield counter
+    finally:
+        del miller_rabin_module.pow
+
+
+def legacy_generate_prime(nbit: int) -> int:
+    """
+    Busca sequencial original, utilizada como referência do benchmark.
+
+    Arguments:
+        nbit (int): Número de bits para o número primo
+
+    Returns:
+        Número primo que foi gerado
+    """
+    num = randint(1 + 2 ** (nbit - 1), 2**nbit)
+    miller_rabin = MillerRabin(iterations=3)
+    while not miller_rabin.verify(num=num):
+        num += 1
+    return num
+
+
+def measure(
+    generator: Callable[[int], int], bits: int, primes: int
+) -> Dict[str, float]:
+    """
+    Mede a média de exponenciações modulares e de tempo por primo gerado.
+
+    Arguments:
+        generator (Callable[[int], int]): A função geradora de primos
+        bits (int): Número de bits dos primos
+        primes (int): Quantidade de primos gerados
+
+    Returns:
+        Dict[str, float]: As médias de exponenciações e de segundos por primo
+    """
+    with count_modexp() as counter:
+        begin = time.perf_counter()
+        for _ in range(primes):
+            generator(bits)
+        elapsed = time.perf_counter() - begin
+    return {
+        'modexp_per_prime': counter[0] / primes,
+        'seconds_per_prime': elapsed / primes,
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--bits', type=int, default=1024)
+    parser.add_argument('--primes', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for name, generator in (
+        ('sequencial', legacy_generate_prime),
+        ('peneira', generate_prime),
+    ):
+        seed(args.seed)
+        result = measure(generator, bits=args.bits, primes=args.primes)
+        print(
+            f'{name:<10} bits={args.bits} '
+            f'modexp/primo={result["modexp_per_prime"]:.1f} '
+            f'segundos/primo={result["seconds_per_prime"]:.4f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
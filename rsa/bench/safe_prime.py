@@ -0,0 +1,83 @@
+"""
+Benchmark do tempo gasto para gerar cada primo seguro 'p = 2q + 1'.
+
+Compara a busca com a peneira simples (somente 'q' é peneirado, e 'q' e 'p' passam pelo teste de
+Miller Rabin) com a busca atual, que peneira 'q' e '2q + 1' ao mesmo tempo e prova 'p' com um
+único teste de Fermat.
+
+Execução:
+    python -m rsa.bench.safe_prime --bits 512 --primes 3
+"""
+import time
+from argparse import ArgumentParser
+from itertools import takewhile
+from random import randint, seed
+from typing import Callable, Dict
+
+from rsa.utils.GenPrimeNumber import generate_safe_prime
+from rsa.utils.MillerRabin import MillerRabin
+from rsa.utils.Sieve import candidates
+
+
+def single_sieve_safe_prime(nbit: int) -> int:
+    """
+    Busca com a peneira simples, utilizada como referência do benchmark.
+
+    Arguments:
+        nbit (int): Número de bits para o número primo 'p'
+
+    Returns:
+        Número primo seguro que foi gerado
+    """
+    miller_rabin = MillerRabin()
+    upper = 2 ** (nbit - 1)
+    while True:
+        start = randint(2 ** (nbit - 2), upper - 1)
+        for q in takewhile(lambda num: num < upper, candidates(start=start)):
+            if miller_rabin.verify(num=q) and miller_rabin.verify(
+                num=2 * q + 1
+            ):
+                return 2 * q + 1
+
+
+def measure(
+    generator: Callable[[int], int], bits: int, primes: int
+) -> Dict[str, float]:
+    """
+    Mede a média de tempo por primo seguro gerado.
+
+    Arguments:
+        generator (Callable[[int], int]): A função geradora de primos seguros
+        bits (int): Número de bits dos primos
+        primes (int): Quantidade de primos gerados
+
+    Returns:
+        Dict[str, float]: A média de segundos por primo
+    """
+    begin = time.perf_counter()
+    for _ in range(primes):
+        generator(bits)
+    return {'seconds_per_prime': (time.perf_counter() - begin) / primes}
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--bits', type=int, default=512)
+    parser.add_argument('--primes', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for name, generator in (
+        ('simples', single_sieve_safe_prime),
+        ('dupla', lambda bits: generate_safe_prime(nbit=bits)),
+    ):
+        seed(args.seed)
+        result = measure(generator, bits=args.bits, primes=args.primes)
+        print(
+            f'{name:<8} bits={args.bits} '
+            f'segundos/primo={result["seconds_per_prime"]:.4f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark do tempo de inicialização do `rsa`, com um orçamento máximo.
+
+Mede a mediana do `rsa --version` e do `rsa --help` em novos processos e compara com a importação
+do `typer` (que carrega o `rich`), o piso de qualquer comando. O benchmark falha (código de saída 1)
+se o custo acima do piso ultrapassar o orçamento ou se algum dos módulos pesados for importado na
+inicialização.
+
+Execução:
+    python -m rsa.bench.startup --runs 20 --budget 0.1
+"""
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+from statistics import median
+from typing import List, Sequence
+
+from rsa.bench.suite import CLI_COMMAND
+
+# Custo máximo, em segundos, de `rsa --version` acima da importação do `typer`
+BUDGET = 0.1
+
+# Módulos que somente os comandos carregam, e não a inicialização do `rsa`
+HEAVY_MODULES = (
+    'pyasn1',
+    'concurrent.futures',
+    'gmpy2',
+    'rich.logging',
+    'rsa.core.RSA',
+    'rsa.bench.suite',
+)
+
+# Lista os módulos pesados carregados pelo `rsa --version`
+_IMPORTED_MODULES = (
+    'import sys\n'
+    'from rsa.core.cli import cli\n'
+    "cli(['--version'], standalone_mode=False)\n"
+    f'print(*(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n'
+)
+
+
+def measure(command: Sequence[str], runs: int) -> float:
+    """
+    Mede a mediana do tempo de parede, em segundos, da execução de `command` em um novo processo.
+
+    Arguments:
+        command (Sequence[str]): O comando
+        runs (int): Quantidade de execuções
+
+    Returns:
+        float: A mediana das execuções
+    """
+    times = []
+    for _ in range(runs):
+        begin = time.perf_counter()
+        subprocess.run(command, check=True, capture_output=True)
+        times.append(time.perf_counter() - begin)
+    return median(times)
+
+
+def heavy_imports() -> List[str]:
+    """
+    Retorna os módulos de `HEAVY_MODULES` importados pelo `rsa --version`.
+
+    Returns:
+        List[str]: Os módulos importados
+    """
+    output = subprocess.run(
+        [sys.executable, '-c', _IMPORTED_MODULES],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    # A última linha, após a linha 'RSA CLI Version: <versão>'
+    return output.splitlines()[-1].split()
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--budget', type=float, default=BUDGET)
+    args = parser.parse_args()
+
+    floor = measure([sys.executable, '-c', 'import typer'], args.runs)
+    print(f'{"import typer":<14} {floor * 1000:.1f} ms')
+
+    over_budget = False
+    for name, extra in (('--version', ['--version']), ('--help', ['--help'])):
+        elapsed = measure([*CLI_COMMAND, *extra], args.runs)
+        overhead = elapsed - floor
+        over_budget |= overhead > args.budget
+        print(
+            f'{"rsa " + name:<14} {elapsed * 1000:.1f} ms '
+            f'(+{overhead * 1000:.1f} ms, orçamento {args.budget * 1000:.0f} ms)'
+        )
+
+    imported = heavy_imports()
+    if imported:
+        print(f'módulos pesados na inicialização: {", ".join(imported)}')
+    if over_budget or imported:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
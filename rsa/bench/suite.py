@@ -0,0 +1,542 @@
+"""
+Suíte de benchmarks dos caminhos críticos do projeto, utilizada pelo comando `rsa bench`.
+
+Cada benchmark é executado com uma semente fixa, após rodadas de aquecimento, e reporta a mediana,
+o percentil 95 e a média do tempo de parede, o pico de memória alocada (via `tracemalloc`) e, para
+os benchmarks de cifração e decifração, a vazão em bytes por segundo. O relatório é salvo em JSON e
+pode ser comparado com um relatório anterior, para encontrar regressões.
+
+Execução:
+    rsa bench --only 'prime.*' --repeat 5 --output baseline.json
+    rsa bench --only 'prime.*' --repeat 5 --baseline baseline.json
+"""
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from fnmatch import fnmatch
+from functools import lru_cache
+from io import BytesIO
+from math import ceil
+from statistics import fmean, median
+from tempfile import TemporaryDirectory
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from rsa.core.RSA import RSA
+from rsa.core.RSAKey import load_private_key, load_public_key
+from rsa.utils.cli.write_files import write_key_pair
+from rsa.utils.der.codec import decode_private_key, encode_private_key
+from rsa.utils.GenPrimeNumber import (
+    generate_prime,
+    generate_safe_prime,
+    primality_test,
+)
+from rsa.utils.JBR import JBR
+from rsa.utils.MillerRabin import MillerRabin
+from rsa.utils.Sieve import candidates
+
+# Limite padrão, em fração da mediana (ou do pico de memória) do baseline, para uma regressão
+THRESHOLD = 0.10
+
+# Tamanho da mensagem cifrada e decifrada pelos benchmarks de vazão
+THROUGHPUT_SIZE = 16 * 1024
+
+# Número de bits de cada primo das chaves utilizadas pelos benchmarks
+KEY_SIZE = 1024
+
+# Comando que executa o `rsa` em um novo interpretador, para a latência de ponta a ponta
+CLI_COMMAND = (sys.executable, '-c', 'from rsa.core.cli import cli; cli()')
+
+Setup = Callable[[], ContextManager[Callable[[], Any]]]
+
+
+class Benchmark(NamedTuple):
+    """
+    Um benchmark da suíte.
+
+    Attributes:
+        name (str): O nome do benchmark, utilizado nos filtros e nos relatórios
+        setup (Setup): Retorna um gerenciador de contexto que prepara os dados e produz a função medida
+        nbytes (int): Quantidade de bytes processados por execução, para o cálculo da vazão
+        in_process (bool): False para os benchmarks que executam outro processo, sem pico de memória
+    """
+
+    name: str
+    setup: Setup
+    nbytes: int = 0
+    in_process: bool = True
+
+
+class BenchResult(NamedTuple):
+    """
+    O resultado de um benchmark, com os tempos em segundos e a memória em bytes.
+
+    Attributes:
+        name (str): O nome do benchmark
+        runs (int): Quantidade de execuções medidas, sem as de aquecimento
+        median (float): A mediana do tempo de parede
+        p95 (float): O percentil 95 do tempo de parede
+        mean (float): A média do tempo de parede
+        min (float): O menor tempo de parede
+        peak_memory (Optional[int]): O pico de memória alocada em uma execução
+        throughput (Optional[float]): A vazão, em bytes por segundo, pela mediana
+    """
+
+    name: str
+    runs: int
+    median: float
+    p95: float
+    mean: float
+    min: float
+    peak_memory: Optional[int]
+    throughput: Optional[float]
+
+
+class Regression(NamedTuple):
+    """
+    Uma métrica que piorou em relação ao baseline.
+
+    Attributes:
+        name (str): O nome do benchmark
+        metric (str): A métrica comparada, 'median' ou 'peak_memory'
+        baseline (float): O valor no baseline
+        current (float): O valor atual
+    """
+
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Calcula o percentil pelo método do posto mais próximo.
+
+    Arguments:
+        values (Sequence[float]): Os valores, ao menos um
+        pct (float): O percentil, entre 0 e 100
+
+    Returns:
+        float: O menor valor que é maior ou igual a `pct`% dos valores
+
+    Examples:
+        >>> percentile([5, 1, 4, 2, 3], 95)
+        5
+
+        >>> percentile([5, 1, 4, 2, 3], 50)
+        3
+    """
+    ordered = sorted(values)
+    return ordered[max(ceil(pct / 100 * len(ordered)), 1) - 1]
+
+
+@lru_cache(maxsize=None)
+def _key_pair(key_size: int, seed: int) -> Tuple[str, str]:
+    """
+    Função privada, com cache, que gera o par de chaves (em hexadecimal) utilizado pelos benchmarks.
+    O estado do gerador pseudoaleatório é restaurado, de forma que o cache não altera os benchmarks.
+    """
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        return RSA(key_size=key_size).generate_keys()
+    finally:
+        random.setstate(state)
+
+
+@contextmanager
+def _prime_setup(
+    bits: int, primality: str = 'miller-rabin'
+) -> Iterator[Callable[[], int]]:
+    """
+    Geração de um primo de `bits` bits, com a peneira e o teste `primality` (ver `generate_prime`).
+    """
+    yield lambda: generate_prime(nbit=bits, primality=primality)
+
+
+@contextmanager
+def _safe_prime_setup(bits: int) -> Iterator[Callable[[], int]]:
+    """
+    Geração de um primo seguro de `bits` bits (ver `generate_safe_prime`).
+    """
+    yield lambda: generate_safe_prime(nbit=bits)
+
+
+@contextmanager
+def _primality_setup(
+    primality: str, bits: int, prime: bool
+) -> Iterator[Callable[[], bool]]:
+    """
+    Teste `primality` de um candidato primo (todas as rodadas) ou composto (saída antecipada).
+    """
+    if prime:
+        num = generate_prime(nbit=bits)
+    else:
+        miller_rabin = MillerRabin()
+        start = random.getrandbits(bits) | (1 << (bits - 1))
+        # O primeiro composto que sobrevive à peneira, como na geração de primos
+        num = next(
+            num
+            for num in candidates(start=start)
+            if not miller_rabin.verify(num=num)
+        )
+    test = primality_test(primality)
+    yield lambda: test.verify(num=num)
+
+
+@contextmanager
+def _jbr_setup(bits: int) -> Iterator[Callable[[], int]]:
+    """
+    Inverso modular pelo algoritmo JBR, como no cálculo do expoente privado.
+    """
+    p, q = generate_prime(nbit=bits // 2), generate_prime(nbit=bits // 2)
+    jbr = JBR(mod=(p - 1) * (q - 1))
+    # 65537 não possui inverso se dividir 'phi'; o expoente é o primeiro ímpar coprimo
+    num = next(e for e in range(65537, 2**32, 2) if jbr.mod % e)
+    yield lambda: jbr.invMod(num=num)
+
+
+@contextmanager
+def _der_setup(operation: str, seed: int) -> Iterator[Callable[[], Any]]:
+    """
+    Codificação ('encode') ou decodificação ('decode') DER de uma chave privada.
+    """
+    private_key, _ = _key_pair(KEY_SIZE, seed)
+    der = bytes.fromhex(private_key)
+    infos = decode_private_key(der)
+    if operation == 'encode':
+        yield lambda: encode_private_key(**infos)
+    else:
+        yield lambda: decode_private_key(der)
+
+
+@contextmanager
+def _cript_setup(seed: int) -> Iterator[Callable[[], List[int]]]:
+    """
+    Cifração por blocos de `THROUGHPUT_SIZE` bytes.
+    """
+    _, public_key = _key_pair(KEY_SIZE, seed)
+    pub_key = load_public_key(key=public_key)
+    message = random.randbytes(THROUGHPUT_SIZE)
+    rsa = RSA()
+    yield lambda: list(rsa.encrypt_stream(pub_key, BytesIO(message)))
+
+
+@contextmanager
+def _dcript_setup(seed: int) -> Iterator[Callable[[], List[bytes]]]:
+    """
+    Decifração, via CRT, dos blocos de uma mensagem de `THROUGHPUT_SIZE` bytes.
+    """
+    private_key, public_key = _key_pair(KEY_SIZE, seed)
+    priv_key = load_private_key(key=private_key)
+    rsa = RSA()
+    criptograms = list(
+        rsa.encrypt_stream(
+            public_key, BytesIO(random.randbytes(THROUGHPUT_SIZE))
+        )
+    )
+    yield lambda: list(rsa.decrypt_stream(priv_key, criptograms))
+
+
+@contextmanager
+def _cli_setup(command: str, seed: int) -> Iterator[Callable[[], Any]]:
+    """
+    Execução do `rsa --version` ('version'), do `rsa --help` ('help') ou do `rsa cript` ('cript')
+    em um novo processo.
+    """
+    with TemporaryDirectory() as directory:
+        if command in ('version', 'help'):
+            args = [f'--{command}']
+        else:
+            private_key, public_key = _key_pair(KEY_SIZE, seed)
+            write_key_pair(
+                key_file_path=directory,
+                file_prefix='bench',
+                private_key=private_key,
+                public_key=public_key,
+                output_type='hex',
+            )
+            args = [
+                'cript',
+                'mensagem do benchmark',
+                '--key-file',
+                f'{directory}/bench_public_key.txt',
+                '--output-path',
+                directory,
+                '--output-filename',
+                'criptograma.txt',
+            ]
+        yield lambda: subprocess.run(
+            [*CLI_COMMAND, *args], check=True, capture_output=True
+        )
+
+
+def benchmarks(seed: int = 0) -> List[Benchmark]:
+    """
+    Retorna os benchmarks da suíte.
+
+    Arguments:
+        seed (int): A semente das chaves utilizadas pelos benchmarks
+
+    Returns:
+        List[Benchmark]: Os benchmarks, na ordem de execução
+    """
+    suite = [
+        Benchmark(
+            f'prime.generate.{bits}', lambda bits=bits: _prime_setup(bits)
+        )
+        for bits in (512, 1024, 2048)
+    ]
+    suite += [
+        Benchmark(
+            f'bpsw.generate.{bits}',
+            lambda bits=bits: _prime_setup(bits, primality='bpsw'),
+        )
+        for bits in (512, 1024, 2048)
+    ]
+    suite += [
+        Benchmark(
+            f'{name}.verify.{kind}.{bits}',
+            lambda primality=primality, bits=bits, kind=kind: _primality_setup(
+                primality, bits, prime=kind == 'prime'
+            ),
+        )
+        for name, primality in (
+            ('miller_rabin', 'miller-rabin'),
+            ('bpsw', 'bpsw'),
+        )
+        for bits in (1024, 2048)
+        for kind in ('prime', 'composite')
+    ]
+    suite += [
+        Benchmark(
+            f'safe_prime.generate.{bits}',
+            lambda bits=bits: _safe_prime_setup(bits),
+        )
+        for bits in (256, 512)
+    ]
+    suite += [
+        Benchmark('jbr.inv_mod.2048', lambda: _jbr_setup(2048)),
+        Benchmark('der.encode.private', lambda: _der_setup('encode', seed)),
+        Benchmark('der.decode.private', lambda: _der_setup('decode', seed)),
+        Benchmark('rsa.cript', lambda: _cript_setup(seed), THROUGHPUT_SIZE),
+        Benchmark('rsa.dcript', lambda: _dcript_setup(seed), THROUGHPUT_SIZE),
+        Benchmark(
+            'cli.version',
+            lambda: _cli_setup('version', seed),
+            in_process=False,
+        ),
+        Benchmark(
+            'cli.help', lambda: _cli_setup('help', seed), in_process=False
+        ),
+        Benchmark(
+            'cli.cript', lambda: _cli_setup('cript', seed), in_process=False
+        ),
+    ]
+    return suite
+
+
+def select(
+    suite: Sequence[Benchmark], patterns: Optional[Sequence[str]] = None
+) -> List[Benchmark]:
+    """
+    Filtra os benchmarks pelo nome.
+
+    Arguments:
+        suite (Sequence[Benchmark]): Os benchmarks
+        patterns (Optional[Sequence[str]]): Padrões no formato glob (ex.: 'prime.*'); sem padrões, todos são selecionados
+
+    Returns:
+        List[Benchmark]: Os benchmarks selecionados, na ordem da suíte
+    """
+    if not patterns:
+        return list(suite)
+    return [
+        benchmark
+        for benchmark in suite
+        if any(fnmatch(benchmark.name, pattern) for pattern in patterns)
+    ]
+
+
+def run_benchmark(
+    benchmark: Benchmark, repeat: int = 10, warmup: int = 1, seed: int = 0
+) -> BenchResult:
+    """
+    Executa um benchmark: a semente é fixada antes da preparação, as rodadas de aquecimento são
+    descartadas e o pico de memória é medido em uma execução separada das execuções cronometradas.
+
+    Arguments:
+        benchmark (Benchmark): O benchmark
+        repeat (int): Quantidade de execuções medidas
+        warmup (int): Quantidade de execuções de aquecimento
+        seed (int): A semente do gerador pseudoaleatório
+
+    Returns:
+        BenchResult: O resultado do benchmark
+    """
+    if repeat < 1 or warmup < 0:
+        raise ValueError(
+            "O valor de 'repeat' deve ser maior que 0 e o de 'warmup' não pode ser negativo."
+        )
+
+    random.seed(seed)
+    with benchmark.setup() as func:
+        for _ in range(warmup):
+            func()
+
+        times = []
+        for _ in range(repeat):
+            begin = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - begin)
+
+        peak_memory = None
+        if benchmark.in_process:
+            tracemalloc.start()
+            try:
+                func()
+                peak_memory = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+    middle = median(times)
+    return BenchResult(
+        name=benchmark.name,
+        runs=repeat,
+        median=middle,
+        p95=percentile(times, 95),
+        mean=fmean(times),
+        min=min(times),
+        peak_memory=peak_memory,
+        throughput=benchmark.nbytes / middle if benchmark.nbytes else None,
+    )
+
+
+def run_suite(
+    patterns: Optional[Sequence[str]] = None,
+    repeat: int = 10,
+    warmup: int = 1,
+    seed: int = 0,
+) -> Iterator[BenchResult]:
+    """
+    Executa os benchmarks selecionados (ver `select`), um a um.
+
+    Arguments:
+        patterns (Optional[Sequence[str]]): Padrões no formato glob dos benchmarks executados
+        repeat (int): Quantidade de execuções medidas de cada benchmark
+        warmup (int): Quantidade de execuções de aquecimento de cada benchmark
+        seed (int): A semente do gerador pseudoaleatório
+
+    Returns:
+        Iterator[BenchResult]: Os resultados, à medida que cada benchmark termina
+    """
+    for benchmark in select(benchmarks(seed=seed), patterns):
+        yield run_benchmark(benchmark, repeat=repeat, warmup=warmup, seed=seed)
+
+
+def make_report(
+    results: Sequence[BenchResult], repeat: int, warmup: int, seed: int
+) -> Dict[str, Any]:
+    """
+    Monta o relatório em JSON dos resultados, com as informações do ambiente.
+
+    Arguments:
+        results (Sequence[BenchResult]): Os resultados
+        repeat (int): Quantidade de execuções medidas de cada benchmark
+        warmup (int): Quantidade de execuções de aquecimento de cada benchmark
+        seed (int): A semente do gerador pseudoaleatório
+
+    Returns:
+        Dict[str, Any]: O relatório
+    """
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'warmup': warmup,
+        'seed': seed,
+        'results': [result._asdict() for result in results],
+    }
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    """
+    Salva o relatório (ver `make_report`) em um arquivo JSON.
+
+    Arguments:
+        report (Dict[str, Any]): O relatório
+        path (str): O arquivo onde o relatório será salvo
+    """
+    with open(path, 'w') as file:
+        json.dump(report, file, indent=2)
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    """
+    Realiza a leitura de um relatório salvo por `save_report`.
+
+    Arguments:
+        path (str): O arquivo do relatório
+
+    Returns:
+        Dict[str, Any]: O relatório
+    """
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = THRESHOLD,
+) -> List[Regression]:
+    """
+    Compara dois relatórios, benchmark a benchmark, pela mediana do tempo e pelo pico de memória.
+    Os benchmarks presentes em somente um dos relatórios são ignorados.
+
+    Arguments:
+        current (Dict[str, Any]): O relatório atual
+        baseline (Dict[str, Any]): O relatório de referência
+        threshold (float): A piora tolerada, em fração do valor do baseline
+
+    Returns:
+        List[Regression]: As métricas que pioraram mais que `threshold`
+
+    Examples:
+        >>> old = {'results': [{'name': 'a', 'median': 1.0, 'peak_memory': 100}]}
+        >>> new = {'results': [{'name': 'a', 'median': 1.5, 'peak_memory': 105}]}
+        >>> compare(new, old)
+        [Regression(name='a', metric='median', baseline=1.0, current=1.5)]
+    """
+    reference = {result['name']: result for result in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        old = reference.get(result['name'])
+        if old is None:
+            continue
+        for metric in ('median', 'peak_memory'):
+            if old[metric] is None or result[metric] is None:
+                continue
+            if result[metric] > old[metric] * (1 + threshold):
+                regressions.append(
+                    Regression(
+                        result['name'], metric, old[metric], result[metric]
+                    )
+                )
+    return regressions
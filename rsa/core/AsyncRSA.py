@@ -0,0 +1,319 @@
+import asyncio
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+
+from rsa.core.RSA import RSA
+from rsa.core.RSAKey import (
+    RSAPrivateKey,
+    RSAPublicKey,
+    load_private_key,
+    load_public_key,
+)
+from rsa.utils.GenPrimeNumber import check_public_exp, generate_rsa_prime
+from rsa.utils.parallel import batched
+
+# Quantidade de candidatos verificados por etapa da busca de um primo. Cada etapa é uma tarefa do
+# executor, e o cancelamento interrompe a busca entre as etapas
+STEP_CANDIDATES = 32
+
+# Quantidade de mensagens, ou criptogramas, por tarefa do executor nas operações em lote
+BATCH_SIZE = 256
+
+
+def _encrypt_messages(
+    key: RSAPublicKey, messages: List[Union[str, bytes]]
+) -> List[int]:
+    """
+    Função privada, executada no executor, que cifra cada mensagem (ver `RSA.encrypt_batch`).
+    """
+    return list(RSA().encrypt_batch(public_key=key, messages=messages))
+
+
+def _decrypt_messages(
+    key: RSAPrivateKey, criptograms: List[int], encoding: Optional[str]
+) -> List[Union[bytes, str]]:
+    """
+    Função privada, executada no executor, que decifra cada criptograma (ver `RSA.decrypt_batch`).
+    """
+    return list(
+        RSA().decrypt_batch(
+            private_key=key, criptograms=criptograms, encoding=encoding
+        )
+    )
+
+
+class AsyncRSA:
+    """
+    Interface do RSA para uso em um event loop do `asyncio`: a geração de chaves, a cifração e a
+    decifração são executadas em um executor, sem bloquear o event loop.
+
+    Por padrão, é criado um pool de `workers` processos na primeira operação, encerrado por `close`
+    (ou ao sair do `async with`). Um executor informado em `executor` (ex.: um pool compartilhado
+    pela aplicação) pode ser reutilizado por várias instâncias e não é encerrado. Com um
+    `ThreadPoolExecutor` o event loop fica livre, mas as operações não executam em paralelo (GIL).
+
+    No máximo `max_concurrency` tarefas ficam no executor ao mesmo tempo; as demais operações
+    aguardam uma vaga, sem enfileirar trabalho no executor. As operações em lote são divididas em
+    tarefas de `BATCH_SIZE` itens, executadas em paralelo.
+
+    A busca de cada primo é dividida em etapas de `STEP_CANDIDATES` candidatos (ver
+    `generate_rsa_prime`): se a tarefa que aguarda `generate_keys` for cancelada, a busca é
+    interrompida ao fim da etapa em andamento, e as tarefas ainda não iniciadas são canceladas.
+
+    Attributes:
+        key_size (int): Número de bits de cada um dos primos 'p' e 'q'
+        primality (str): O teste de primalidade utilizado na geração dos primos, 'miller-rabin' ou 'bpsw'
+        safe_primes (bool): Se True, 'p' e 'q' são primos seguros (ver `generate_safe_prime`)
+        workers (Optional[int]): Quantidade de processos do pool criado, por padrão a quantidade de CPUs
+        max_concurrency (int): Quantidade máxima de tarefas no executor, por padrão o dobro de `workers` (ou da quantidade de CPUs)
+        in_flight (int): Quantidade de tarefas no executor
+
+    Examples:
+        >>> async def main():
+        ...     async with AsyncRSA(key_size=256) as rsa:
+        ...         private_key, public_key = await rsa.generate_keys()
+        ...         criptogram = await rsa.encrypt(public_key, 'mensagem')
+        ...         return await rsa.decrypt(private_key, criptogram, encoding='utf-8')
+        >>> asyncio.run(main())
+        'mensagem'
+    """
+
+    def __init__(
+        self,
+        key_size: int = 1024,
+        primality: str = 'miller-rabin',
+        safe_primes: bool = False,
+        executor: Optional[Executor] = None,
+        workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        # Valida os parâmetros da geração de chaves
+        self._rsa = RSA(
+            key_size=key_size, primality=primality, safe_primes=safe_primes
+        )
+        self.key_size = key_size
+        self.primality = primality
+        self.safe_primes = safe_primes
+        self.workers = workers
+        if max_concurrency is None:
+            max_concurrency = 2 * (workers or os.cpu_count() or 1)
+        if max_concurrency < 1:
+            raise ValueError(
+                "O valor de 'max_concurrency' deve ser maior que 0."
+            )
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> 'AsyncRSA':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Encerra o pool de processos criado pela instância, cancelando as tarefas não iniciadas.
+        Um executor informado em `executor` não é encerrado.
+        """
+        if self._owns_executor and self._executor is not None:
+            executor, self._executor = self._executor, None
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None,
+                partial(executor.shutdown, wait=True, cancel_futures=True),
+            )
+
+    async def _submit(self, func: Callable, *args: Any) -> asyncio.Future:
+        """
+        Método privado que aguarda uma vaga e submete `func` ao executor. A vaga é liberada quando
+        a tarefa termina no executor (e não quando o resultado deixa de ser aguardado).
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        await self._slots.acquire()
+        self.in_flight += 1
+        loop = asyncio.get_running_loop()
+
+        def release() -> None:
+            self.in_flight -= 1
+            self._slots.release()
+
+        def done(_: Future) -> None:
+            # Executado na thread do executor
+            try:
+                loop.call_soon_threadsafe(release)
+            except RuntimeError:  # O event loop já foi encerrado
+                pass
+
+        try:
+            future = self._executor.submit(func, *args)
+        except BaseException:
+            release()
+            raise
+        future.add_done_callback(done)
+        return asyncio.wrap_future(future)
+
+    async def _run(self, func: Callable, *args: Any) -> Any:
+        """
+        Método privado que executa `func` no executor e retorna o resultado.
+        """
+        return await (await self._submit(func, *args))
+
+    async def _map(
+        self, func: Callable, key: Any, items: Iterable, *args: Any
+    ) -> List[Any]:
+        """
+        Método privado que executa `func(key, lote, *args)` sobre lotes de `BATCH_SIZE` itens, em
+        paralelo, e concatena os resultados na ordem dos itens.
+        """
+        pending: List[asyncio.Future] = []
+        try:
+            for batch in batched(items, BATCH_SIZE):
+                pending.append(await self._submit(func, key, batch, *args))
+            results = await asyncio.gather(*pending)
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+        return [item for result in results for item in result]
+
+    async def _search_prime(self, public_exp: int) -> int:
+        """
+        Método privado que busca um primo adequado ao RSA, em etapas de `STEP_CANDIDATES` candidatos.
+        """
+        step = partial(
+            generate_rsa_prime,
+            nbit=self.key_size,
+            public_exp=public_exp,
+            primality=self.primality,
+            safe=self.safe_primes,
+            max_candidates=STEP_CANDIDATES,
+        )
+        while True:
+            prime = await self._run(step)
+            if prime is not None:
+                return prime
+
+    async def generate_keys(self, public_exp: int = 65537) -> Tuple[str, str]:
+        """
+        Gera as chaves pública e privada do RSA (ver `RSA.generate_keys`), com os primos 'p' e 'q'
+        buscados em paralelo.
+
+        Arguments:
+            public_exp (int): O valor para o expoente público
+
+        Returns:
+            Tuple[str, str]: As chaves privada e pública, codificadas em hexadecimal.
+
+        Raises:
+            ValueError: Se o expoente público for par, ou menor ou igual a 1
+        """
+        check_public_exp(public_exp)
+        searches = [
+            asyncio.ensure_future(self._search_prime(public_exp))
+            for _ in range(2)
+        ]
+        try:
+            p, q = await asyncio.gather(*searches)
+        except BaseException:
+            for search in searches:
+                search.cancel()
+            raise
+
+        # Somente 'q' é gerado novamente caso seja igual a 'p'
+        while q == p:
+            q = await self._search_prime(public_exp)
+        return self._rsa.keys_from_primes(p=p, q=q, public_exp=public_exp)
+
+    async def encrypt(
+        self,
+        public_key: Union[str, bytes, RSAPublicKey],
+        msg: Union[str, bytes],
+    ) -> int:
+        """
+        Cifra uma mensagem, no formato de `RSA.encrypt_batch` (o criptograma não é decifrado por
+        `RSA.dcript`).
+
+        Arguments:
+            public_key (Union[str, bytes, RSAPublicKey]): A chave pública (ver `load_public_key`)
+            msg (Union[str, bytes]): A mensagem, menor que o módulo da chave
+
+        Returns:
+            int: O criptograma
+
+        Raises:
+            ValueError: Se a mensagem for maior ou igual ao módulo da chave
+        """
+        (criptogram,) = await self.encrypt_batch(public_key, [msg])
+        return criptogram
+
+    async def decrypt(
+        self,
+        private_key: Union[str, bytes, RSAPrivateKey],
+        criptogram: int,
+        encoding: Optional[str] = None,
+    ) -> Union[bytes, str]:
+        """
+        Decifra um criptograma gerado por `encrypt`, ou por `RSA.encrypt_batch` (ver
+        `RSA.decrypt_batch`).
+
+        Arguments:
+            private_key (Union[str, bytes, RSAPrivateKey]): A chave privada (ver `load_private_key`)
+            criptogram (int): O criptograma
+            encoding (Optional[str]): Se informado, a mensagem é decodificada para texto
+
+        Returns:
+            Union[bytes, str]: A mensagem, em bytes ou texto
+        """
+        (msg,) = await self.decrypt_batch(private_key, [criptogram], encoding)
+        return msg
+
+    async def encrypt_batch(
+        self,
+        public_key: Union[str, bytes, RSAPublicKey],
+        messages: Iterable[Union[str, bytes]],
+    ) -> List[int]:
+        """
+        Cifra cada mensagem com a mesma chave (ver `RSA.encrypt_batch`).
+
+        Arguments:
+            public_key (Union[str, bytes, RSAPublicKey]): A chave pública (ver `load_public_key`)
+            messages (Iterable[Union[str, bytes]]): As mensagens, cada uma menor que o módulo
+
+        Returns:
+            List[int]: O criptograma de cada mensagem, em ordem
+
+        Raises:
+            ValueError: Se uma mensagem for maior ou igual ao módulo da chave
+        """
+        key = load_public_key(key=public_key)
+        return await self._map(_encrypt_messages, key, messages)
+
+    async def decrypt_batch(
+        self,
+        private_key: Union[str, bytes, RSAPrivateKey],
+        criptograms: Iterable[int],
+        encoding: Optional[str] = None,
+    ) -> List[Union[bytes, str]]:
+        """
+        Decifra cada criptograma gerado por `encrypt_batch` (ver `RSA.decrypt_batch`).
+
+        Arguments:
+            private_key (Union[str, bytes, RSAPrivateKey]): A chave privada (ver `load_private_key`)
+            criptograms (Iterable[int]): Os criptogramas, um por mensagem
+            encoding (Optional[str]): Se informado, cada mensagem é decodificada para texto
+
+        Returns:
+            List[Union[bytes, str]]: As mensagens, em ordem
+        """
+        key = load_private_key(key=private_key)
+        return await self._map(_decrypt_messages, key, criptograms, encoding)
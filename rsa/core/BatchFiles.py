@@ -0,0 +1,336 @@
+import json
+import os
+import time
+from glob import glob
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from rsa.core.RSA import RSA
+from rsa.core.RSAKey import RSAPrivateKey, RSAPublicKey
+from rsa.utils.cli.read_files import iter_criptograms
+from rsa.utils.container import write_container
+from rsa.utils.logging.config import log
+from rsa.utils.parallel import ordered_map
+
+# Arquivo, no diretório de saída, com o tamanho e a data de modificação dos arquivos processados
+MANIFEST = '.rsa-batch.json'
+
+# Quantidade de arquivos por lote enviado aos processos
+FILES_PER_TASK = 16
+
+Key = Union[RSAPublicKey, RSAPrivateKey]
+
+
+class FileResult(NamedTuple):
+    """
+    O resultado do processamento de um arquivo.
+
+    Attributes:
+        path (str): O caminho do arquivo, relativo ao diretório de entrada
+        size (int): O tamanho do arquivo de entrada, em bytes
+        mtime (int): A data de modificação do arquivo de entrada, em nanossegundos
+        output_size (int): O tamanho do arquivo de saída, em bytes
+        error (Optional[str]): A mensagem de erro, se o arquivo não foi processado
+    """
+
+    path: str
+    size: int
+    mtime: int
+    output_size: int = 0
+    error: Optional[str] = None
+
+
+class BatchReport(NamedTuple):
+    """
+    O resumo do processamento de um diretório.
+
+    Attributes:
+        processed (int): Quantidade de arquivos processados
+        skipped (int): Quantidade de arquivos ignorados, com a saída atualizada
+        failed (List[FileResult]): Os arquivos com erro
+        total_bytes (int): A soma do tamanho dos arquivos processados, em bytes
+        elapsed (float): O tempo total, em segundos
+    """
+
+    processed: int
+    skipped: int
+    failed: List[FileResult]
+    total_bytes: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """
+        A quantidade de bytes processados por segundo.
+        """
+        return self.total_bytes / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        """
+        A quantidade de arquivos processados por segundo.
+        """
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+
+def find_files(
+    input_dir: str, patterns: Iterable[str], exclude: Optional[str] = None
+) -> List[str]:
+    """
+    Encontra os arquivos de `input_dir` que correspondem a algum dos padrões (ver `glob`).
+
+    Arguments:
+        input_dir (str): O diretório de entrada
+        patterns (Iterable[str]): Os padrões, relativos a `input_dir` (ex.: '**/*.txt')
+        exclude (Optional[str]): Um diretório cujos arquivos são ignorados (ex.: o diretório de saída)
+
+    Returns:
+        List[str]: Os caminhos dos arquivos, relativos a `input_dir`, em ordem
+    """
+    exclude = os.path.realpath(exclude) + os.sep if exclude else None
+    files = set()
+    for pattern in patterns:
+        for path in glob(os.path.join(input_dir, pattern), recursive=True):
+            if not os.path.isfile(path):
+                continue
+            if exclude and os.path.realpath(path).startswith(exclude):
+                continue
+            files.add(os.path.relpath(path, input_dir))
+    return sorted(files)
+
+
+def load_manifest(
+    output_dir: str, job: Dict[str, str]
+) -> Dict[str, List[int]]:
+    """
+    Realiza a leitura do `MANIFEST` do diretório de saída. O manifesto somente é utilizado se tiver
+    sido gerado pela mesma operação, com a mesma chave e o mesmo formato (`job`).
+
+    Arguments:
+        output_dir (str): O diretório de saída
+        job (Dict[str, str]): A operação, o fingerprint da chave e o formato de saída
+
+    Returns:
+        Dict[str, List[int]]: O tamanho e a data de modificação de cada arquivo de entrada, e o tamanho do arquivo de saída
+    """
+    try:
+        with open(os.path.join(output_dir, MANIFEST)) as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get('job') != job:
+        return {}
+    return manifest.get('files', {})
+
+
+def save_manifest(
+    output_dir: str, job: Dict[str, str], files: Dict[str, List[int]]
+) -> None:
+    """
+    Realiza a escrita do `MANIFEST` no diretório de saída, de forma atômica.
+
+    Arguments:
+        output_dir (str): O diretório de saída
+        job (Dict[str, str]): A operação, o fingerprint da chave e o formato de saída
+        files (Dict[str, List[int]]): Os arquivos processados (ver `load_manifest`)
+    """
+    path = os.path.join(output_dir, MANIFEST)
+    with open(f'{path}.tmp', 'w') as file:
+        json.dump({'job': job, 'files': files}, file)
+    os.replace(f'{path}.tmp', path)
+
+
+def is_up_to_date(
+    entry: Optional[List[int]], stat: os.stat_result, target: str
+) -> bool:
+    """
+    Verifica se a saída de um arquivo está atualizada: o arquivo de entrada possui o mesmo tamanho e
+    a mesma data de modificação registrados no manifesto, e o arquivo de saída o mesmo tamanho.
+
+    Arguments:
+        entry (Optional[List[int]]): O registro do arquivo no manifesto
+        stat (os.stat_result): O `os.stat` do arquivo de entrada
+        target (str): O arquivo de saída
+
+    Returns:
+        bool: True se o arquivo pode ser ignorado
+    """
+    if not entry or entry[:2] != [stat.st_size, stat.st_mtime_ns]:
+        return False
+    try:
+        return os.path.getsize(target) == entry[2]
+    except OSError:
+        return False
+
+
+# Operação, chave e formato utilizados pelos processos do pool, definidos uma única vez por processo
+_worker_job: Optional[Tuple[str, Key, str]] = None
+
+
+def _set_worker_job(operation: str, key: Key, output_format: str) -> None:
+    """
+    Função privada executada ao iniciar cada processo do pool, evitando enviar a chave a cada lote.
+    """
+    global _worker_job
+    _worker_job = (operation, key, output_format)
+
+
+def _process_file(source: str, target: str) -> None:
+    """
+    Função privada que cifra, ou decifra, o arquivo `source` em `target`.
+    """
+    operation, key, output_format = _worker_job
+    with open(source, 'rb') as file, open(target, 'wb') as output:
+        if operation == 'cript':
+            criptograms = RSA().encrypt_stream(public_key=key, source=file)
+            if output_format == 'binary':
+                write_container(
+                    output=output,
+                    fingerprint=key.fingerprint,
+                    block_size=key.size,
+                    criptograms=criptograms,
+                )
+            else:
+                output.writelines(f'{cif}\n'.encode() for cif in criptograms)
+        else:
+            output.writelines(
+                RSA().decrypt_stream(
+                    private_key=key,
+                    criptograms=iter_criptograms(
+                        file=file, fingerprint=key.fingerprint
+                    ),
+                )
+            )
+
+
+def _process_files(
+    tasks: List[Tuple[str, str, str, int, int]]
+) -> List[FileResult]:
+    """
+    Função privada, executada pelos processos do pool, que processa um lote de arquivos. Os erros
+    são registrados no resultado de cada arquivo, sem interromper o lote.
+
+    A saída é escrita em um arquivo temporário e renomeada ao final, de forma que uma execução
+    interrompida não deixa arquivos de saída incompletos.
+    """
+    results = []
+    for path, source, target, size, mtime in tasks:
+        temporary = f'{target}.tmp'
+        try:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            _process_file(source=source, target=temporary)
+            os.replace(temporary, target)
+            results.append(
+                FileResult(path, size, mtime, os.path.getsize(target))
+            )
+        except Exception as error:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            results.append(FileResult(path, size, mtime, error=f'{error!r}'))
+    return results
+
+
+def process_dir(
+    operation: str,
+    key: Key,
+    input_dir: str,
+    output_dir: str,
+    patterns: Iterable[str] = ('**/*',),
+    workers: int = 1,
+    output_format: str = 'binary',
+) -> BatchReport:
+    """
+    Cifra, ou decifra, cada arquivo de `input_dir` em `output_dir`, com o mesmo caminho relativo.
+
+    A chave é decodificada uma única vez e enviada a cada processo do pool ao iniciá-lo; os arquivos
+    são distribuídos em lotes de `FILES_PER_TASK`. Os arquivos com erro são registrados no relatório,
+    sem interromper os demais. Os arquivos cuja saída está atualizada (ver `is_up_to_date`) são
+    ignorados; o manifesto é atualizado ao final, inclusive se o processamento for interrompido.
+
+    Arguments:
+        operation (str): A operação, 'cript' ou 'dcript'
+        key (Key): A chave pública, para a cifração, ou a chave privada, para a decifração
+        input_dir (str): O diretório com os arquivos de entrada
+        output_dir (str): O diretório onde os arquivos de saída serão escritos, diferente de `input_dir`
+        patterns (Iterable[str]): Os padrões dos arquivos de entrada (ver `find_files`)
+        workers (int): Quantidade de processos
+        output_format (str): O formato dos criptogramas, 'binary' ou 'decimal' (somente na cifração)
+
+    Returns:
+        BatchReport: O resumo do processamento
+
+    Raises:
+        ValueError: Se `operation` for inválida, ou se `output_dir` for o próprio `input_dir`
+    """
+    if operation not in ('cript', 'dcript'):
+        raise ValueError(f'Operação desconhecida: {operation}')
+    if os.path.realpath(output_dir) == os.path.realpath(input_dir):
+        log.error('O diretório de saída deve ser diferente do de entrada!')
+        raise ValueError(
+            'O diretório de saída deve ser diferente do de entrada!'
+        )
+
+    start = time.perf_counter()
+    os.makedirs(output_dir, exist_ok=True)
+    job = {
+        'operation': operation,
+        'fingerprint': key.fingerprint.hex(),
+        'output_format': output_format,
+    }
+    manifest = load_manifest(output_dir=output_dir, job=job)
+    files: Dict[str, List[int]] = {}
+
+    tasks = []
+    for path in find_files(input_dir, patterns, exclude=output_dir):
+        source = os.path.join(input_dir, path)
+        target = os.path.join(output_dir, path)
+        stat = os.stat(source)
+        if is_up_to_date(manifest.get(path), stat, target):
+            files[path] = manifest[path]
+        else:
+            tasks.append(
+                (path, source, target, stat.st_size, stat.st_mtime_ns)
+            )
+    skipped = len(files)
+    log.info(
+        f'{len(tasks)} arquivos para processar, {skipped} atualizados ignorados'
+    )
+
+    if workers > 1:
+        results = ordered_map(
+            _process_files,
+            tasks,
+            workers=workers,
+            chunk_size=FILES_PER_TASK,
+            initializer=_set_worker_job,
+            initargs=(operation, key, output_format),
+        )
+    else:
+        _set_worker_job(operation, key, output_format)
+        results = (
+            result for task in tasks for result in _process_files([task])
+        )
+
+    failed = []
+    total_bytes = 0
+    try:
+        for result in results:
+            if result.error is None:
+                files[result.path] = [
+                    result.size,
+                    result.mtime,
+                    result.output_size,
+                ]
+                total_bytes += result.size
+            else:
+                log.error(f'Erro ao processar {result.path}: {result.error}')
+                failed.append(result)
+    finally:
+        save_manifest(output_dir=output_dir, job=job, files=files)
+
+    return BatchReport(
+        processed=len(files) - skipped,
+        skipped=skipped,
+        failed=failed,
+        total_bytes=total_bytes,
+        elapsed=time.perf_counter() - start,
+    )
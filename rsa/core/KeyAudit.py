@@ -0,0 +1,109 @@
+import os
+from itertools import combinations
+from math import gcd
+from typing import Dict, List, NamedTuple
+
+from pyasn1.error import PyAsn1Error
+
+from rsa.utils.BatchGCD import CHUNK_SIZE, chunked_batch_gcd
+from rsa.utils.cli.read_files import read_key_file
+from rsa.utils.der.codec import decode_public_key
+from rsa.utils.logging.config import log
+
+
+class SharedFactor(NamedTuple):
+    """
+    Um par de chaves comprometidas por compartilharem um fator primo.
+
+    Attributes:
+        first (str): O arquivo da primeira chave pública
+        second (str): O arquivo da segunda chave pública
+        factor (int): O MDC dos dois módulos (o próprio módulo, se as chaves forem iguais)
+    """
+
+    first: str
+    second: str
+    factor: int
+
+
+def read_moduli(directory: str) -> Dict[int, List[str]]:
+    """
+    Realiza a leitura dos módulos de todas as chaves públicas de um diretório, e dos seus subdiretórios.
+
+    Os arquivos são lidos com `read_key_file`; os arquivos que não são chaves públicas (chaves
+    privadas, criptogramas, etc) são ignorados.
+
+    Arguments:
+        directory (str): O diretório com os arquivos de chaves
+
+    Returns:
+        Dict[int, List[str]]: Os arquivos de cada módulo
+    """
+    moduli: Dict[int, List[str]] = {}
+    ignored = 0
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for filename in sorted(files):
+            path = os.path.join(root, filename)
+            try:
+                pub_key = decode_public_key(
+                    read_key_file(path, key_type='public')
+                )
+            except (PyAsn1Error, ValueError):
+                ignored += 1
+                continue
+            moduli.setdefault(pub_key['n'], []).append(path)
+
+    log.info(f'{ignored} arquivos ignorados por não serem chaves públicas')
+    return moduli
+
+
+def find_shared_factors(
+    moduli: Dict[int, List[str]],
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = 1,
+) -> List[SharedFactor]:
+    """
+    Encontra os pares de chaves que compartilham um fator primo, via batch GCD (ver `rsa.utils.BatchGCD`).
+
+    Arguments:
+        moduli (Dict[int, List[str]]): Os arquivos de cada módulo (ver `read_moduli`)
+        chunk_size (int): Quantidade de módulos por bloco do batch GCD
+        workers (int): Quantidade de processos do batch GCD
+
+    Returns:
+        List[SharedFactor]: Os pares de chaves comprometidas
+
+    Examples:
+        >>> find_shared_factors({15: ['a'], 77: ['b'], 65: ['c']})
+        [SharedFactor(first='a', second='c', factor=5)]
+    """
+    shared = [
+        SharedFactor(first, second, modulus)
+        for modulus, paths in moduli.items()
+        for first, second in combinations(paths, 2)
+    ]
+
+    values = list(moduli)
+    compromised = [
+        modulus
+        for modulus, factor in zip(
+            values,
+            chunked_batch_gcd(values, chunk_size=chunk_size, workers=workers),
+        )
+        if factor > 1
+    ]
+    log.info(
+        f'{len(values)} módulos analisados, {len(compromised)} com fatores compartilhados'
+    )
+
+    # Somente os módulos comprometidos são comparados entre si
+    for first, second in combinations(compromised, 2):
+        factor = gcd(first, second)
+        if factor > 1:
+            shared.extend(
+                SharedFactor(first_path, second_path, factor)
+                for first_path in moduli[first]
+                for second_path in moduli[second]
+            )
+    return shared
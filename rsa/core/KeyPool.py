@@ -0,0 +1,290 @@
+import atexit
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from fcntl import LOCK_EX, LOCK_NB, LOCK_UN, flock
+from multiprocessing import Event, Process
+from typing import Dict, Iterator, Optional, Tuple
+
+from rsa.core.RSA import RSA
+from rsa.utils.GenPrimeNumber import check_public_exp
+from rsa.utils.logging.config import log
+
+
+class KeyPool:
+    """
+    Pool de pares de chaves RSA pré-gerados, mantido em um diretório local.
+
+    Cada par fica em um arquivo do subdiretório `ready`. Os pares são escritos em `tmp` e movidos
+    com `os.rename` para `ready`, e a retirada (`checkout`) também é feita com `os.rename`, de forma
+    que cada par é entregue uma única vez, mesmo com vários processos utilizando o mesmo pool.
+
+    A reposição é feita quando a quantidade de pares fica abaixo de `low_watermark`, gerando pares
+    até atingir `high_watermark`. Somente um processo realiza a reposição por vez (lock em arquivo).
+
+    Attributes:
+        directory (str): O diretório do pool
+        key_size (int): Número de bits de cada um dos primos 'p' e 'q'
+        public_exp (int): O valor para o expoente público
+        low_watermark (int): Quantidade mínima de pares antes de iniciar a reposição
+        high_watermark (int): Quantidade de pares após a reposição
+        workers (int): Quantidade de processos utilizados na reposição
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        key_size: int = 1024,
+        public_exp: int = 65537,
+        low_watermark: int = 8,
+        high_watermark: int = 32,
+        workers: int = 1,
+    ):
+        if not 0 <= low_watermark <= high_watermark:
+            raise ValueError(
+                "O valor de 'low_watermark' deve estar entre 0 e 'high_watermark'."
+            )
+
+        self.directory = directory
+        self.key_size = key_size
+        self.public_exp = check_public_exp(public_exp)
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.workers = workers
+
+        self._ready = os.path.join(directory, 'ready')
+        self._tmp = os.path.join(directory, 'tmp')
+        self._stats = os.path.join(directory, 'stats.json')
+        self._process: Optional[Process] = None
+        self._stop: Optional[Event] = None
+
+        # Os pares contêm chaves privadas: somente o usuário tem acesso
+        os.makedirs(self._ready, mode=0o700, exist_ok=True)
+        os.makedirs(self._tmp, mode=0o700, exist_ok=True)
+
+    @contextmanager
+    def _lock(self, name: str, blocking: bool = True) -> Iterator[bool]:
+        """
+        Lock em arquivo, compartilhado entre os processos que utilizam o pool.
+
+        Arguments:
+            name (str): O nome do lock
+            blocking (bool): Se False, não aguarda o lock ficar disponível
+
+        Returns:
+            Iterator[bool]: True se o lock foi obtido
+        """
+        with open(os.path.join(self.directory, f'{name}.lock'), 'w') as file:
+            try:
+                flock(file, LOCK_EX if blocking else LOCK_EX | LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                flock(file, LOCK_UN)
+
+    def _update_stats(self, **increments: float) -> None:
+        """
+        Incrementa os contadores persistidos em `stats.json`.
+
+        Arguments:
+            **increments (float): Os contadores e seus incrementos
+        """
+        with self._lock('stats'):
+            stats = self._read_stats()
+            for name, value in increments.items():
+                stats[name] = stats.get(name, 0) + value
+            with open(self._stats, 'w') as file:
+                json.dump(stats, file)
+
+    def _read_stats(self) -> Dict[str, float]:
+        """
+        Realiza a leitura dos contadores persistidos em `stats.json`.
+        """
+        try:
+            with open(self._stats) as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def depth(self) -> int:
+        """
+        Retorna a quantidade de pares prontos no pool.
+        """
+        return len(os.listdir(self._ready))
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Retorna os contadores do pool.
+
+        Returns:
+            Dict[str, float]: `depth`, `generated`, `checked_out`, `misses`, `refill_seconds`
+            e `refill_rate` (pares gerados por segundo de reposição)
+        """
+        stats = {
+            'generated': 0,
+            'checked_out': 0,
+            'misses': 0,
+            'refill_seconds': 0.0,
+            **self._read_stats(),
+        }
+        stats['depth'] = self.depth()
+        stats['refill_rate'] = (
+            stats['generated'] / stats['refill_seconds']
+            if stats['refill_seconds']
+            else 0.0
+        )
+        return stats
+
+    def _add(self, private_key: str, public_key: str) -> None:
+        """
+        Adiciona um par de chaves ao pool de forma atômica.
+        """
+        filename = f'{uuid.uuid4().hex}.key'
+        tmp_path = os.path.join(self._tmp, filename)
+        descriptor = os.open(
+            tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600
+        )
+        with os.fdopen(descriptor, 'w') as file:
+            file.write(f'{private_key}\n{public_key}\n')
+        os.rename(tmp_path, os.path.join(self._ready, filename))
+
+    def refill(self, force: bool = False) -> int:
+        """
+        Repõe o pool até `high_watermark`, caso esteja abaixo de `low_watermark` (ou `force`).
+
+        Se outro processo já estiver realizando a reposição, retorna sem gerar chaves.
+
+        Arguments:
+            force (bool): Repõe o pool mesmo acima de `low_watermark`
+
+        Returns:
+            int: A quantidade de pares gerados
+        """
+        with self._lock('refill', blocking=False) as acquired:
+            if not acquired:
+                return 0
+
+            depth = self.depth()
+            if depth >= self.high_watermark or (
+                not force and depth >= self.low_watermark
+            ):
+                return 0
+
+            missing = self.high_watermark - depth
+
+            log.info(f'Repondo o pool com {missing} pares de chaves')
+            begin = time.perf_counter()
+            key_pairs = RSA(key_size=self.key_size).generate_many(
+                count=missing, public_exp=self.public_exp, workers=self.workers
+            )
+            for private_key, public_key in key_pairs:
+                self._add(private_key=private_key, public_key=public_key)
+
+            self._update_stats(
+                generated=missing,
+                refill_seconds=time.perf_counter() - begin,
+            )
+            return missing
+
+    def checkout(self) -> Tuple[str, str]:
+        """
+        Retira um par de chaves do pool. Caso o pool esteja vazio, o par é gerado na hora.
+
+        Returns:
+            Tuple[str, str]: As chaves privada e pública, codificadas em hexadecimal.
+        """
+        for filename in os.listdir(self._ready):
+            claimed = os.path.join(self._tmp, f'{filename}.claimed')
+            try:
+                os.rename(os.path.join(self._ready, filename), claimed)
+            except FileNotFoundError:
+                continue  # Retirado por outro processo
+
+            with open(claimed) as file:
+                private_key, public_key = file.read().split()
+            os.remove(claimed)
+            self._update_stats(checked_out=1)
+            return private_key, public_key
+
+        log.warning('Pool vazio, gerando o par de chaves na hora')
+        self._update_stats(checked_out=1, misses=1)
+        return RSA(key_size=self.key_size).generate_keys(
+            public_exp=self.public_exp
+        )
+
+    def run(self, interval: float = 1.0, stop: Optional[Event] = None) -> None:
+        """
+        Mantém o pool abastecido, verificando a quantidade de pares a cada `interval` segundos.
+
+        Arguments:
+            interval (float): O intervalo entre as verificações, em segundos
+            stop (Optional[Event]): Evento que encerra o laço, se não informado executa indefinidamente
+        """
+        while stop is None or not stop.is_set():
+            self.refill()
+            if stop is None:
+                time.sleep(interval)
+            else:
+                stop.wait(interval)
+
+    def start(self, interval: float = 1.0) -> None:
+        """
+        Inicia o processo em segundo plano que mantém o pool abastecido.
+
+        O processo não é daemon, para que a reposição possa utilizar um pool de `workers` processos
+        (ver `RSA.generate_many`); ele é encerrado por `stop`, ou ao final do programa.
+
+        Arguments:
+            interval (float): O intervalo entre as verificações, em segundos
+        """
+        if self._process is not None and self._process.is_alive():
+            return
+        self._stop = Event()
+        self._process = Process(
+            target=_run_pool,
+            args=(self._config(), interval, self._stop),
+        )
+        self._process.start()
+        atexit.register(self.stop)
+
+    def _config(self) -> Dict[str, object]:
+        """
+        Retorna os parâmetros necessários para recriar o pool em outro processo.
+        """
+        return {
+            'directory': self.directory,
+            'key_size': self.key_size,
+            'public_exp': self.public_exp,
+            'low_watermark': self.low_watermark,
+            'high_watermark': self.high_watermark,
+            'workers': self.workers,
+        }
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Encerra o processo de reposição, aguardando a reposição em andamento terminar.
+
+        Arguments:
+            timeout (Optional[float]): Tempo máximo de espera, em segundos; após o tempo, o processo é terminado
+        """
+        if self._process is None:
+            return
+        atexit.unregister(self.stop)
+        self._stop.set()
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._process = None
+
+
+def _run_pool(config: Dict[str, object], interval: float, stop: Event) -> None:
+    """
+    Função privada executada pelo processo em segundo plano de `KeyPool.start`.
+    """
+    KeyPool(**config).run(interval=interval, stop=stop)
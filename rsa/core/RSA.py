@@ -1,19 +1,72 @@
-from typing import Dict, Tuple
-
-from pyasn1.codec.der.decoder import decode
-from pyasn1.codec.der.encoder import encode
-from pyasn1.error import PyAsn1Error
-
-from rsa.utils.der.DataTypes.PrivateKey import PrivateKey
-from rsa.utils.der.DataTypes.PublicKey import PublicKey
-from rsa.utils.GenPrimeNumber import generate_prime
-from rsa.utils.JBR import JBR
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from rsa.core.RSAKey import (
+    RSAPrivateKey,
+    RSAPublicKey,
+    load_private_key,
+    load_public_key,
+)
+from rsa.utils.blocks import (
+    iter_chunks,
+    iter_text,
+    pack_block,
+    payload_size,
+    unpack_block,
+)
+from rsa.utils.decode_rsa_key import crt_params
+from rsa.utils.der.codec import (
+    CRT_FIELDS,
+    encode_private_key,
+    encode_public_key,
+)
+from rsa.utils.GenPrimeNumber import (
+    check_public_exp,
+    generate_rsa_prime,
+    primality_test,
+)
 from rsa.utils.logging.config import log
+from rsa.utils.metrics import timed
+from rsa.utils.ModArith import inv_mod
+from rsa.utils.parallel import ordered_map
+from rsa.utils.ParallelPrime import search_primes
 
 
 class RSA:
-    def __init__(self, key_size: int = 1024):
+    """
+    Classe utilizada para gerar as chaves do RSA e realizar a cifração e decifração de informações.
+
+    Attributes:
+        key_size (int): Número de bits de cada um dos primos 'p' e 'q'
+        workers (int): Quantidade de processos utilizados na geração dos primos. Com valor maior que 1, 'p' e 'q' são buscados em paralelo
+        primality (str): O teste de primalidade utilizado na geração dos primos, 'miller-rabin' ou 'bpsw'
+        safe_primes (bool): Se True, 'p' e 'q' são primos seguros (ver `generate_safe_prime`)
+    """
+
+    def __init__(
+        self,
+        key_size: int = 1024,
+        workers: int = 1,
+        primality: str = 'miller-rabin',
+        safe_primes: bool = False,
+    ):
         self.key_size = key_size
+        self.workers = workers
+        self.primality = primality
+        self.safe_primes = safe_primes
+
+        if self.workers < 1:
+            raise ValueError("O valor de 'workers' deve ser maior que 0.")
+        primality_test(self.primality)
 
     def __generate_private_exp(self, phi: int, public_exp: int) -> int:
         """
@@ -26,10 +79,52 @@ class RSA:
         Returns:
             O valor do expoente privado
         """
-        jbr = JBR(mod=phi)
-        d = jbr.invMod(num=public_exp)
-        return d
+        return inv_mod(num=public_exp, mod=phi)
+
+    def _generate_primes(self, public_exp: int) -> Tuple[int, int]:
+        """
+        Método privado para gerar os primos 'p' e 'q', distintos e coprimos com o expoente público.
+
+        Com `workers` maior que 1, os primos são buscados de forma especulativa por `workers` processos
+        em paralelo, onde os dois primeiros primos distintos encontrados são utilizados.
+
+        Arguments:
+            public_exp (int): O expoente público
 
+        Returns:
+            Tuple[int, int]: Os primos 'p' e 'q'
+        """
+        if self.workers > 1:
+            p, q = search_primes(
+                nbit=self.key_size,
+                count=2,
+                workers=self.workers,
+                public_exp=public_exp,
+                primality=self.primality,
+                safe=self.safe_primes,
+            )
+        else:
+            p, q = (
+                generate_rsa_prime(
+                    nbit=self.key_size,
+                    public_exp=public_exp,
+                    primality=self.primality,
+                    safe=self.safe_primes,
+                )
+                for _ in range(2)
+            )
+
+        # Somente 'q' é gerado novamente caso seja igual a 'p'
+        while q == p:
+            q = generate_rsa_prime(
+                nbit=self.key_size,
+                public_exp=public_exp,
+                primality=self.primality,
+                safe=self.safe_primes,
+            )
+        return p, q
+
+    @timed('der.encode')
     def der_public_key(self, public_infos: Dict[str, int]) -> str:
         """
         Método estático utilizado para converter as informações da chave pública par o formato DER
@@ -40,15 +135,11 @@ class RSA:
         Returns:
             Um hexadecimal com a chave codificada com DER
         """
-        pub_key = PublicKey()
-
-        pub_key['modulus'] = public_infos['n']
-        pub_key['public_expoent'] = public_infos['e']
-
-        public_key_encode = encode(pub_key)
-
-        return public_key_encode.hex()
+        return encode_public_key(
+            n=public_infos['n'], e=public_infos['e']
+        ).hex()
 
+    @timed('der.encode')
     def der_private_key(self, private_infos: Dict[str, int]) -> str:
         """
         Método estático utilizado para converter as informações da chave privada para o formato DER
@@ -59,18 +150,22 @@ class RSA:
         Returns:
            Um hexadecimal com a chave codificada com DER
         """
-        priv_key = PrivateKey()
-
-        priv_key['modulus'] = private_infos['n']
-        priv_key['private_expoent'] = private_infos['d']
-        priv_key['p'] = private_infos['p']
-        priv_key['q'] = private_infos['q']
-        priv_key['phi'] = private_infos['phi']
-
-        private_key_encode = encode(priv_key)
-
-        return private_key_encode.hex()
-
+        # Valores pré-computados para a decifração via CRT
+        crt = {
+            name: private_infos[name]
+            for name in CRT_FIELDS
+            if name in private_infos
+        }
+        return encode_private_key(
+            n=private_infos['n'],
+            d=private_infos['d'],
+            p=private_infos['p'],
+            q=private_infos['q'],
+            phi=private_infos['phi'],
+            **crt,
+        ).hex()
+
+    @timed('rsa.generate_keys')
     def generate_keys(self, public_exp: int = 65537) -> Tuple[str, str]:
         """
         Método utilizado para gerar as chaves pública e privada do RSA.
@@ -80,16 +175,35 @@ class RSA:
 
         Returns:
             Tuple[str, str]: Os pares de chaves pública e privada, codificadas em hexadecimal.
+
+        Raises:
+            ValueError: Se o expoente público for par, ou menor ou igual a 1
         """
+        check_public_exp(public_exp)
+
+        # Gera números primos, com MDC(e, Phi(n)) = 1
+        p, q = self._generate_primes(public_exp=public_exp)
 
-        # Gera números primos
-        p = generate_prime(nbit=self.key_size)
-        q = generate_prime(nbit=self.key_size)
+        return self.keys_from_primes(p=p, q=q, public_exp=public_exp)
 
+    def keys_from_primes(
+        self, p: int, q: int, public_exp: int = 65537
+    ) -> Tuple[str, str]:
+        """
+        Método utilizado para montar as chaves pública e privada do RSA a partir dos primos 'p' e 'q'.
+
+        Arguments:
+            p (int): O primo 'p', com MDC(public_exp, p - 1) = 1
+            q (int): O primo 'q', distinto de 'p' e com MDC(public_exp, q - 1) = 1
+            public_exp (int): O valor para o expoente público
+
+        Returns:
+            Tuple[str, str]: Os pares de chaves pública e privada, codificadas em hexadecimal.
+        """
         n = p * q  # Calcula o módulo
         phi = (p - 1) * (q - 1)
 
-        e = public_exp  # TODO: Adicionar verificação via MDC;
+        e = public_exp
 
         d = self.__generate_private_exp(
             phi=phi, public_exp=e
@@ -98,65 +212,362 @@ class RSA:
         # Converte chaves para o formato DER
         public_key = self.der_public_key(public_infos={'e': e, 'n': n})
         private_key = self.der_private_key(
-            private_infos={'d': d, 'n': n, 'p': p, 'q': q, 'phi': phi}
+            private_infos={
+                'd': d,
+                'n': n,
+                'p': p,
+                'q': q,
+                'phi': phi,
+                **crt_params(d=d, p=p, q=q),
+            }
         )
 
         # TODO: estudar o retorno de um dict ao invés de tupla
         return private_key, public_key
 
-    def cript(self, public_key: str, msg: str) -> int:
+    def generate_many(
+        self,
+        count: int,
+        public_exp: int = 65537,
+        workers: Optional[int] = None,
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Método utilizado para gerar vários pares de chaves, distribuídos em um pool de processos.
+
+        Os pares são retornados assim que ficam prontos (não necessariamente na ordem de submissão)
+        e no máximo `2 * workers` pares ficam em andamento ao mesmo tempo, de forma que a memória
+        utilizada não cresce com `count`.
+
+        Arguments:
+            count (int): Quantidade de pares de chaves
+            public_exp (int): O valor para o expoente público
+            workers (Optional[int]): Quantidade de processos, por padrão o valor de `self.workers`
+
+        Returns:
+            Iterator[Tuple[str, str]]: Os pares de chaves privada e pública, codificadas em hexadecimal.
+
+        Raises:
+            ValueError: Se o expoente público for par, ou menor ou igual a 1
+        """
+        check_public_exp(public_exp)
+        workers = workers or self.workers
+
+        if workers == 1:
+            for _ in range(count):
+                yield _generate_key_pair(
+                    self.key_size, public_exp, self.primality, self.safe_primes
+                )
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            submitted = 0
+            while submitted < count or pending:
+                # Mantém a quantidade de pares em andamento limitada
+                while submitted < count and len(pending) < 2 * workers:
+                    pending.add(
+                        executor.submit(
+                            _generate_key_pair,
+                            self.key_size,
+                            public_exp,
+                            self.primality,
+                            self.safe_primes,
+                        )
+                    )
+                    submitted += 1
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+    def cript(
+        self, public_key: Union[str, bytes, RSAPublicKey], msg: str
+    ) -> int:
         """
         Método utilizado para realizar a cifração de uma mensagem
 
         Attributes:
-            public_key (str): Uma string hexadecimal com a chave codificada em DER
-            msg (str): A mensagem que se deseja cifrar
+            public_key (Union[str, bytes, RSAPublicKey]): Uma string hexadecimal com a chave codificada em DER, os bytes DER da chave, ou a chave já decodificada (ver `load_public_key`)
+            msg (str): A mensagem que se deseja cifrar, menor que o módulo da chave (para mensagens maiores, ver `encrypt_stream`)
 
         Returns:
             O Criptograma resultante da cifração
-        """
-        # Converte a mensagem para hexadecimal
-        msg_to_hex = msg.encode().hex()
-        _pub_key = bytes.fromhex(public_key)
 
-        try:
-            pub_key, _ = decode(_pub_key, asn1Spec=PublicKey())
-        except PyAsn1Error:
-            log.error('A chave não está no formato DER esperado!')
-            raise PyAsn1Error('A chave não está no formato DER esperado!')
+        Raises:
+            ValueError: Se a mensagem for maior ou igual ao módulo da chave
+        """
+        pub_key = load_public_key(key=public_key)
 
-        public_exp, mod = (
-            int(pub_key['public_expoent']),
-            int(pub_key['modulus']),
+        # Converte a mensagem para inteiro
+        return pub_key.encrypt_int(
+            _check_message(pub_key, int.from_bytes(msg.encode(), 'big'))
         )
 
-        return pow(base=int(msg_to_hex, 16), exp=public_exp, mod=mod)
-
-    def dcript(self, private_key: str, criptogram: int) -> str:
+    def dcript(
+        self, private_key: Union[str, bytes, RSAPrivateKey], criptogram: int
+    ) -> str:
         """
-        Método utilizado para realizar a decifração de um criptograma
+        Método utilizado para realizar a decifração de um criptograma, via Teorema Chinês do Resto.
 
         Attributes:
-            private_key (str): Uma string hexadecimal com a chave codificada em DER
+            private_key (Union[str, bytes, RSAPrivateKey]): Uma string hexadecimal com a chave codificada em DER, os bytes DER da chave (inclusive chaves PKCS#1 do OpenSSL), ou a chave já decodificada (ver `load_private_key`)
             criptogram (int): O Criptograma que se deseja decifrar
 
         Returns:
             O texto plano
         """
-        _priv_key = bytes.fromhex(private_key)
+        priv_key = load_private_key(key=private_key)
 
-        try:
-            priv_key, _ = decode(_priv_key, asn1Spec=PrivateKey())
-        except PyAsn1Error:
-            log.error('A chave não está no formato DER esperado!')
-            raise PyAsn1Error('A chave não está no formato DER esperado!')
+        msg_dcript = priv_key.decrypt_int(criptogram)
 
-        private_exp, mod = (
-            int(priv_key['private_expoent']),
-            int(priv_key['modulus']),
-        )
+        return msg_dcript.to_bytes(
+            (msg_dcript.bit_length() + 7) // 8, 'big'
+        ).decode()
+
+    def encrypt_stream(
+        self, public_key: Union[str, bytes, RSAPublicKey], source: BinaryIO
+    ) -> Iterator[int]:
+        """
+        Método utilizado para realizar a cifração por blocos de um arquivo binário, com memória constante.
+
+        A mensagem é lida em blocos de `tamanho do módulo - 2` bytes e cada bloco é cifrado
+        separadamente (ver `rsa.utils.blocks`).
 
-        msg_dcript = pow(base=criptogram, exp=private_exp, mod=mod)
-        msg_to_hex = hex(msg_dcript)[2:]
+        Attributes:
+            public_key (Union[str, bytes, RSAPublicKey]): A chave pública (ver `cript`)
+            source (BinaryIO): O arquivo com a mensagem, aberto em modo binário
+
+        Returns:
+            Iterator[int]: Os criptogramas de cada bloco, em ordem
+        """
+        pub_key = load_public_key(key=public_key)
+
+        for chunk in iter_chunks(source, payload_size(pub_key.size)):
+            yield pub_key.encrypt_int(pack_block(chunk))
+
+    def decrypt_stream(
+        self,
+        private_key: Union[str, bytes, RSAPrivateKey],
+        criptograms: Iterable[int],
+        encoding: Optional[str] = None,
+        workers: int = 1,
+    ) -> Iterator[Union[bytes, str]]:
+        """
+        Método utilizado para realizar a decifração dos blocos gerados por `encrypt_stream`, com memória constante.
 
-        return bytes.fromhex(msg_to_hex).decode()
+        Com `workers` maior que 1, os blocos são decifrados em lotes por um pool de processos, fora de
+        ordem, e remontados na ordem original, com uma quantidade limitada de lotes em andamento.
+
+        Attributes:
+            private_key (Union[str, bytes, RSAPrivateKey]): A chave privada (ver `dcript`)
+            criptograms (Iterable[int]): Os criptogramas de cada bloco, em ordem
+            encoding (Optional[str]): Se informado, os blocos são decodificados para texto, tratando os caracteres divididos entre blocos
+            workers (int): Quantidade de processos utilizados na decifração
+
+        Returns:
+            Iterator[Union[bytes, str]]: Os blocos da mensagem, em bytes ou texto
+        """
+        priv_key = load_private_key(key=private_key)
+
+        if workers > 1:
+            chunks = ordered_map(
+                _decrypt_blocks,
+                criptograms,
+                workers=workers,
+                initializer=_set_worker_key,
+                initargs=(priv_key,),
+            )
+        else:
+            chunks = (
+                unpack_block(priv_key.decrypt_int(criptogram))
+                for criptogram in criptograms
+            )
+        if encoding is None:
+            yield from chunks
+        else:
+            yield from iter_text(chunks, encoding=encoding)
+
+    def encrypt_batch(
+        self,
+        public_key: Union[str, bytes, RSAPublicKey],
+        messages: Iterable[Union[str, bytes]],
+        workers: int = 1,
+        chunk_size: int = 1024,
+    ) -> Iterator[int]:
+        """
+        Método utilizado para realizar a cifração de muitas mensagens curtas com a mesma chave.
+
+        A chave é decodificada uma única vez e cada mensagem é convertida para inteiro com o marcador
+        de `pack_block`, preservando os zeros à esquerda. Com `workers` maior que 1, as mensagens são
+        cifradas em lotes de `chunk_size` por um pool de processos, e os criptogramas retornados na
+        ordem das mensagens.
+
+        Attributes:
+            public_key (Union[str, bytes, RSAPublicKey]): A chave pública (ver `cript`)
+            messages (Iterable[Union[str, bytes]]): As mensagens, cada uma, com o marcador, menor que o módulo
+            workers (int): Quantidade de processos utilizados na cifração
+            chunk_size (int): Quantidade de mensagens por lote enviado aos processos
+
+        Returns:
+            Iterator[int]: O criptograma de cada mensagem, em ordem
+
+        Raises:
+            ValueError: Se uma mensagem for maior ou igual ao módulo da chave
+        """
+        pub_key = load_public_key(key=public_key)
+
+        if workers > 1:
+            yield from ordered_map(
+                _encrypt_messages,
+                messages,
+                workers=workers,
+                chunk_size=chunk_size,
+                initializer=_set_worker_key,
+                initargs=(pub_key,),
+            )
+            return
+        for msg in messages:
+            yield pub_key.encrypt_int(_message_to_int(pub_key, msg))
+
+    def decrypt_batch(
+        self,
+        private_key: Union[str, bytes, RSAPrivateKey],
+        criptograms: Iterable[int],
+        encoding: Optional[str] = None,
+        workers: int = 1,
+        chunk_size: int = 1024,
+    ) -> Iterator[Union[bytes, str]]:
+        """
+        Método utilizado para realizar a decifração dos criptogramas gerados por `encrypt_batch`.
+
+        Os criptogramas de `cript` não possuem o marcador de `pack_block` e devem ser decifrados
+        por `dcript`.
+
+        Attributes:
+            private_key (Union[str, bytes, RSAPrivateKey]): A chave privada (ver `dcript`)
+            criptograms (Iterable[int]): Os criptogramas, um por mensagem
+            encoding (Optional[str]): Se informado, cada mensagem é decodificada para texto
+            workers (int): Quantidade de processos utilizados na decifração
+            chunk_size (int): Quantidade de criptogramas por lote enviado aos processos
+
+        Returns:
+            Iterator[Union[bytes, str]]: As mensagens, em ordem
+
+        Examples:
+            >>> key = RSAPrivateKey(3233, 2753, 61, 53, 53, 49, 38)
+            >>> list(RSA().decrypt_batch(key, [1476], encoding='utf-8'))
+            ['A']
+        """
+        priv_key = load_private_key(key=private_key)
+
+        if workers > 1:
+            messages = ordered_map(
+                _decrypt_messages,
+                criptograms,
+                workers=workers,
+                chunk_size=chunk_size,
+                initializer=_set_worker_key,
+                initargs=(priv_key,),
+            )
+        else:
+            messages = (
+                _int_to_message(priv_key.decrypt_int(criptogram))
+                for criptogram in criptograms
+            )
+        if encoding is None:
+            yield from messages
+        else:
+            yield from (msg.decode(encoding) for msg in messages)
+
+
+def _generate_key_pair(
+    key_size: int,
+    public_exp: int,
+    primality: str = 'miller-rabin',
+    safe_primes: bool = False,
+) -> Tuple[str, str]:
+    """
+    Função privada utilizada pelos processos de `RSA.generate_many` para gerar um par de chaves.
+
+    Arguments:
+        key_size (int): Número de bits de cada um dos primos 'p' e 'q'
+        public_exp (int): O valor para o expoente público
+        primality (str): O teste de primalidade utilizado na geração dos primos
+        safe_primes (bool): Se True, 'p' e 'q' são primos seguros
+
+    Returns:
+        Tuple[str, str]: As chaves privada e pública, codificadas em hexadecimal.
+    """
+    return RSA(
+        key_size=key_size, primality=primality, safe_primes=safe_primes
+    ).generate_keys(public_exp=public_exp)
+
+
+# Chave utilizada pelos processos do pool, definida uma única vez por processo
+_worker_key: Optional[Union[RSAPublicKey, RSAPrivateKey]] = None
+
+
+def _set_worker_key(key: Union[RSAPublicKey, RSAPrivateKey]) -> None:
+    """
+    Função privada executada ao iniciar cada processo do pool, evitando enviar a chave a cada lote.
+    """
+    global _worker_key
+    _worker_key = key
+
+
+def _decrypt_blocks(criptograms: List[int]) -> List[bytes]:
+    """
+    Função privada utilizada pelos processos de `RSA.decrypt_stream` para decifrar um lote de blocos.
+    """
+    return [
+        unpack_block(_worker_key.decrypt_int(criptogram))
+        for criptogram in criptograms
+    ]
+
+
+def _check_message(key: RSAPublicKey, value: int) -> int:
+    """
+    Função privada que verifica se a mensagem, convertida para inteiro, é menor que o módulo da chave.
+    """
+    if value >= key.n:
+        log.error('A mensagem é maior que o módulo da chave!')
+        raise ValueError('A mensagem é maior que o módulo da chave!')
+    return value
+
+
+def _message_to_int(key: RSAPublicKey, msg: Union[str, bytes]) -> int:
+    """
+    Função privada que converte uma mensagem de `RSA.encrypt_batch` para inteiro, com o marcador
+    de `pack_block`, preservando os zeros à esquerda da mensagem.
+    """
+    return _check_message(
+        key, pack_block(msg.encode() if isinstance(msg, str) else msg)
+    )
+
+
+def _int_to_message(value: int) -> bytes:
+    """
+    Função privada que converte um inteiro decifrado por `RSA.decrypt_batch` para a mensagem,
+    removendo o marcador de `pack_block`.
+    """
+    return unpack_block(value)
+
+
+def _encrypt_messages(messages: List[Union[str, bytes]]) -> List[int]:
+    """
+    Função privada utilizada pelos processos de `RSA.encrypt_batch` para cifrar um lote de mensagens.
+    """
+    return [
+        _worker_key.encrypt_int(_message_to_int(_worker_key, msg))
+        for msg in messages
+    ]
+
+
+def _decrypt_messages(criptograms: List[int]) -> List[bytes]:
+    """
+    Função privada utilizada pelos processos de `RSA.decrypt_batch` para decifrar um lote de criptogramas.
+    """
+    return [
+        _int_to_message(_worker_key.decrypt_int(criptogram))
+        for criptogram in criptograms
+    ]
@@ -0,0 +1,280 @@
+import os
+import socket
+from itertools import count, islice
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from rsa.utils.logging.config import log
+from rsa.utils.protocol import (
+    DEFAULT_SOCKET,
+    SOCKET_DIR,
+    ServerError,
+    encode_frame,
+    recv_frame,
+    secure_socket_dir,
+)
+
+T = TypeVar('T')
+
+# Quantidade máxima de requisições enviadas sem resposta, por `pipeline`
+PIPELINE_WINDOW = 32
+
+# Quantidade de blocos, ou de mensagens, por requisição
+BLOCKS_PER_REQUEST = 256
+
+
+def _batches(items: Iterable[T]) -> Iterator[List[T]]:
+    """
+    Função privada que agrupa os itens em listas de `BLOCKS_PER_REQUEST` itens, como o `batched` de
+    `rsa.utils.parallel`, sem importar o `concurrent.futures` no cliente.
+    """
+    iterator = iter(items)
+    return iter(lambda: list(islice(iterator, BLOCKS_PER_REQUEST)), [])
+
+
+class RSAClient:
+    """
+    Cliente do servidor do `rsa` (ver `rsa.core.RSAServer`), com uma conexão bloqueante.
+
+    As chaves são informadas pelo caminho do arquivo ('key_file'), lido pelo servidor, ou pela
+    chave em hexadecimal ('key').
+
+    Attributes:
+        socket_path (str): O caminho do socket Unix do servidor
+
+    Examples:
+        >>> with RSAClient() as client:  # doctest: +SKIP
+        ...     list(client.encrypt_batch([b'token'], key_file='chave_public_key.pem'))
+        [123...]
+    """
+
+    def __init__(
+        self,
+        socket_path: str = DEFAULT_SOCKET,
+        timeout: Optional[float] = None,
+    ):
+        self.socket_path = socket_path
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        try:
+            # O diretório padrão é verificado, para não conectar a um socket de outro usuário
+            if os.path.dirname(os.path.abspath(socket_path)) == SOCKET_DIR:
+                secure_socket_dir(SOCKET_DIR)
+            self._socket.connect(socket_path)
+        except OSError as error:
+            self._socket.close()
+            log.error(f'Não foi possível conectar ao servidor {socket_path}')
+            raise ConnectionError(
+                f'Não foi possível conectar ao servidor {socket_path}: {error}'
+            )
+        self._file = self._socket.makefile('rb')
+        self._ids = count()
+
+    def close(self) -> None:
+        """
+        Encerra a conexão.
+        """
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self) -> 'RSAClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def pipeline(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        window: int = PIPELINE_WINDOW,
+    ) -> Iterator[Any]:
+        """
+        Envia as requisições sem esperar as respostas, com no máximo `window` requisições sem
+        resposta, e retorna os resultados na ordem das requisições.
+
+        Arguments:
+            requests (Iterable[Dict[str, Any]]): As requisições, com a operação em 'op'
+            window (int): Quantidade máxima de requisições sem resposta
+
+        Returns:
+            Iterator[Any]: O resultado de cada requisição, em ordem
+
+        Raises:
+            ServerError: Se o servidor retornar um erro
+        """
+        requests = iter(requests)
+        in_flight: List[int] = []
+        responses: Dict[int, Dict[str, Any]] = {}
+
+        def send(batch: Iterable[Dict[str, Any]]) -> None:
+            frames = []
+            for request in batch:
+                request_id = next(self._ids)
+                in_flight.append(request_id)
+                frames.append(encode_frame({**request, 'id': request_id}))
+            if frames:
+                self._socket.sendall(b''.join(frames))
+
+        send(islice(requests, window))
+        while in_flight:
+            # As respostas chegam fora de ordem; os resultados são retornados em ordem
+            while in_flight[0] not in responses:
+                response = recv_frame(self._file)
+                responses[response['id']] = response
+            response = responses.pop(in_flight.pop(0))
+            send(islice(requests, 1))
+
+            if 'error' in response:
+                log.error(f'Erro no servidor: {response["error"]}')
+                raise ServerError(response['error'])
+            yield response['result']
+
+    def request(self, op: str, **params: Any) -> Any:
+        """
+        Envia uma requisição e aguarda o resultado.
+
+        Arguments:
+            op (str): A operação
+            params (Any): Os parâmetros da operação
+
+        Returns:
+            Any: O resultado da operação
+
+        Raises:
+            ServerError: Se o servidor retornar um erro
+        """
+        return next(self.pipeline([{'op': op, **params}]))
+
+    def key_info(
+        self, key_type: str = 'public', **key: str
+    ) -> Tuple[bytes, int]:
+        """
+        Retorna o fingerprint e o tamanho, em bytes, da chave.
+
+        Arguments:
+            key_type (str): O tipo de chave ['public', 'private']
+            key (str): 'key_file', o caminho do arquivo da chave, ou 'key', a chave em hexadecimal
+
+        Returns:
+            Tuple[bytes, int]: O fingerprint e o tamanho do módulo
+        """
+        info = self.request('key_info', key_type=key_type, **key)
+        return bytes.fromhex(info['fingerprint']), info['size']
+
+    def encrypt_chunks(
+        self, chunks: Iterable[bytes], **key: str
+    ) -> Iterator[List[int]]:
+        """
+        Cifra os blocos de cada trecho da mensagem (ver `RSA.encrypt_stream`). Para que o resultado
+        seja igual ao da mensagem inteira, o tamanho de cada trecho, exceto o último, deve ser um
+        múltiplo de `payload_size` (ver `rsa.utils.blocks`).
+
+        Arguments:
+            chunks (Iterable[bytes]): Os trechos da mensagem
+            key (str): A chave pública (ver `key_info`)
+
+        Returns:
+            Iterator[List[int]]: Os criptogramas de cada trecho, em ordem
+        """
+        return self.pipeline(
+            {'op': 'encrypt', 'data': chunk.hex(), **key} for chunk in chunks
+        )
+
+    def decrypt_chunks(
+        self, criptograms: Iterable[int], **key: str
+    ) -> Iterator[bytes]:
+        """
+        Decifra os blocos gerados por `encrypt_chunks` (ou `RSA.encrypt_stream`), em requisições de
+        `BLOCKS_PER_REQUEST` blocos.
+
+        Arguments:
+            criptograms (Iterable[int]): Os criptogramas de cada bloco, em ordem
+            key (str): A chave privada (ver `key_info`)
+
+        Returns:
+            Iterator[bytes]: Os trechos da mensagem, em ordem
+        """
+        requests = (
+            {'op': 'decrypt', 'criptograms': batch, **key}
+            for batch in _batches(criptograms)
+        )
+        for data in self.pipeline(requests):
+            yield bytes.fromhex(data)
+
+    def encrypt_batch(
+        self, messages: Iterable[bytes], **key: str
+    ) -> Iterator[int]:
+        """
+        Cifra cada mensagem (ver `RSA.encrypt_batch`), em requisições de `BLOCKS_PER_REQUEST` mensagens.
+
+        Arguments:
+            messages (Iterable[bytes]): As mensagens
+            key (str): A chave pública (ver `key_info`)
+
+        Returns:
+            Iterator[int]: O criptograma de cada mensagem, em ordem
+        """
+        requests = (
+            {
+                'op': 'encrypt_batch',
+                'messages': [m.hex() for m in batch],
+                **key,
+            }
+            for batch in _batches(messages)
+        )
+        for criptograms in self.pipeline(requests):
+            yield from criptograms
+
+    def decrypt_batch(
+        self, criptograms: Iterable[int], **key: str
+    ) -> Iterator[bytes]:
+        """
+        Decifra cada mensagem (ver `RSA.decrypt_batch`), em requisições de `BLOCKS_PER_REQUEST` criptogramas.
+
+        Arguments:
+            criptograms (Iterable[int]): Os criptogramas, um por mensagem
+            key (str): A chave privada (ver `key_info`)
+
+        Returns:
+            Iterator[bytes]: As mensagens, em ordem
+        """
+        requests = (
+            {'op': 'decrypt_batch', 'criptograms': batch, **key}
+            for batch in _batches(criptograms)
+        )
+        for messages in self.pipeline(requests):
+            yield from (bytes.fromhex(msg) for msg in messages)
+
+    def generate_keys(
+        self, count: int = 1, **params: Any
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Gera `count` pares de chaves, em paralelo no pool de processos do servidor.
+
+        Arguments:
+            count (int): Quantidade de pares de chaves
+            params (Any): 'key_size', 'public_exp', 'primality' e 'safe_primes' (ver `RSA`)
+
+        Returns:
+            Iterator[Tuple[str, str]]: As chaves privada e pública de cada par, em hexadecimal
+        """
+        requests = ({'op': 'generate_keys', **params} for _ in range(count))
+        for pair in self.pipeline(requests):
+            yield pair['private_key'], pair['public_key']
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Retorna o p50, o p99, a média e o máximo do tempo de cada operação no servidor.
+
+        Returns:
+            Dict[str, Dict[str, float]]: O resumo de cada operação (ver `Histogram.as_dict`)
+        """
+        return self.request('stats')
@@ -0,0 +1,221 @@
+from functools import lru_cache
+from hashlib import sha256
+from typing import Union
+
+from pyasn1.error import PyAsn1Error
+
+from rsa.utils.decode_rsa_key import decode_crt_private_key
+from rsa.utils.der.codec import decode_public_key
+from rsa.utils.logging.config import log
+from rsa.utils.metrics import incr, timed
+
+# Quantidade máxima de chaves decodificadas mantidas em cache
+KEY_CACHE_SIZE = 128
+
+
+class _FrozenKey:
+    """
+    Base das chaves decodificadas: imutáveis e sem `__dict__`.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} é imutável')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} é imutável')
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, slot) == getattr(other, slot)
+            for slot in self.__slots__
+        )
+
+    def __hash__(self):
+        return hash(self.fingerprint)
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, slot) for slot in self._fields)
+
+    @property
+    def size(self) -> int:
+        """
+        O tamanho do módulo, em bytes.
+        """
+        return (self.n.bit_length() + 7) // 8
+
+    @property
+    def fingerprint(self) -> bytes:
+        """
+        O SHA-256 do módulo, igual para as chaves pública e privada de um mesmo par.
+        """
+        return sha256(self.n.to_bytes(self.size, 'big')).digest()
+
+
+class RSAPublicKey(_FrozenKey):
+    """
+    Chave pública decodificada.
+
+    Attributes:
+        n (int): O módulo
+        e (int): O expoente público
+    """
+
+    __slots__ = ('n', 'e')
+    _fields = __slots__
+
+    def __init__(self, n: int, e: int):
+        object.__setattr__(self, 'n', n)
+        object.__setattr__(self, 'e', e)
+
+    def __repr__(self):
+        return f'RSAPublicKey(bits={self.n.bit_length()}, e={self.e})'
+
+    @timed('rsa.cript')
+    def encrypt_int(self, msg: int) -> int:
+        """
+        Realiza a cifração de um inteiro menor que o módulo.
+
+        Arguments:
+            msg (int): A mensagem, como inteiro
+
+        Returns:
+            O criptograma `msg ^ e mod n`
+
+        Examples:
+            >>> RSAPublicKey(n=3233, e=17).encrypt_int(65)
+            2790
+        """
+        incr('modexp')
+        return pow(msg, self.e, self.n)
+
+
+class RSAPrivateKey(_FrozenKey):
+    """
+    Chave privada decodificada, com os valores pré-computados da decifração via CRT.
+
+    Attributes:
+        n (int): O módulo
+        d (int): O expoente privado
+        p (int): O primeiro primo
+        q (int): O segundo primo
+        dp (int): d mod (p - 1)
+        dq (int): d mod (q - 1)
+        qinv (int): q^-1 mod p
+    """
+
+    __slots__ = ('n', 'd', 'p', 'q', 'dp', 'dq', 'qinv')
+    _fields = __slots__
+
+    def __init__(
+        self, n: int, d: int, p: int, q: int, dp: int, dq: int, qinv: int
+    ):
+        for name, value in zip(self._fields, (n, d, p, q, dp, dq, qinv)):
+            object.__setattr__(self, name, value)
+
+    def __repr__(self):
+        return f'RSAPrivateKey(bits={self.n.bit_length()})'
+
+    @timed('rsa.dcript')
+    def decrypt_int(self, criptogram: int) -> int:
+        """
+        Realiza a exponenciação `criptogram ^ d mod n` via Teorema Chinês do Resto (Garner),
+        com duas exponenciações de metade do tamanho do módulo.
+
+        Arguments:
+            criptogram (int): O Criptograma que se deseja decifrar
+
+        Returns:
+            O valor decifrado
+
+        Examples:
+            >>> RSAPrivateKey(3233, 2753, 61, 53, 53, 49, 38).decrypt_int(2790)
+            65
+        """
+        incr('modexp', 2)
+        m1 = pow(criptogram, self.dp, self.p)
+        m2 = pow(criptogram, self.dq, self.q)
+        h = (self.qinv * (m1 - m2)) % self.p
+        return m2 + h * self.q
+
+
+def _to_bytes(key: Union[str, bytes, bytearray, memoryview]) -> bytes:
+    """
+    Converte a chave em hexadecimal (str), ou em um objeto de bytes (ex.: `bytearray`), para os
+    bytes DER: a forma canônica utilizada como chave do cache.
+    """
+    try:
+        return bytes.fromhex(key) if isinstance(key, str) else bytes(key)
+    except (TypeError, ValueError):
+        log.error('A chave não está no formato DER esperado!')
+        raise PyAsn1Error('A chave não está no formato DER esperado!')
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+@timed('der.decode')
+def _decode_public_key(der: bytes) -> RSAPublicKey:
+    """
+    Função privada, com cache pelos bytes DER, que realiza o decode da chave pública.
+    """
+    try:
+        infos = decode_public_key(der)
+    except (PyAsn1Error, ValueError):
+        log.error('A chave não está no formato DER esperado!')
+        raise PyAsn1Error('A chave não está no formato DER esperado!')
+
+    return RSAPublicKey(**infos)
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+@timed('der.decode')
+def _decode_private_key(der: bytes) -> RSAPrivateKey:
+    """
+    Função privada, com cache pelos bytes DER, que realiza o decode da chave privada.
+    """
+    try:
+        infos = decode_crt_private_key(private_key_bytes=der)
+    except (PyAsn1Error, ValueError):
+        log.error('A chave não está no formato DER esperado!')
+        raise PyAsn1Error('A chave não está no formato DER esperado!')
+
+    return RSAPrivateKey(**infos)
+
+
+def load_public_key(key: Union[str, bytes, RSAPublicKey]) -> RSAPublicKey:
+    """
+    Retorna a chave pública decodificada. As chaves são mantidas em um cache LRU (de
+    `KEY_CACHE_SIZE` chaves) pelos bytes DER, de forma que a mesma chave, em hexadecimal ou em
+    bytes, é decodificada uma única vez.
+
+    Arguments:
+        key (Union[str, bytes, RSAPublicKey]): A chave em hexadecimal, em bytes DER (ou `bytearray`, `memoryview`), ou já decodificada
+
+    Returns:
+        RSAPublicKey: A chave decodificada
+
+    Raises:
+        PyAsn1Error: Se a chave não estiver no formato DER esperado
+    """
+    if isinstance(key, RSAPublicKey):
+        return key
+    return _decode_public_key(_to_bytes(key))
+
+
+def load_private_key(key: Union[str, bytes, RSAPrivateKey]) -> RSAPrivateKey:
+    """
+    Retorna a chave privada decodificada (chaves do projeto, com ou sem CRT, ou PKCS#1 do OpenSSL).
+    As chaves são mantidas em um cache LRU (de `KEY_CACHE_SIZE` chaves) pelos bytes DER.
+
+    Arguments:
+        key (Union[str, bytes, RSAPrivateKey]): A chave em hexadecimal, em bytes DER (ou `bytearray`, `memoryview`), ou já decodificada
+
+    Returns:
+        RSAPrivateKey: A chave decodificada
+
+    Raises:
+        PyAsn1Error: Se a chave não estiver no formato DER esperado
+    """
+    if isinstance(key, RSAPrivateKey):
+        return key
+    return _decode_private_key(_to_bytes(key))
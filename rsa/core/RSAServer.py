@@ -0,0 +1,382 @@
+import asyncio
+import os
+import signal
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from rsa.core.RSA import RSA, _generate_key_pair
+from rsa.core.RSAKey import (
+    RSAPrivateKey,
+    RSAPublicKey,
+    load_private_key,
+    load_public_key,
+)
+from rsa.utils.blocks import unpack_block
+from rsa.utils.cli.read_files import read_key_file
+from rsa.utils.logging.config import log
+from rsa.utils.metrics import Histogram
+from rsa.utils.protocol import (
+    DEFAULT_SOCKET,
+    SOCKET_DIR,
+    ProtocolError,
+    encode_frame,
+    read_frame,
+    remove_socket,
+    secure_socket_dir,
+)
+
+# Quantidade máxima de requisições em andamento, somando todas as conexões
+MAX_CONCURRENCY = 64
+
+# Tempo máximo, em segundos, de espera pelas requisições em andamento no encerramento
+SHUTDOWN_TIMEOUT = 30.0
+
+Key = Union[RSAPublicKey, RSAPrivateKey]
+
+
+def _init_worker() -> None:
+    """
+    Função privada executada ao iniciar cada processo do pool. Os processos herdam os sinais do
+    event loop: o SIGINT (ex.: Ctrl+C no terminal) é ignorado, e o encerramento fica a cargo do
+    servidor.
+    """
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+def _encrypt(key: RSAPublicKey, data: bytes) -> List[int]:
+    """
+    Função privada, executada no pool de processos, que cifra os blocos de `data`.
+    """
+    return list(RSA().encrypt_stream(public_key=key, source=BytesIO(data)))
+
+
+def _decrypt(key: RSAPrivateKey, criptograms: List[int]) -> bytes:
+    """
+    Função privada, executada no pool de processos, que decifra os blocos e os concatena.
+    """
+    return b''.join(
+        unpack_block(key.decrypt_int(criptogram)) for criptogram in criptograms
+    )
+
+
+def _encrypt_batch(key: RSAPublicKey, messages: List[bytes]) -> List[int]:
+    """
+    Função privada, executada no pool de processos, que cifra cada mensagem.
+    """
+    return list(RSA().encrypt_batch(public_key=key, messages=messages))
+
+
+def _decrypt_batch(key: RSAPrivateKey, criptograms: List[int]) -> List[bytes]:
+    """
+    Função privada, executada no pool de processos, que decifra cada mensagem.
+    """
+    return list(RSA().decrypt_batch(private_key=key, criptograms=criptograms))
+
+
+class RSAServer:
+    """
+    Servidor do `rsa` (`rsa serve`): mantém as chaves decodificadas em memória e atende requisições
+    de cifração, decifração e geração de chaves em um socket Unix (ver `rsa.utils.protocol`).
+
+    O event loop somente lê e escreve os frames; as operações são executadas por um pool de
+    `workers` processos. Cada conexão pode enviar várias requisições sem esperar as respostas, e
+    no máximo `max_concurrency` requisições ficam em andamento (as demais aguardam, sem que o
+    servidor leia novos frames). O tempo de cada operação é registrado em um `Histogram`.
+
+    Operações (os bytes em hexadecimal, as chaves por 'key_file' ou 'key', em hexadecimal):
+        key_info: O 'fingerprint' e o tamanho ('size') da chave
+        encrypt: Os criptogramas dos blocos de 'data' (ver `RSA.encrypt_stream`)
+        decrypt: A concatenação dos blocos decifrados dos 'criptograms'
+        encrypt_batch: O criptograma de cada uma das 'messages' (ver `RSA.encrypt_batch`)
+        decrypt_batch: A mensagem de cada um dos 'criptograms'
+        generate_keys: As chaves 'private_key' e 'public_key' (ver `RSA.generate_keys`)
+        stats: O p50, o p99, a média e o máximo do tempo de cada operação
+
+    Os arquivos de chaves são lidos uma única vez, e novamente somente se forem modificados.
+    Os sinais SIGINT e SIGTERM encerram o servidor: novas conexões e requisições são recusadas,
+    e as requisições em andamento são concluídas.
+
+    Attributes:
+        socket_path (str): O caminho do socket Unix, criado com permissão somente para o usuário
+        workers (int): Quantidade de processos do pool
+        max_concurrency (int): Quantidade máxima de requisições em andamento
+        latencies (Dict[str, Histogram]): O tempo de cada operação
+        in_flight (int): Quantidade de requisições em andamento
+    """
+
+    def __init__(
+        self,
+        socket_path: str = DEFAULT_SOCKET,
+        workers: Optional[int] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ):
+        if max_concurrency < 1:
+            raise ValueError(
+                "O valor de 'max_concurrency' deve ser maior que 0."
+            )
+
+        self.socket_path = socket_path
+        self.workers = workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency
+        self.latencies: Dict[str, Histogram] = defaultdict(Histogram)
+        self.in_flight = 0
+
+        self._key_files: Dict[Tuple[str, str], Tuple[int, Key]] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._streams: Dict[asyncio.StreamReader, asyncio.StreamWriter] = {}
+        self._connections: Set[asyncio.Task] = set()
+        self._operations: Dict[str, Callable] = {
+            'key_info': self._key_info,
+            'encrypt': self._encrypt,
+            'decrypt': self._decrypt,
+            'encrypt_batch': self._encrypt_batch,
+            'decrypt_batch': self._decrypt_batch,
+            'generate_keys': self._generate_keys,
+            'stats': self._stats,
+        }
+
+    def _load_key(self, request: Dict[str, Any], key_type: str) -> Key:
+        """
+        Método privado que retorna a chave da requisição, do tipo `key_type` ('public' ou 'private').
+        """
+        load = load_public_key if key_type == 'public' else load_private_key
+        if 'key' in request:
+            return load(str(request['key']))
+
+        path = os.path.abspath(str(request['key_file']))
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._key_files.get((path, key_type))
+        if cached is None or cached[0] != mtime:
+            log.info(f'Carregando a chave {path}')
+            key = load(read_key_file(key_file_path=path, key_type=key_type))
+            cached = self._key_files[(path, key_type)] = (mtime, key)
+        return cached[1]
+
+    async def _run(self, func: Callable, *args) -> Any:
+        """
+        Método privado que executa `func` no pool de processos.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _key_info(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        key_type = request.get('key_type', 'public')
+        if key_type not in ('public', 'private'):
+            raise ValueError(f'Tipo de chave desconhecido: {key_type}')
+        key = self._load_key(request, key_type)
+        return {'fingerprint': key.fingerprint.hex(), 'size': key.size}
+
+    async def _encrypt(self, request: Dict[str, Any]) -> List[int]:
+        key = self._load_key(request, 'public')
+        return await self._run(_encrypt, key, bytes.fromhex(request['data']))
+
+    async def _decrypt(self, request: Dict[str, Any]) -> str:
+        key = self._load_key(request, 'private')
+        data = await self._run(_decrypt, key, list(request['criptograms']))
+        return data.hex()
+
+    async def _encrypt_batch(self, request: Dict[str, Any]) -> List[int]:
+        key = self._load_key(request, 'public')
+        messages = [bytes.fromhex(msg) for msg in request['messages']]
+        return await self._run(_encrypt_batch, key, messages)
+
+    async def _decrypt_batch(self, request: Dict[str, Any]) -> List[str]:
+        key = self._load_key(request, 'private')
+        messages = await self._run(
+            _decrypt_batch, key, list(request['criptograms'])
+        )
+        return [msg.hex() for msg in messages]
+
+    async def _generate_keys(self, request: Dict[str, Any]) -> Dict[str, str]:
+        private_key, public_key = await self._run(
+            _generate_key_pair,
+            int(request.get('key_size', 1024)),
+            int(request.get('public_exp', 65537)),
+            str(request.get('primality', 'miller-rabin')),
+            bool(request.get('safe_primes', False)),
+        )
+        return {'private_key': private_key, 'public_key': public_key}
+
+    async def _stats(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return self.stats()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Retorna o resumo do tempo de cada operação (ver `Histogram.as_dict`).
+
+        Returns:
+            Dict[str, Dict[str, float]]: O resumo de cada operação
+        """
+        return {op: hist.as_dict() for op, hist in self.latencies.items()}
+
+    async def _respond(
+        self,
+        request: Dict[str, Any],
+        writer: asyncio.StreamWriter,
+        lock: asyncio.Lock,
+    ) -> None:
+        """
+        Método privado que executa a requisição e escreve a resposta. Libera a vaga da requisição
+        em `_slots` ao terminar.
+        """
+        begin = time.perf_counter()
+        op = request.get('op')
+        response: Dict[str, Any] = {'id': request.get('id')}
+        try:
+            operation = self._operations.get(str(op))
+            if operation is None:
+                raise ValueError(f'Operação desconhecida: {op}')
+            response['result'] = await operation(request)
+        except Exception as error:
+            log.error(f'Erro na operação {op}: {error!r}')
+            response['error'] = f'{type(error).__name__}: {error}'
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+        if 'error' not in response:
+            self.latencies[str(op)].add(time.perf_counter() - begin)
+        try:
+            frame = encode_frame(response)
+        except ProtocolError as error:
+            frame = encode_frame({'id': response['id'], 'error': str(error)})
+        try:
+            async with lock:
+                writer.write(frame)
+                await writer.drain()
+        except ConnectionError:
+            log.error(
+                f'A conexão foi encerrada antes da resposta da operação {op}'
+            )
+
+    async def _serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Método privado que atende uma conexão: lê as requisições, até o fim da conexão ou o
+        encerramento do servidor, e aguarda as respostas das requisições em andamento.
+        """
+        if self._stopping.is_set():
+            writer.close()
+            return
+
+        self._connections.add(asyncio.current_task())
+        self._streams[reader] = writer
+        lock = asyncio.Lock()
+        pending: Set[asyncio.Task] = set()
+        try:
+            while True:
+                try:
+                    request = await read_frame(reader)
+                except asyncio.IncompleteReadError:
+                    break
+                except ProtocolError as error:
+                    log.error(f'Conexão encerrada: {error}')
+                    break
+
+                await self._slots.acquire()
+                self.in_flight += 1
+                task = asyncio.ensure_future(
+                    self._respond(request, writer, lock)
+                )
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+            if pending:
+                await asyncio.wait(pending)
+        except ConnectionError:
+            pass
+        finally:
+            self._streams.pop(reader, None)
+            self._connections.discard(asyncio.current_task())
+            writer.close()
+
+    async def serve(self, ready: Optional[asyncio.Event] = None) -> None:
+        """
+        Executa o servidor até o recebimento de SIGINT ou SIGTERM (ou a chamada de `stop`).
+
+        Arguments:
+            ready (Optional[asyncio.Event]): Se informado, é marcado quando o socket estiver pronto
+        """
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._stopping = asyncio.Event()
+
+        directory = os.path.dirname(os.path.abspath(self.socket_path))
+        try:
+            if directory == SOCKET_DIR:
+                secure_socket_dir(directory, create=True)
+            remove_socket(self.socket_path)
+        except OSError as error:
+            log.error(
+                f'Não foi possível criar o socket {self.socket_path}: {error}'
+            )
+            raise
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.stop)
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker
+        ) as executor:
+            self._executor = executor
+            # Os processos são criados antes de aceitar conexões: criá-los durante uma requisição
+            # (com 'fork') copia o processo enquanto outras threads podem estar com locks adquiridos
+            await asyncio.wrap_future(executor.submit(int))
+            # O socket já é criado com permissão somente para o usuário, sem um chmod posterior
+            umask = os.umask(0o177)
+            try:
+                server = await asyncio.start_unix_server(
+                    self._serve_connection, path=self.socket_path
+                )
+            finally:
+                os.umask(umask)
+            log.info(
+                f'Servidor aguardando conexões em {self.socket_path} '
+                f'({self.workers} processos)'
+            )
+            if ready is not None:
+                ready.set()
+
+            try:
+                await self._stopping.wait()
+            finally:
+                for sig in (signal.SIGINT, signal.SIGTERM):
+                    loop.remove_signal_handler(sig)
+                await self._shutdown(server)
+
+        for op, summary in sorted(self.stats().items()):
+            log.info(
+                f'{op}: {summary["count"]} requisições, '
+                f'p50 {summary["p50"] * 1000:.3f} ms, '
+                f'p99 {summary["p99"] * 1000:.3f} ms'
+            )
+
+    def stop(self) -> None:
+        """
+        Inicia o encerramento do servidor.
+        """
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def _shutdown(self, server: asyncio.AbstractServer) -> None:
+        """
+        Método privado que recusa novas conexões e requisições e aguarda as requisições em andamento.
+        """
+        log.info('Encerrando o servidor')
+        server.close()
+        # Os frames já recebidos são atendidos; a leitura dos próximos termina com EOF
+        for reader, writer in self._streams.items():
+            writer.transport.pause_reading()
+            reader.feed_eof()
+        if self._connections:
+            await asyncio.wait(self._connections, timeout=SHUTDOWN_TIMEOUT)
+        await server.wait_closed()
+        remove_socket(self.socket_path)
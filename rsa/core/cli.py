@@ -1,22 +1,25 @@
 import os
-from importlib.metadata import version
-from typing import Optional
+from enum import Enum
+from typing import TYPE_CHECKING, List, Optional
 
 from rich.console import Console
-from typer import Argument, Context, Exit, Option, Typer
+from typer import Argument, BadParameter, Context, Exit, Option, Typer
 from typing_extensions import Annotated
 
-from rsa.core.RSA import RSA
-from rsa.utils.cli.read_files import read_file, read_key_file
 from rsa.utils.cli.validate_arguments import (
     validate_criptogram_param,
     validate_message,
+    validate_public_exp,
     validate_public_key,
 )
-from rsa.utils.cli.write_files import write_file, write_key_file
-from rsa.utils.decode_rsa_key import decode_private_key as decoder_priv_key
 from rsa.utils.logging.config import log
 
+if TYPE_CHECKING:
+    from rsa.utils.metrics import Metrics
+
+# Os módulos de cada comando (pyasn1, RSA, batch GCD, benchmarks, etc) são importados somente
+# quando o comando é executado, de forma que `--version` e `--help` não pagam pelas importações.
+
 cli = Typer(
     add_completion=False,
     no_args_is_help=True,
@@ -31,16 +34,35 @@ decode_keys = Typer(
     pretty_exceptions_show_locals=False,
 )
 
+pool = Typer(
+    add_completion=False,
+    no_args_is_help=True,
+    help='Pool de pares de chaves pré-gerados',
+    pretty_exceptions_show_locals=False,
+)
+
 cli.add_typer(decode_keys, name='decode-keys')
+cli.add_typer(pool, name='pool')
 
-__version__ = version('rsa-cli')
 console = Console()
-rsa = RSA()
+err_console = Console(stderr=True)
+
+
+class OutputFormat(str, Enum):
+    binary = 'binary'
+    decimal = 'decimal'
+
+
+class Primality(str, Enum):
+    miller_rabin = 'miller-rabin'
+    bpsw = 'bpsw'
 
 
 def version_callback(value: bool):
     if value:
-        print(f'RSA CLI Version: {__version__}')
+        from importlib.metadata import version
+
+        print(f'RSA CLI Version: {version("rsa-cli")}')
         raise Exit()
 
 
@@ -51,8 +73,109 @@ def common(
         Optional[bool],
         Option('--version', is_eager=True, callback=version_callback),
     ] = None,
+    stats: Annotated[
+        bool,
+        Option(
+            help='Exibe, ao final do comando, os contadores e os tempos das operações'
+        ),
+    ] = False,
+    profile: Annotated[
+        Optional[str],
+        Option(help='Salva o perfil (cProfile) do comando neste arquivo'),
+    ] = None,
+):
+    from rsa.utils.metrics import collect, profiling
+
+    if profile:
+        ctx.with_resource(profiling(profile))
+    if stats:
+        metrics = ctx.with_resource(collect())
+        ctx.call_on_close(lambda: print_stats(metrics))
+
+
+def print_stats(metrics: 'Metrics'):
+    err_console.print('Estatísticas:')
+    for line in metrics.summary():
+        err_console.print(f'  {line}')
+
+
+Server = Annotated[
+    Optional[str],
+    Option(
+        help='O socket de um servidor `rsa serve`; a operação é executada pelo servidor'
+    ),
+]
+
+InputDir = Annotated[
+    Optional[str],
+    Option(
+        help='Processa cada arquivo do diretório, em paralelo por --workers processos, ignorando os arquivos com a saída atualizada'
+    ),
+]
+
+OutputDir = Annotated[
+    Optional[str],
+    Option(
+        help='O diretório onde os arquivos de --input-dir são salvos, com os mesmos caminhos relativos'
+    ),
+]
+
+Glob = Annotated[
+    Optional[List[str]],
+    Option(
+        help="Padrão dos arquivos de --input-dir, pode ser repetido [padrão: '**/*']"
+    ),
+]
+
+
+def process_dir(
+    operation: str,
+    key_file: Optional[str],
+    key: Optional[str],
+    input_dir: str,
+    output_dir: Optional[str],
+    glob: Optional[List[str]],
+    workers: int,
+    output_format: OutputFormat = OutputFormat.binary,
 ):
-    pass
+    """
+    Executa o modo em lote de `cript` e `dcript` (ver `rsa.core.BatchFiles`) e exibe o resumo.
+    """
+    from rsa.core.BatchFiles import process_dir
+    from rsa.core.RSAKey import load_private_key, load_public_key
+    from rsa.utils.cli.read_files import read_key_file
+
+    if not output_dir:
+        raise BadParameter(
+            'É necessário informar o "--output-dir" com o "--input-dir"'
+        )
+
+    key_type = 'public' if operation == 'cript' else 'private'
+    load = load_public_key if key_type == 'public' else load_private_key
+    report = process_dir(
+        operation=operation,
+        key=load(
+            read_key_file(key_file_path=key_file, key_type=key_type)
+            if key_file
+            else str(key)
+        ),
+        input_dir=input_dir,
+        output_dir=output_dir,
+        patterns=glob or ['**/*'],
+        workers=workers,
+        output_format=output_format.value,
+    )
+
+    console.print(
+        f'{report.processed} arquivos processados, {report.skipped} atualizados ignorados, '
+        f'{len(report.failed)} com erro'
+    )
+    console.print(
+        f'{report.total_bytes / 1e6:.2f} MB em {report.elapsed:.2f} s '
+        f'({report.throughput / 1e6:.2f} MB/s, {report.files_per_second:.1f} arquivos/s)'
+    )
+    if report.failed:
+        raise Exit(code=1)
 
 
 @cli.command(help='Cria chaves pública e privada para o RSA')
@@ -62,7 +185,11 @@ def generate_keys(
         Option(help='O prefixo para a criação dos arquivos de chaves.'),
     ],
     public_exp: Annotated[
-        int, Option(help='O expoente público para a criação das chaves')
+        int,
+        Option(
+            callback=validate_public_exp,
+            help='O expoente público para a criação das chaves, ímpar e maior que 1',
+        ),
     ] = 65537,
     output_type: Annotated[
         Optional[str],
@@ -72,35 +199,95 @@ def generate_keys(
         str,
         Option(help='O path onde as chaves serão salvas'),
     ] = os.path.expanduser('~'),
+    key_size: Annotated[
+        int,
+        Option(min=8, help='O número de bits de cada um dos primos p e q'),
+    ] = 1024,
+    workers: Annotated[
+        int,
+        Option(
+            min=1,
+            help='Quantidade de processos utilizados na geração das chaves',
+        ),
+    ] = 1,
+    count: Annotated[
+        int,
+        Option(
+            min=1,
+            help='Quantidade de pares de chaves. Com valor maior que 1, os arquivos recebem o sufixo "_<índice>" no prefixo',
+        ),
+    ] = 1,
+    primality: Annotated[
+        Primality,
+        Option(help='O teste de primalidade utilizado na geração dos primos'),
+    ] = Primality.miller_rabin,
+    safe_primes: Annotated[
+        bool,
+        Option(help='Gera "p" e "q" como primos seguros ((p - 1) / 2 primo)'),
+    ] = False,
+    server: Server = None,
 ):
-    from base64 import b64encode
+    from rsa.utils.cli.write_files import write_key_pair
 
     log.info('Gerando Chaves RSA')
-    private_key, public_key = rsa.generate_keys(public_exp=public_exp)
-
-    # Se o tipo de output for `pem`, realiza o encode em base64
-    if output_type == 'pem':
-        private_key = b64encode(bytes(private_key, 'utf-8')).decode('utf-8')
-        public_key = b64encode(bytes(public_key, 'utf-8')).decode('utf-8')
-
     keys_path = os.path.join(output_path, 'cript')
 
-    # Define a extensão que será utilizada para o arquivo da chave
-    extension = 'pem' if output_type == 'pem' else 'txt'
-
-    # Dicionário com relação arquivo: conteúdo
-    keys_files = {
-        f'{file_prefix}_private_key.{extension}': str(private_key),
-        f'{file_prefix}_public_key.{extension}': str(public_key),
-    }
-
-    # Realiza a escrita das chaves
-    for file, content in keys_files.items():
-        write_key_file(
+    if server:
+        from rsa.core.RSAClient import RSAClient
+
+        with RSAClient(server) as client:
+            key_pairs = client.generate_keys(
+                count=count,
+                key_size=key_size,
+                public_exp=public_exp,
+                primality=primality.value,
+                safe_primes=safe_primes,
+            )
+            for index, (private_key, public_key) in enumerate(key_pairs):
+                write_key_pair(
+                    key_file_path=keys_path,
+                    file_prefix=(
+                        f'{file_prefix}_{index}'
+                        if count > 1
+                        else str(file_prefix)
+                    ),
+                    private_key=private_key,
+                    public_key=public_key,
+                    output_type=str(output_type),
+                )
+        return
+
+    from rsa.core.RSA import RSA
+
+    if count == 1:
+        private_key, public_key = RSA(
+            key_size=key_size,
+            workers=workers,
+            primality=primality.value,
+            safe_primes=safe_primes,
+        ).generate_keys(public_exp=public_exp)
+        write_key_pair(
             key_file_path=keys_path,
-            key_filename=file,
-            content=content,
-            key_type='private' if 'private' in file else 'public',
+            file_prefix=str(file_prefix),
+            private_key=private_key,
+            public_key=public_key,
+            output_type=str(output_type),
+        )
+        return
+
+    # Cada par é escrito assim que fica pronto, sem manter os pares em memória
+    key_pairs = RSA(
+        key_size=key_size,
+        primality=primality.value,
+        safe_primes=safe_primes,
+    ).generate_many(count=count, public_exp=public_exp, workers=workers)
+    for index, (private_key, public_key) in enumerate(key_pairs):
+        write_key_pair(
+            key_file_path=keys_path,
+            file_prefix=f'{file_prefix}_{index}',
+            private_key=private_key,
+            public_key=public_key,
+            output_type=str(output_type),
         )
 
 
@@ -110,6 +297,9 @@ def private(
         Optional[str], Option(help='O arquivo com a chave privada OpenSSL')
     ],
 ):
+    from rsa.utils.cli.read_files import read_key_file
+    from rsa.utils.decode_rsa_key import decode_private_key as decoder_priv_key
+
     log.info('... Decodificando Chave Privada ...')
 
     priv_key_bytes = read_key_file(
@@ -122,16 +312,119 @@ def private(
         console.print(f'{k} = {v}')
 
 
+PoolDir = Annotated[str, Option(help='O diretório do pool de chaves')]
+
+
+@pool.command(help='Retira um par de chaves do pool')
+def take(
+    pool_dir: PoolDir,
+    file_prefix: Annotated[
+        Optional[str],
+        Option(help='O prefixo para a criação dos arquivos de chaves.'),
+    ],
+    output_type: Annotated[
+        Optional[str],
+        Option(help='O formato de saída das chaves ["hex", "pem"]'),
+    ] = 'hex',
+    output_path: Annotated[
+        str,
+        Option(help='O path onde as chaves serão salvas'),
+    ] = os.path.expanduser('~'),
+    key_size: Annotated[
+        int,
+        Option(
+            min=8,
+            help='O número de bits de cada primo, caso o pool esteja vazio',
+        ),
+    ] = 1024,
+):
+    from rsa.core.KeyPool import KeyPool
+    from rsa.utils.cli.write_files import write_key_pair
+
+    private_key, public_key = KeyPool(
+        directory=pool_dir, key_size=key_size
+    ).checkout()
+    write_key_pair(
+        key_file_path=os.path.join(output_path, 'cript'),
+        file_prefix=str(file_prefix),
+        private_key=private_key,
+        public_key=public_key,
+        output_type=str(output_type),
+    )
+
+
+@pool.command(help='Mantém o pool abastecido entre as marcas mínima e máxima')
+def run(
+    pool_dir: PoolDir,
+    key_size: Annotated[
+        int,
+        Option(min=8, help='O número de bits de cada um dos primos p e q'),
+    ] = 1024,
+    public_exp: Annotated[
+        int,
+        Option(
+            callback=validate_public_exp,
+            help='O expoente público para a criação das chaves, ímpar e maior que 1',
+        ),
+    ] = 65537,
+    low_watermark: Annotated[
+        int,
+        Option(min=0, help='Quantidade de pares que dispara a reposição'),
+    ] = 8,
+    high_watermark: Annotated[
+        int,
+        Option(min=1, help='Quantidade de pares após a reposição'),
+    ] = 32,
+    workers: Annotated[
+        int,
+        Option(min=1, help='Quantidade de processos utilizados na reposição'),
+    ] = 1,
+    interval: Annotated[
+        float,
+        Option(help='Intervalo, em segundos, entre as verificações do pool'),
+    ] = 1.0,
+    once: Annotated[
+        bool,
+        Option(help='Realiza somente uma reposição, até a marca máxima'),
+    ] = False,
+):
+    from rsa.core.KeyPool import KeyPool
+
+    key_pool = KeyPool(
+        directory=pool_dir,
+        key_size=key_size,
+        public_exp=public_exp,
+        low_watermark=low_watermark,
+        high_watermark=high_watermark,
+        workers=workers,
+    )
+    if once:
+        key_pool.refill(force=True)
+        return
+    key_pool.run(interval=interval)
+
+
+@pool.command(help='Exibe a quantidade de pares e os contadores do pool')
+def status(pool_dir: PoolDir):
+    from rsa.core.KeyPool import KeyPool
+
+    for k, v in KeyPool(directory=pool_dir).stats().items():
+        console.print(f'{k} = {v}')
+
+
 @cli.command(help='Realiza cifração da mensagem')
 def cript(
     output_filename: Annotated[
         Optional[str],
-        Option(help='O arquivo onde o criptograma será salvo'),
-    ],
+        Option(
+            help="O arquivo onde o criptograma será salvo, ou '-' para a saída padrão (o padrão)"
+        ),
+    ] = None,
     message: Annotated[
         Optional[str],
         Argument(
-            help='A mensagem que se deseja cifrar', callback=validate_message
+            help="A mensagem que se deseja cifrar, ou '-' para a entrada padrão",
+            callback=validate_message,
         ),
     ] = None,
     public_key: Annotated[
@@ -144,7 +437,7 @@ def cript(
     message_file: Annotated[
         Optional[str],
         Option(
-            help='O caminho absoluto do arquivo com a mensagem que se deseja cifrar'
+            help="O caminho absoluto do arquivo com a mensagem que se deseja cifrar, ou '-' para a entrada padrão"
         ),
     ] = None,
     key_file: Annotated[
@@ -155,39 +448,147 @@ def cript(
         str,
         Option(help='O path onde o criptograma será salvo'),
     ] = os.path.expanduser('~'),
+    output_format: Annotated[
+        OutputFormat,
+        Option(
+            help='O formato do criptograma: binário, ou um inteiro decimal por linha'
+        ),
+    ] = OutputFormat.binary,
+    lines: Annotated[
+        bool,
+        Option(
+            help='Cifra cada linha como uma mensagem, escrevendo um criptograma decimal por linha'
+        ),
+    ] = False,
+    workers: Annotated[
+        int,
+        Option(
+            min=1,
+            help='Quantidade de processos utilizados na cifração das linhas, ou dos arquivos de --input-dir',
+        ),
+    ] = 1,
+    server: Server = None,
+    input_dir: InputDir = None,
+    output_dir: OutputDir = None,
+    glob: Glob = None,
 ):
+    from contextlib import ExitStack
+    from io import BytesIO
+
+    from rsa.utils.cli.read_files import STDIO, open_file, read_lines
+    from rsa.utils.cli.write_files import write_container_file, write_stream
+
     log.info('...Cifrando mensagem...')
 
-    pub_key = (
-        read_key_file(key_file_path=str(key_file), key_type='public').decode()
-        if key_file
-        else str(public_key)
-    )
+    if input_dir:
+        return process_dir(
+            operation='cript',
+            key_file=key_file,
+            key=public_key,
+            input_dir=input_dir,
+            output_dir=output_dir,
+            glob=glob,
+            workers=workers,
+            output_format=output_format,
+        )
+
+    if message == STDIO:
+        message_file = STDIO
+    output_filename = output_filename or STDIO
 
     absolute_path = os.path.join(
         output_path, 'cript', 'files'
     )  # Concatenação dos paths $output_path/cript/files
 
-    _message = (
-        read_file(file_path=message_file) if message_file else str(message)
-    )
-    cif = rsa.cript(public_key=pub_key, msg=str(_message))
-
-    write_file(
-        path=absolute_path, filename=str(output_filename), content=str(cif)
-    )  # Escreve a cifra no arquivo
+    with ExitStack() as stack:
+        if lines:
+            messages = (
+                read_lines(file_path=message_file)
+                if message_file
+                else (msg.encode() for msg in str(message).splitlines())
+            )
+        else:
+            # A mensagem é cifrada por blocos
+            source = stack.enter_context(
+                open_file(file_path=message_file)
+                if message_file
+                else BytesIO(str(message).encode())
+            )
+
+        if server:
+            from itertools import chain
+
+            from rsa.core.RSAClient import BLOCKS_PER_REQUEST, RSAClient
+            from rsa.utils.blocks import iter_chunks, payload_size
+
+            # A chave é lida e decodificada pelo servidor
+            client = stack.enter_context(RSAClient(server))
+            key = (
+                {'key_file': os.path.abspath(key_file)}
+                if key_file
+                else {'key': str(public_key)}
+            )
+            fingerprint, block_size = client.key_info(**key)
+            if lines:
+                criptograms = client.encrypt_batch(messages, **key)
+            else:
+                criptograms = chain.from_iterable(
+                    client.encrypt_chunks(
+                        iter_chunks(
+                            source,
+                            payload_size(block_size) * BLOCKS_PER_REQUEST,
+                        ),
+                        **key,
+                    )
+                )
+        else:
+            from rsa.core.RSA import RSA
+            from rsa.core.RSAKey import load_public_key
+            from rsa.utils.cli.read_files import read_key_file
+
+            pub_key = load_public_key(
+                read_key_file(key_file_path=str(key_file), key_type='public')
+                if key_file
+                else str(public_key)
+            )
+            fingerprint, block_size = pub_key.fingerprint, pub_key.size
+            if lines:
+                criptograms = RSA().encrypt_batch(
+                    public_key=pub_key, messages=messages, workers=workers
+                )
+            else:
+                criptograms = RSA().encrypt_stream(
+                    public_key=pub_key, source=source
+                )
+
+        if output_format == OutputFormat.binary and not lines:
+            write_container_file(
+                path=absolute_path,
+                filename=str(output_filename),
+                fingerprint=fingerprint,
+                block_size=block_size,
+                criptograms=criptograms,
+            )
+        else:
+            write_stream(
+                path=absolute_path,
+                filename=str(output_filename),
+                chunks=(f'{cif}\n'.encode() for cif in criptograms),
+            )  # Um inteiro decimal por linha: um por bloco, ou um por mensagem com `--lines`
 
 
 @cli.command(help='Realiza a decifração de um criptograma')
 def dcript(
     output_filename: Annotated[
         Optional[str],
-        Option(help='O arquivo onde a mensagem será salva'),
-    ],
+        Option(
+            help="O arquivo onde a mensagem será salva, ou '-' para a saída padrão (o padrão)"
+        ),
+    ] = None,
     criptogram: Annotated[
         Optional[str],
         Argument(
-            help='O Criptograma que se deseja decifrar',
+            help="O Criptograma que se deseja decifrar, ou '-' para a entrada padrão",
             callback=validate_criptogram_param,
         ),
     ] = None,
@@ -197,7 +598,7 @@ def dcript(
     criptogram_file: Annotated[
         Optional[str],
         Option(
-            help='O caminho absoluto do arquivo com o criptograma que se deseja decifrar'
+            help="O caminho absoluto do arquivo com o criptograma que se deseja decifrar, ou '-' para a entrada padrão"
         ),
     ] = None,
     key_file: Annotated[
@@ -208,28 +609,280 @@ def dcript(
         str,
         Option(help='O path onde a mensagem será salva'),
     ] = os.path.expanduser('~'),
+    workers: Annotated[
+        int,
+        Option(
+            min=1,
+            help='Quantidade de processos utilizados na decifração dos blocos, ou dos arquivos de --input-dir',
+        ),
+    ] = 1,
+    lines: Annotated[
+        bool,
+        Option(
+            help='Decifra cada criptograma como uma mensagem, escrevendo uma mensagem por linha'
+        ),
+    ] = False,
+    server: Server = None,
+    input_dir: InputDir = None,
+    output_dir: OutputDir = None,
+    glob: Glob = None,
 ):
+    from contextlib import ExitStack
+
+    from rsa.utils.cli.read_files import STDIO, read_criptograms
+    from rsa.utils.cli.write_files import write_stream
+
     log.info('...Decifrando Criptograma...')
 
-    priv_key = (
-        read_key_file(
-            key_file_path=str(key_file),
-            key_type='private',
-        ).decode()
-        if key_file
-        else str(private_key)
-    )
+    if input_dir:
+        return process_dir(
+            operation='dcript',
+            key_file=key_file,
+            key=private_key,
+            input_dir=input_dir,
+            output_dir=output_dir,
+            glob=glob,
+            workers=workers,
+        )
+
+    if criptogram == STDIO:
+        criptogram_file = STDIO
+    output_filename = output_filename or STDIO
 
     absolute_path = os.path.join(output_path, 'cript', 'files')
 
-    _criptogram = (
-        read_file(file_path=criptogram_file)
-        if criptogram_file
-        else str(criptogram)
+    # A conexão com o servidor é encerrada inclusive se a leitura da chave ou dos criptogramas falhar
+    with ExitStack() as stack:
+        if server:
+            from rsa.core.RSAClient import RSAClient
+
+            # A chave é lida e decodificada pelo servidor
+            client = stack.enter_context(RSAClient(server))
+            key = (
+                {'key_file': os.path.abspath(key_file)}
+                if key_file
+                else {'key': str(private_key)}
+            )
+            fingerprint, _ = client.key_info(key_type='private', **key)
+        else:
+            from rsa.core.RSA import RSA
+            from rsa.core.RSAKey import load_private_key
+            from rsa.utils.cli.read_files import read_key_file
+
+            priv_key = load_private_key(
+                read_key_file(
+                    key_file_path=str(key_file),
+                    key_type='private',
+                )
+                if key_file
+                else str(private_key)
+            )
+            fingerprint = priv_key.fingerprint
+
+        criptograms = (
+            read_criptograms(
+                file_path=criptogram_file, fingerprint=fingerprint
+            )
+            if criptogram_file
+            else (int(value) for value in str(criptogram).split())
+        )
+
+        if server:
+            if lines:
+                chunks = (
+                    msg + b'\n'
+                    for msg in client.decrypt_batch(criptograms, **key)
+                )
+            else:
+                chunks = client.decrypt_chunks(criptograms, **key)
+        elif lines:
+            chunks = (
+                msg + b'\n'
+                for msg in RSA().decrypt_batch(
+                    private_key=priv_key,
+                    criptograms=criptograms,
+                    workers=workers,
+                )
+            )
+        else:
+            chunks = RSA().decrypt_stream(
+                private_key=priv_key, criptograms=criptograms, workers=workers
+            )
+
+        write_stream(
+            path=absolute_path,
+            filename=str(output_filename),
+            chunks=chunks,
+        )
+
+
+@cli.command(
+    help='Executa o servidor do RSA, que mantém as chaves carregadas e atende as requisições em um socket Unix'
+)
+def serve(
+    socket: Annotated[
+        Optional[str],
+        Option(
+            help='O caminho do socket Unix [padrão: $XDG_RUNTIME_DIR/rsa/rsa.sock, ou <diretório temporário>/rsa-<uid>/rsa.sock]'
+        ),
+    ] = None,
+    workers: Annotated[
+        Optional[int],
+        Option(
+            min=1,
+            help='Quantidade de processos que executam as operações [padrão: quantidade de CPUs]',
+        ),
+    ] = None,
+    max_concurrency: Annotated[
+        Optional[int],
+        Option(
+            min=1,
+            help='Quantidade máxima de requisições em andamento [padrão: 64]',
+        ),
+    ] = None,
+):
+    import asyncio
+
+    from rsa.core.RSAServer import MAX_CONCURRENCY, RSAServer
+    from rsa.utils.protocol import DEFAULT_SOCKET
+
+    server = RSAServer(
+        socket_path=socket or DEFAULT_SOCKET,
+        workers=workers,
+        max_concurrency=max_concurrency or MAX_CONCURRENCY,
     )
+    asyncio.run(server.serve())
 
-    dcif = rsa.dcript(private_key=priv_key, criptogram=int(_criptogram))
 
-    write_file(
-        path=absolute_path, filename=str(output_filename), content=str(dcif)
+@cli.command(
+    help='Procura chaves públicas que compartilham fatores primos (batch GCD)'
+)
+def audit_keys(
+    key_dir: Annotated[
+        str,
+        Option(help='O diretório com as chaves públicas que serão analisadas'),
+    ],
+    chunk_size: Annotated[
+        Optional[int],
+        Option(
+            min=1,
+            help='Quantidade de módulos por bloco do batch GCD [padrão: 1024]',
+        ),
+    ] = None,
+    workers: Annotated[
+        int,
+        Option(min=1, help='Quantidade de processos utilizados na análise'),
+    ] = 1,
+):
+    from rsa.core.KeyAudit import find_shared_factors, read_moduli
+    from rsa.utils.BatchGCD import CHUNK_SIZE
+
+    log.info('...Analisando chaves...')
+
+    moduli = read_moduli(directory=key_dir)
+    shared = find_shared_factors(
+        moduli=moduli, chunk_size=chunk_size or CHUNK_SIZE, workers=workers
     )
+
+    # O relatório não é quebrado em linhas, para ser lido por outros programas
+    console.print(f'{len(moduli)} módulos analisados', soft_wrap=True)
+    for pair in shared:
+        console.print(
+            f'{pair.first} <-> {pair.second}: fator {pair.factor:#x}',
+            soft_wrap=True,
+        )
+    if shared:
+        console.print(
+            f'{len(shared)} pares de chaves comprometidos!', soft_wrap=True
+        )
+        raise Exit(code=1)
+
+
+@cli.command(help='Executa os benchmarks de desempenho do projeto')
+def bench(
+    only: Annotated[
+        Optional[List[str]],
+        Option(help='Padrão (glob) dos benchmarks executados, ex.: "prime.*"'),
+    ] = None,
+    repeat: Annotated[
+        int, Option(min=1, help='Quantidade de execuções medidas')
+    ] = 10,
+    warmup: Annotated[
+        int, Option(min=0, help='Quantidade de execuções de aquecimento')
+    ] = 1,
+    seed: Annotated[
+        int, Option(help='A semente do gerador pseudoaleatório')
+    ] = 0,
+    output: Annotated[
+        Optional[str],
+        Option(help='O arquivo JSON onde o relatório será salvo'),
+    ] = None,
+    baseline: Annotated[
+        Optional[str],
+        Option(help='O relatório JSON de referência para a comparação'),
+    ] = None,
+    threshold: Annotated[
+        Optional[float],
+        Option(
+            min=0,
+            help='A piora tolerada em relação ao baseline (0.1 = 10%) [padrão: 0.1]',
+        ),
+    ] = None,
+    list_only: Annotated[
+        bool, Option('--list', help='Somente lista os benchmarks')
+    ] = False,
+):
+    from rsa.bench.suite import (
+        THRESHOLD,
+        benchmarks,
+        compare,
+        load_report,
+        make_report,
+        run_suite,
+        save_report,
+        select,
+    )
+
+    if list_only:
+        for benchmark in select(benchmarks(seed=seed), only):
+            console.print(benchmark.name)
+        return
+
+    results = []
+    for result in run_suite(
+        patterns=only, repeat=repeat, warmup=warmup, seed=seed
+    ):
+        memory = (
+            f'{result.peak_memory / 1024:.1f} KiB'
+            if result.peak_memory is not None
+            else '-'
+        )
+        throughput = (
+            f' vazão={result.throughput / 1024:.1f} KiB/s'
+            if result.throughput is not None
+            else ''
+        )
+        console.print(
+            f'{result.name:<34} mediana={result.median * 1000:.3f} ms '
+            f'p95={result.p95 * 1000:.3f} ms memória={memory}{throughput}'
+        )
+        results.append(result)
+
+    report = make_report(results, repeat=repeat, warmup=warmup, seed=seed)
+    if output:
+        save_report(report, output)
+
+    if baseline:
+        regressions = compare(
+            report,
+            load_report(baseline),
+            threshold=THRESHOLD if threshold is None else threshold,
+        )
+        for regression in regressions:
+            console.print(
+                f'{regression.name}: {regression.metric} '
+                f'{regression.baseline:.6g} -> {regression.current:.6g}'
+            )
+        if regressions:
+            console.print(f'{len(regressions)} regressões encontradas!')
+            raise Exit(code=1)
@@ -0,0 +1,135 @@
+from math import isqrt
+from typing import Tuple
+
+from rsa.utils.metrics import incr, timed
+from rsa.utils.MillerRabin import MillerRabin
+
+
+def jacobi(a: int, n: int) -> int:
+    """
+    Calcula o símbolo de Jacobi (a/n), para 'n' ímpar e positivo.
+
+    Arguments:
+        a (int): O numerador
+        n (int): O denominador, ímpar e positivo
+
+    Returns:
+        int: -1, 0 ou 1
+
+    Examples:
+        >>> jacobi(5, 7)
+        -1
+
+        >>> jacobi(5, 15)
+        0
+    """
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+class BPSW(MillerRabin):
+    """
+    Classe utilizada para realizar o teste de Baillie-PSW: uma rodada do teste de Miller Rabin com
+    base 2, seguida do teste forte de Lucas (parâmetros de Selfridge).
+
+    Não existe nenhum pseudoprimo conhecido para o teste, que custa o equivalente a aproximadamente
+    três exponenciações modulares, independentemente do número de bits.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+    def _lucas_parameters(self, num: int) -> Tuple[int, int, int]:
+        """
+        Escolhe o primeiro 'D' da sequência 5, -7, 9, -11, ... com (D/num) = -1 (método de Selfridge).
+
+        Attributes:
+            num (int): O número que será verificado, ímpar e que não é um quadrado perfeito
+
+        Returns:
+            Tuple[int, int, int]: 'D', 'P' = 1 e 'Q' = (1 - D) / 4, ou D = 0 se 'num' tiver um fator em comum com 'D'
+
+        Examples:
+            >>> BPSW()._lucas_parameters(19)
+            (-7, 1, 2)
+        """
+        d = 5
+        while True:
+            symbol = jacobi(d, num)
+            if symbol == -1:
+                return d, 1, (1 - d) // 4
+            if symbol == 0 and abs(d) != num:
+                return 0, 0, 0
+            d = -d - 2 if d > 0 else -d + 2
+
+    def _is_strong_lucas_prp(self, num: int) -> bool:
+        """
+        Realiza o teste forte de Lucas, com a sequência de Lucas calculada pelos bits de 'num + 1'.
+
+        Attributes:
+            num (int): O número que será verificado, ímpar e maior que 3
+
+        Returns:
+            bool: True se 'num' for um provável primo forte de Lucas
+
+        Examples:
+            >>> BPSW()._is_strong_lucas_prp(2047)  # Pseudoprimo forte para a base 2
+            False
+
+            >>> BPSW()._is_strong_lucas_prp(2053)
+            True
+        """
+        if isqrt(num) ** 2 == num:
+            return False
+
+        d, p, q = self._lucas_parameters(num)
+        if d == 0:
+            return False
+
+        # num + 1 = k * 2^s, com 'k' ímpar
+        k = num + 1
+        s = (k & -k).bit_length() - 1
+        k >>= s
+
+        u, v, qk = 1, p, q % num
+        for bit in bin(k)[3:]:
+            u, v = u * v % num, (v * v - 2 * qk) % num
+            qk = qk * qk % num
+            if bit == '1':
+                u, v = p * u + v, d * u + p * v
+                # Divisão por 2 módulo 'num' (ímpar)
+                u = (u + num if u & 1 else u) // 2 % num
+                v = (v + num if v & 1 else v) // 2 % num
+                qk = qk * q % num
+
+        if u == 0 or v == 0:
+            return True
+        for _ in range(s - 1):
+            v = (v * v - 2 * qk) % num
+            qk = qk * qk % num
+            if v == 0:
+                return True
+        return False
+
+    @timed('primality.test')
+    def _passes(self, num: int) -> bool:
+        """
+        Realiza o teste para um 'num' ímpar e maior que 3.
+        """
+        incr('primality.candidates')
+        incr('miller_rabin.rounds')
+        exp, multiple = self._factorization(num=num)
+        if self._is_witness(2, num, exp, multiple):
+            return False
+        incr('lucas.tests')
+        return self._is_strong_lucas_prp(num)
@@ -0,0 +1,204 @@
+"""
+Batch GCD de Bernstein: o MDC de cada módulo com o produto de todos os outros, através de uma
+árvore de produtos e de uma árvore de restos, em tempo quase linear na quantidade de módulos.
+
+Com o `gmpy2` instalado (extra `audit`: `pip install rsa-cli[audit]`), os inteiros são convertidos para `mpz`, com multiplicação e divisão
+subquadráticas. Sem ele, a divisão dos inteiros do Python é quadrática e a análise é adequada
+somente para alguns milhares de módulos.
+"""
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
+
+from rsa.utils.parallel import ordered_map
+
+try:
+    from gmpy2 import gcd, mpz
+except ImportError:  # pragma: no cover
+    from math import gcd
+
+    mpz = int
+
+# Quantidade de módulos de cada sub-árvore processada de forma independente
+CHUNK_SIZE = 1024
+
+
+def _map(
+    func: Callable, items: Iterable, executor: Optional[Executor]
+) -> List:
+    """
+    Função privada que aplica `func` aos itens, no `executor` se informado.
+    """
+    if executor is None:
+        return list(map(func, items))
+    return list(executor.map(func, items))
+
+
+def _multiply(pair: Sequence[int]) -> int:
+    """
+    Função privada que multiplica um par de nós da árvore de produtos.
+    """
+    return pair[0] * pair[1] if len(pair) == 2 else pair[0]
+
+
+def _square_mod(item: Sequence[int]) -> int:
+    """
+    Função privada que calcula o resto de um nó da árvore de restos: `resto do pai mod nó²`.
+    """
+    value, node = item
+    return value % (node * node)
+
+
+def product_tree(
+    values: Sequence[int], executor: Optional[Executor] = None
+) -> List[List[int]]:
+    """
+    Constrói a árvore de produtos, das folhas (`values`) até a raiz (o produto de todos os valores).
+
+    Arguments:
+        values (Sequence[int]): Os valores das folhas
+        executor (Optional[Executor]): Se informado, os produtos de cada nível são calculados em paralelo
+
+    Returns:
+        List[List[int]]: Os níveis da árvore, o primeiro com as folhas e o último com a raiz
+
+    Examples:
+        >>> product_tree([3, 5, 7])
+        [[3, 5, 7], [15, 7], [105]]
+    """
+    tree = [list(values)]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        pairs = [level[i : i + 2] for i in range(0, len(level), 2)]
+        tree.append(_map(_multiply, pairs, executor))
+    return tree
+
+
+def remainder_tree(
+    value: int, tree: List[List[int]], executor: Optional[Executor] = None
+) -> List[int]:
+    """
+    Desce a árvore de produtos calculando `value mod nó²` em cada nó, a partir do resto do nó pai.
+
+    Arguments:
+        value (int): O valor reduzido ao longo da árvore
+        tree (List[List[int]]): A árvore de produtos (ver `product_tree`)
+        executor (Optional[Executor]): Se informado, os restos de cada nível são calculados em paralelo
+
+    Returns:
+        List[int]: `value mod folha²` para cada folha, na ordem das folhas
+
+    Examples:
+        >>> remainder_tree(105, product_tree([3, 5, 7]))
+        [6, 5, 7]
+    """
+    rems = [value]
+    for level in reversed(tree):
+        items = [(rems[i // 2], node) for i, node in enumerate(level)]
+        rems = _map(_square_mod, items, executor)
+    return rems
+
+
+def batch_gcd(moduli: Sequence[int]) -> List[int]:
+    """
+    Calcula, para cada módulo, o MDC com o produto de todos os outros módulos.
+
+    Arguments:
+        moduli (Sequence[int]): Os módulos
+
+    Returns:
+        List[int]: O MDC de cada módulo, 1 para os módulos sem fatores compartilhados
+
+    Examples:
+        >>> batch_gcd([3 * 5, 7 * 11, 5 * 13])
+        [5, 1, 5]
+    """
+    tree = product_tree([mpz(modulus) for modulus in moduli])
+    # A raiz é menor que o próprio quadrado, então a descida começa pelos filhos da raiz
+    rems = remainder_tree(tree[-1][0], tree[:-1])
+    return [
+        int(gcd(rem // modulus, modulus))
+        for rem, modulus in zip(rems, tree[0])
+    ]
+
+
+def _chunk_product(chunks: List[List[int]]) -> List[int]:
+    """
+    Função privada utilizada pelos processos para calcular a raiz da sub-árvore de cada bloco.
+    """
+    return [product_tree(chunk)[-1][0] for chunk in chunks]
+
+
+def _chunk_gcds(items: List[tuple]) -> List[List[int]]:
+    """
+    Função privada utilizada pelos processos para descer a sub-árvore de cada bloco, a partir do
+    resto `produto total mod raiz²` do bloco.
+    """
+    result = []
+    for chunk, rem in items:
+        tree = product_tree(chunk)
+        result.append(
+            [
+                int(gcd(leaf // modulus, modulus))
+                for leaf, modulus in zip(remainder_tree(rem, tree), tree[0])
+            ]
+        )
+    return result
+
+
+def chunked_batch_gcd(
+    moduli: Sequence[int], chunk_size: int = CHUNK_SIZE, workers: int = 1
+) -> Iterator[int]:
+    """
+    Batch GCD com memória limitada: os módulos são divididos em blocos de `chunk_size`, e somente a
+    árvore acima das raízes dos blocos é mantida em memória. As sub-árvores de cada bloco são
+    construídas e descartadas uma a uma, em paralelo entre `workers` processos.
+
+    Arguments:
+        moduli (Sequence[int]): Os módulos
+        chunk_size (int): Quantidade de módulos por bloco
+        workers (int): Quantidade de processos
+
+    Returns:
+        Iterator[int]: O MDC de cada módulo com o produto de todos os outros, na ordem dos módulos
+
+    Examples:
+        >>> list(chunked_batch_gcd([3 * 5, 7 * 11, 5 * 13, 17 * 19], chunk_size=2))
+        [5, 1, 5, 1]
+    """
+    if chunk_size < 1 or workers < 1:
+        raise ValueError(
+            "Os valores de 'chunk_size' e 'workers' devem ser maiores que 0."
+        )
+
+    chunks = [
+        [mpz(modulus) for modulus in moduli[i : i + chunk_size]]
+        for i in range(0, len(moduli), chunk_size)
+    ]
+    if not chunks:
+        return
+
+    if workers == 1:
+        roots = _chunk_product(chunks)
+        upper = product_tree(roots)
+        rems = remainder_tree(upper[-1][0], upper[:-1])
+        del upper
+        for item in zip(chunks, rems):
+            yield from _chunk_gcds([item])[0]
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        roots = [
+            root
+            for roots in executor.map(
+                _chunk_product, [[chunk] for chunk in chunks]
+            )
+            for root in roots
+        ]
+        upper = product_tree(roots, executor=executor)
+        rems = remainder_tree(upper[-1][0], upper[:-1], executor=executor)
+        del upper
+
+    for gcds in ordered_map(
+        _chunk_gcds, zip(chunks, rems), workers=workers, chunk_size=1
+    ):
+        yield from gcds
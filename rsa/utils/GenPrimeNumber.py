@@ -1,26 +1,202 @@
+from itertools import islice, takewhile
 from random import randint
+from typing import Iterator, Optional
 
+from rsa.utils.BPSW import BPSW
+from rsa.utils.metrics import incr, timed
 from rsa.utils.MillerRabin import MillerRabin
+from rsa.utils.ModArith import lehmer_gcd
+from rsa.utils.Sieve import SIEVE_WINDOW, candidates, safe_candidates
 
+# Testes de primalidade disponíveis para a geração dos primos
+PRIMALITY_TESTS = {'miller-rabin': MillerRabin, 'bpsw': BPSW}
 
-def generate_prime(nbit: int) -> int:
+
+def primality_test(primality: str) -> MillerRabin:
+    """
+    Retorna o teste de primalidade selecionado.
+
+    Arguments:
+        primality (str): O nome do teste, uma das chaves de `PRIMALITY_TESTS`
+
+    Returns:
+        MillerRabin: O teste de primalidade, com os métodos `verify` e `verify_many`
+
+    Examples:
+        >>> type(primality_test('bpsw')).__name__
+        'BPSW'
+    """
+    if primality not in PRIMALITY_TESTS:
+        raise ValueError(
+            f'O teste de primalidade deve ser um de {list(PRIMALITY_TESTS)}.'
+        )
+    return PRIMALITY_TESTS[primality]()
+
+
+def check_public_exp(public_exp: int) -> int:
+    """
+    Verifica o expoente público: como 'p - 1' é par para todo primo 'p' ímpar, somente um expoente
+    ímpar pode ser coprimo com 'p - 1'.
+
+    Arguments:
+        public_exp (int): O expoente público
+
+    Returns:
+        int: O expoente público
+
+    Raises:
+        ValueError: Se o expoente for par, ou menor ou igual a 1
+
+    Examples:
+        >>> check_public_exp(65537)
+        65537
+
+        >>> check_public_exp(4)
+        Traceback (most recent call last):
+        ...
+        ValueError: O expoente público deve ser ímpar e maior que 1.
+    """
+    if public_exp <= 1 or public_exp % 2 == 0:
+        raise ValueError('O expoente público deve ser ímpar e maior que 1.')
+    return public_exp
+
+
+def _prime_candidates(nbit: int, window: int) -> Iterator[int]:
+    """
+    Função privada que gera os candidatos de `nbit` bits sobreviventes da peneira, a partir de
+    valores pseudoaleatórios. Se ultrapassar a quantidade de bits, reinicia a partir de outro valor.
+    """
+    upper = 2**nbit
+    while True:
+        start = randint(1 + 2 ** (nbit - 1), upper)
+        yield from takewhile(
+            lambda num: num < upper, candidates(start=start, window=window)
+        )
+
+
+def _safe_prime_candidates(nbit: int, window: int) -> Iterator[int]:
+    """
+    Função privada que gera os candidatos 'q' sobreviventes da peneira dupla, com 'p = 2q + 1' de
+    `nbit` bits. Se 'p' ultrapassar a quantidade de bits, reinicia a partir de outro valor.
+    """
+    upper = 2 ** (nbit - 1)
+    while True:
+        start = randint(2 ** (nbit - 2), upper - 1)
+        yield from takewhile(
+            lambda num: num < upper,
+            safe_candidates(start=start, window=window),
+        )
+
+
+@timed('prime.generate')
+def generate_prime(
+    nbit: int,
+    window: int = SIEVE_WINDOW,
+    primality: str = 'miller-rabin',
+    max_candidates: Optional[int] = None,
+) -> Optional[int]:
+    """
+    Gera número primo com validação do teste de Miller Rabin, ou do teste de Baillie-PSW
+
+    A partir de um valor pseudoaleatório, os candidatos são peneirados por primos pequenos
+    (ver `rsa.utils.Sieve`) e somente os sobreviventes são validados pelo teste de primalidade.
+
+    Com `max_candidates`, a busca é limitada e pode terminar sem um primo, o que permite dividi-la
+    em etapas de duração limitada (ver `rsa.core.AsyncRSA`).
+
+    Arguments:
+        nbit (int): Número de bits para o número primo
+        window (int): Quantidade de candidatos ímpares peneirados por vez
+        primality (str): O teste de primalidade, 'miller-rabin' ou 'bpsw'
+        max_candidates (Optional[int]): Quantidade máxima de candidatos validados pelo teste de primalidade
+
+    Returns:
+        Número primo que foi gerado, ou None se nenhum dos `max_candidates` candidatos for primo
+    """
+    miller_rabin = primality_test(primality)
+
+    prime_candidates = _prime_candidates(nbit=nbit, window=window)
+    if max_candidates is not None:
+        prime_candidates = islice(prime_candidates, max_candidates)
+    # Executa a verificação de MillerRabin
+    return next(miller_rabin.verify_many(prime_candidates), None)
+
+
+@timed('prime.generate_safe')
+def generate_safe_prime(
+    nbit: int,
+    window: int = SIEVE_WINDOW,
+    primality: str = 'miller-rabin',
+    max_candidates: Optional[int] = None,
+) -> Optional[int]:
+    """
+    Gera número primo seguro 'p = 2q + 1', com 'q' também primo.
+
+    Os candidatos 'q' passam pela peneira dupla (ver `rsa.utils.Sieve.safe_candidates`), que
+    descarta os candidatos em que 'q' ou '2q + 1' possuem fatores pequenos. Em seguida é feito o
+    teste de Fermat com base 2 em 'p' e, somente para os sobreviventes, o teste de primalidade em
+    'q'. Com 'q' primo, o teste de Fermat prova que 'p' é primo (critério de Pocklington).
+
+    Arguments:
+        nbit (int): Número de bits para o número primo 'p', maior que 2
+        window (int): Quantidade de candidatos ímpares peneirados por vez
+        primality (str): O teste de primalidade de 'q', 'miller-rabin' ou 'bpsw'
+        max_candidates (Optional[int]): Quantidade máxima de candidatos 'q' verificados (ver `generate_prime`)
+
+    Returns:
+        Número primo seguro que foi gerado, ou None se nenhum dos `max_candidates` candidatos for adequado
+
+    Examples:
+        >>> generate_safe_prime(nbit=3)
+        7
+    """
+    if nbit < 3:
+        raise ValueError('O primo seguro deve ter ao menos 3 bits.')
+
+    miller_rabin = primality_test(primality)
+
+    q_candidates = _safe_prime_candidates(nbit=nbit, window=window)
+    if max_candidates is not None:
+        q_candidates = islice(q_candidates, max_candidates)
+    for q in q_candidates:
+        p = 2 * q + 1
+        incr('modexp')
+        if pow(2, p - 1, p) == 1 and miller_rabin.verify(num=q):
+            return p
+    return None
+
+
+def generate_rsa_prime(
+    nbit: int,
+    public_exp: int = 65537,
+    primality: str = 'miller-rabin',
+    safe: bool = False,
+    max_candidates: Optional[int] = None,
+) -> Optional[int]:
     """
-    Gera número primo com validação do teste de Miller Rabin
+    Gera número primo 'p' adequado ao RSA, ou seja, com MDC(public_exp, p - 1) = 1.
+
+    Como MDC(e, Phi(n)) = 1 se, e somente se, 'e' for coprimo com 'p - 1' e com 'q - 1',
+    a verificação é feita por primo, permitindo que somente o primo inadequado seja gerado novamente.
 
     Arguments:
         nbit (int): Número de bits para o número primo
+        public_exp (int): O expoente público que será utilizado com o primo
+        primality (str): O teste de primalidade, 'miller-rabin' ou 'bpsw'
+        safe (bool): Se True, gera um primo seguro (ver `generate_safe_prime`)
+        max_candidates (Optional[int]): Quantidade máxima de candidatos verificados em cada busca (ver `generate_prime`)
 
     Returns:
-        Número primo que foi gerado
-    """
-    num = randint(1 + 2 ** (nbit - 1), 2**nbit)
-    miller_rabin = MillerRabin(iterations=3)
-    prime = miller_rabin.verify(
-        num=num
-    )  # Executa a verificação de MillerRabin
-
-    # Enquanto não for primo incrementa o número gerado e executa o teste de primalidade
-    while not prime:
-        num += 1
-        prime = miller_rabin.verify(num=num)
-    return num
+        Número primo que foi gerado, ou None se a busca limitada por `max_candidates` não encontrar um primo
+
+    Raises:
+        ValueError: Se o expoente público for inválido (ver `check_public_exp`)
+    """
+    check_public_exp(public_exp)
+    generator = generate_safe_prime if safe else generate_prime
+    while True:
+        prime = generator(
+            nbit=nbit, primality=primality, max_candidates=max_candidates
+        )
+        if prime is None or lehmer_gcd(public_exp, prime - 1) == 1:
+            return prime
@@ -1,3 +1,6 @@
+from rsa.utils.metrics import timed
+
+
 class JBR:
     """
     Classe utilizada para relização do cálculo de inverso modular, baseado no algoritmo JBR desenvolvido pelo Doutor Joacil Basílio Rael.
@@ -9,12 +12,14 @@ class JBR:
 
     def __init__(self, mod: int) -> None:
         self.mod = mod
-        self.original_mod = mod
-        self.j, self.b, self.count = 0, 1, 1
 
+    @timed('jbr.inv_mod')
     def invMod(self, num: int) -> int:
         """
-        Realiza as rodadas do algoritmo JBR.
+        Realiza as rodadas do algoritmo JBR, de forma iterativa.
+
+        As rodadas não alteram o estado da instância, de forma que a mesma instância pode ser
+        reutilizada, inclusive entre threads.
 
         Attributes:
             num (int): O número que se deseja saber o inverso modular, maior que 1
@@ -26,22 +31,22 @@ class JBR:
             >>> JBR(mod=256).invMod(num=123)
             179
         """
+        mod, j, b, count = self.mod, 0, 1, 1
 
-        if num == 0:
-            raise ZeroDivisionError(
-                'Não existe inverso modular para o valor informado'
-            )
+        while True:
+            if num == 0:
+                raise ZeroDivisionError(
+                    'Não existe inverso modular para o valor informado'
+                )
 
-        resto = self.mod % num
-        r = self.mod // num
+            resto = mod % num
+            r = mod // num
 
-        inv = self.j + self.b * r
+            inv = j + b * r
 
-        if resto == 1:
-            return (
-                ((-1) ** self.count) * inv + self.original_mod
-            ) % self.original_mod
+            if resto == 1:
+                return ((-1) ** count * inv + self.mod) % self.mod
 
-        self.j, self.b, self.mod = self.b, inv, num
-        self.count += 1
-        return self.invMod(num=resto)
+            j, b, mod = b, inv, num
+            count += 1
+            num = resto
@@ -36,8 +36,7 @@ def mdc(a: int, b: int):
     if b > a:
         a, b = b, a
 
-    # O objetivo é que esta condição seja atingida para que termine a recursividade
-    if b == 0:
-        return a
-    r = a % b
-    return mdc(a=b, b=r)
+    # A cada rodada MDC(a, b) = MDC(b, r), até que o resto seja 0
+    while b:
+        a, b = b, a % b
+    return a
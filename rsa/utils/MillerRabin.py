@@ -1,48 +1,53 @@
-from functools import wraps
-from typing import Dict, List, Tuple
+from random import randrange
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
 
+from rsa.utils.metrics import incr, timed
 
-def is_prime(func):
-    """
-    Decorator utilizado para retornar True ou False para números primos e compostos
+# Bases que tornam o teste determinístico para todo 'num' < 2^64 (Jim Sinclair)
+DETERMINISTIC_BASES = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
 
-    Arguments:
-        func (function): A função original que será decorada
+# Quantidade mínima de rodadas por número de bits do candidato, conforme a Tabela B.1 do
+# FIPS 186-5 (geração dos primos 'p' e 'q' do RSA). Abaixo de 512 bits, fora da tabela, é
+# utilizado o limite de pior caso (4^-k) para probabilidade de erro de 2^-80.
+FIPS_ROUNDS = ((2048, 4), (1536, 4), (1024, 5), (512, 7), (0, 40))
 
-    Returns:
-        function: A função decorada com o retorno modificado
+
+def mr_rounds(bits: int) -> int:
     """
+    Retorna a quantidade de rodadas do teste de Miller Rabin para um candidato de `bits` bits.
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        """
-        Wrapper utilizado para modificação da função decorada
+    Arguments:
+        bits (int): O número de bits do candidato
 
-        Arguments:
-            *args (args): Argumentos não nomeados da função principal
-            **kwargs (kwargs): Argumentos nomeados da função principal
+    Returns:
+        int: A quantidade de rodadas
 
-        Returns:
-            Um booleano indicando se o valor é primo ou não
-        """
-        test = func(*args, **kwargs)
-        return False if 0 in test.values() else True
+    Examples:
+        >>> mr_rounds(1024)
+        5
 
-    return wrapper
+        >>> mr_rounds(2048)
+        4
+    """
+    return next(rounds for limit, rounds in FIPS_ROUNDS if bits >= limit)
 
 
 class MillerRabin:
     """
     Classe utilizada para realizar o teste de Miller Rabin para verificação de números primos grandes
 
+    Para 'num' < 2^64 o teste é determinístico (`DETERMINISTIC_BASES`). Acima disso, as bases são
+    pseudoaleatórias e, sem `iterations`, a quantidade de rodadas é escolhida pelo número de bits
+    (ver `mr_rounds`).
+
     Attributes:
-        iterations (int): Quantidade de iterações que o teste irá realizar
+        iterations (Optional[int]): Quantidade de iterações que o teste irá realizar
     """
 
-    def __init__(self, iterations: int = 3):
+    def __init__(self, iterations: Optional[int] = None):
         self.iterations = iterations
 
-        if self.iterations % 2 == 0:
+        if self.iterations is not None and self.iterations % 2 == 0:
             raise Exception("O valor de 'iterations' precisa ser ímpar.")
 
     def _factorization(self, num: int) -> Tuple[int, int]:
@@ -62,42 +67,63 @@ class MillerRabin:
             >>> MillerRabin(3)._factorization(13)
             (2, 3)
         """
-        exp = 0
         multiple = num - 1
-        while multiple % 2 == 0:
-            exp += 1
-            multiple = multiple // 2
-        return exp, multiple
+        exp = (multiple & -multiple).bit_length() - 1
+        return exp, multiple >> exp
 
-    def _pseudorandom_base(self, num: int) -> List[int]:
+    def _bases(self, num: int) -> Sequence[int]:
         """
-        Realiza a escolha de número pseudo aleatórios entre 2 e num - 1, sem repetir os números já escolhidos.
+        Realiza a escolha das bases do teste: as bases determinísticas para 'num' < 2^64, ou bases
+        pseudoaleatórias entre 2 e num - 2.
 
         Attributes:
             num (int): O número que será verificado
 
         Returns:
-            List[int]: Uma lista com os inteiros pseudoaleatórios
+            Sequence[int]: As bases, na ordem em que serão testadas
         """
-        from random import randint
-
-        count = 0
-        rand_list = list()
-        while True:
-            rand_num = randint(2, num - 1)
-            if rand_num not in rand_list:
-                rand_list.append(rand_num)
-                count += 1
-            if count == self.iterations:
-                break
-        return rand_list
-
-    @is_prime
-    def verify(self, num):
+        if num < 2**64:
+            return DETERMINISTIC_BASES
+
+        rounds = self.iterations or mr_rounds(num.bit_length())
+        return [randrange(2, num - 1) for _ in range(rounds)]
+
+    def _is_witness(self, a: int, num: int, exp: int, multiple: int) -> bool:
         """
-        Realiza as rodadas e verificações do teste de Miller Rabin, modificado pelo decorator `is_prime`.
+        Realiza uma rodada do teste com a base 'a'.
 
-        O decorator `is_prime` modifica a função principal retornando True para números primos e False para números compostos.
+        Attributes:
+            a (int): A base da rodada
+            num (int): O número que será verificado
+            exp (int): O expoente de 2 em 'num - 1' (ver `_factorization`)
+            multiple (int): A parte ímpar de 'num - 1' (ver `_factorization`)
+
+        Returns:
+            bool: True se 'a' prova que 'num' é composto
+
+        Examples:
+            >>> MillerRabin()._is_witness(137, 221, 2, 55)
+            True
+
+            >>> MillerRabin()._is_witness(174, 221, 2, 55)
+            False
+        """
+        incr('modexp')
+        x = pow(a, multiple, num)
+        if x == 1 or x == num - 1:
+            return False
+
+        for _ in range(exp - 1):
+            x = x * x % num
+            # "X" é uma raiz quadrada de -1, então a rodada não prova que "num" é composto
+            if x == num - 1:
+                return False
+        return True
+
+    def verify(self, num: int) -> bool:
+        """
+        Realiza as rodadas e verificações do teste de Miller Rabin, encerrando na primeira base que
+        prova que 'num' é composto.
 
         Arguments:
             num (int): O número que será verificado
@@ -115,35 +141,45 @@ class MillerRabin:
             >>> MillerRabin(3).verify(235)
             False
         """
+        if num < 3:
+            return num == 2
+
         if num % 2 == 0:
-            return {0: 0}
+            return False
 
-        if self.iterations >= num:
+        if self.iterations is not None and self.iterations >= num:
             raise Exception(
                 f"O valor de 'iterations' deve ser menor que {num}."
             )
 
-        s, d = self._factorization(num=num)  # s = exp, d = multiplo
-        prime = dict()
-        rand_list = self._pseudorandom_base(num=num)
-
-        for i in range(self.iterations):
-            # Escolha da base 'a', pseudoaleatória na iteração 'i'.
-            a = rand_list[i]
-            x = pow(a, d, num)
-
-            # Se o resultado da primeira iteração com base "a", não for 1, ou -1
-            if x not in (1, -1 % num):
-                for j in range(s):
-                    x = pow(x, 2, num)
-                    # "X" é uma raiz quadrada não trivial de "num"
-                    # Número que, ao ser elevado ao quadrado e reduzido módulo "num", resulta em -1.
-
-                    if x == -1 % num:  # É primo
-                        prime[a] = 1
-                        break
-                    else:
-                        prime[a] = 0  # Não é primo
-            else:
-                prime[a] = 1
-        return prime
+        return num == 3 or self._passes(num)
+
+    @timed('primality.test')
+    def _passes(self, num: int) -> bool:
+        """
+        Realiza as rodadas do teste para um 'num' ímpar e maior que 3.
+        """
+        incr('primality.candidates')
+        exp, multiple = self._factorization(num=num)
+        for a in self._bases(num=num):
+            incr('miller_rabin.rounds')
+            a %= num
+            if a and self._is_witness(a, num, exp, multiple):
+                return False
+        return True
+
+    def verify_many(self, candidates: Iterable[int]) -> Iterator[int]:
+        """
+        Realiza o teste de Miller Rabin sobre uma sequência de candidatos, retornando somente os primos.
+
+        Arguments:
+            candidates (Iterable[int]): Os candidatos, ímpares e maiores que 3
+
+        Returns:
+            Iterator[int]: Os candidatos primos, na ordem de `candidates`
+
+        Examples:
+            >>> list(MillerRabin().verify_many([221, 223, 225, 227]))
+            [223, 227]
+        """
+        return filter(self._passes, candidates)
@@ -0,0 +1,174 @@
+from typing import Iterable, List, Tuple
+
+from rsa.utils.metrics import timed
+
+# Quantidade de bits dos dígitos iniciais utilizados em cada rodada do algoritmo de Lehmer
+LEHMER_BITS = 62
+
+
+def egcd(a: int, b: int) -> Tuple[int, int, int]:
+    """
+    Algoritmo Estendido de Euclides, iterativo.
+
+    Arguments:
+        a (int): O primeiro inteiro, não negativo
+        b (int): O segundo inteiro, não negativo
+
+    Returns:
+        Tuple[int, int, int]: 'g', 'x' e 'y', tais que a * x + b * y = g = MDC(a, b)
+
+    Examples:
+        >>> egcd(240, 46)
+        (2, -9, 47)
+    """
+    x0, x1, y0, y1 = 1, 0, 0, 1
+    while b:
+        q, r = divmod(a, b)
+        a, b = b, r
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
+    return a, x0, y0
+
+
+def binary_gcd(a: int, b: int) -> int:
+    """
+    MDC pelo algoritmo binário (Stein), somente com deslocamentos e subtrações.
+
+    Arguments:
+        a (int): O primeiro inteiro
+        b (int): O segundo inteiro
+
+    Returns:
+        int: O Máximo Divisor Comum entre 'a' e 'b'
+
+    Examples:
+        >>> binary_gcd(48, 180)
+        12
+    """
+    a, b = abs(a), abs(b)
+    if a == 0 or b == 0:
+        return a | b
+
+    # Potência de 2 comum aos dois valores
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+
+def lehmer_gcd(a: int, b: int) -> int:
+    """
+    MDC pelo algoritmo de Lehmer (Knuth, Algoritmo L): as rodadas de Euclides são simuladas sobre os
+    `LEHMER_BITS` bits iniciais dos valores, e aplicadas aos valores completos uma única vez.
+
+    Arguments:
+        a (int): O primeiro inteiro
+        b (int): O segundo inteiro
+
+    Returns:
+        int: O Máximo Divisor Comum entre 'a' e 'b'
+
+    Examples:
+        >>> lehmer_gcd(2**200 * 3, 2**150 * 9) == 2**150 * 3
+        True
+    """
+    a, b = abs(a), abs(b)
+    if a < b:
+        a, b = b, a
+
+    while b >> LEHMER_BITS:
+        shift = a.bit_length() - LEHMER_BITS
+        x, y = a >> shift, b >> shift
+        A, B, C, D = 1, 0, 0, 1
+        while y + C and y + D:
+            q = (x + A) // (y + C)
+            if q != (x + B) // (y + D):
+                break
+            A, B, C, D = C, D, A - q * C, B - q * D
+            x, y = y, x - q * y
+
+        if B == 0:
+            a, b = b, a % b
+        else:
+            a, b = A * a + B * b, C * a + D * b
+
+    while b:
+        a, b = b, a % b
+    return a
+
+
+@timed('inv_mod')
+def inv_mod(num: int, mod: int) -> int:
+    """
+    Calcula o inverso modular de 'num', sem recursão e sem estado.
+
+    O cálculo é feito pelo `pow(num, -1, mod)` da biblioteca padrão, que implementa o Algoritmo
+    Estendido de Euclides em C (ver `egcd`).
+
+    Arguments:
+        num (int): O número que se deseja saber o inverso modular
+        mod (int): O módulo, maior que 1
+
+    Returns:
+        int: O inverso modular de 'num % mod'
+
+    Raises:
+        ZeroDivisionError: Se 'num' não possuir inverso modular
+
+    Examples:
+        >>> inv_mod(123, 256)
+        179
+    """
+    try:
+        return pow(num, -1, mod)
+    except ValueError:
+        raise ZeroDivisionError(
+            'Não existe inverso modular para o valor informado'
+        )
+
+
+def batch_inv_mod(nums: Iterable[int], mod: int) -> List[int]:
+    """
+    Calcula o inverso modular de vários números com o mesmo módulo, com uma única inversão (truque
+    de Montgomery): os produtos acumulados são invertidos uma vez e cada inverso é recuperado com
+    duas multiplicações.
+
+    Função de biblioteca, para quem precisa de muitos inversos com um mesmo módulo (comparada ao
+    `inv_mod` em `rsa.bench.mod_inverse`). A geração de chaves não a utiliza: cada par possui o
+    próprio 'phi' e o próprio 'p', e o truque não se aplica a módulos distintos.
+
+    Arguments:
+        nums (Iterable[int]): Os números que se deseja saber o inverso modular
+        mod (int): O módulo, maior que 1
+
+    Returns:
+        List[int]: Os inversos modulares, na ordem de 'nums'
+
+    Raises:
+        ZeroDivisionError: Se algum dos números não possuir inverso modular
+
+    Examples:
+        >>> batch_inv_mod([3, 5, 7], 11)
+        [4, 9, 8]
+    """
+    nums = list(nums)
+    if not nums:
+        return []
+
+    prefix = []
+    acc = 1
+    for num in nums:
+        acc = acc * num % mod
+        prefix.append(acc)
+
+    inv = inv_mod(acc, mod)
+    result = [0] * len(nums)
+    for i in range(len(nums) - 1, 0, -1):
+        result[i] = inv * prefix[i - 1] % mod
+        inv = inv * nums[i] % mod
+    result[0] = inv
+    return result
@@ -0,0 +1,143 @@
+from functools import partial
+from multiprocessing import Process, Queue, current_process
+from typing import Iterator, List
+
+from rsa.utils.GenPrimeNumber import (
+    check_public_exp,
+    generate_rsa_prime,
+    primality_test,
+)
+
+
+def _search(
+    nbit: int, public_exp: int, primality: str, safe: bool, results: Queue
+) -> None:
+    """
+    Função privada executada por cada processo da busca especulativa.
+
+    Cada chamada de `generate_rsa_prime` parte de um valor pseudoaleatório próprio, de forma que
+    os processos percorrem janelas de candidatos disjuntas (com altíssima probabilidade).
+
+    Arguments:
+        nbit (int): Número de bits para o número primo
+        public_exp (int): O expoente público que será utilizado com o primo
+        primality (str): O teste de primalidade (ver `generate_prime`)
+        safe (bool): Se True, busca primos seguros (ver `generate_safe_prime`)
+        results (Queue): A fila onde os primos encontrados são publicados
+    """
+    while True:
+        results.put(
+            generate_rsa_prime(
+                nbit=nbit,
+                public_exp=public_exp,
+                primality=primality,
+                safe=safe,
+            )
+        )
+
+
+def _distinct(primes: Iterator[int], count: int) -> List[int]:
+    """
+    Função privada que retorna os `count` primeiros primos distintos de `primes`.
+    """
+    found: List[int] = []
+    while len(found) < count:
+        prime = next(primes)
+        if prime not in found:
+            found.append(prime)
+    return found
+
+
+def search_primes(
+    nbit: int,
+    count: int = 1,
+    workers: int = 2,
+    public_exp: int = 65537,
+    primality: str = 'miller-rabin',
+    safe: bool = False,
+) -> List[int]:
+    """
+    Realiza a busca especulativa de primos em paralelo: `workers` processos buscam primos
+    simultaneamente e os `count` primeiros primos distintos encontrados são retornados.
+    Assim que os primos são encontrados, os demais processos são cancelados.
+
+    Os processos não são daemon, e são encerrados ao final da busca. Em um processo daemon (ex.: um
+    worker de `multiprocessing.Pool`), que não pode criar processos, a busca é sequencial.
+
+    Arguments:
+        nbit (int): Número de bits para os números primos
+        count (int): Quantidade de primos distintos que serão retornados
+        workers (int): Quantidade de processos utilizados na busca
+        public_exp (int): O expoente público, 'p - 1' será coprimo com ele
+        primality (str): O teste de primalidade (ver `generate_prime`)
+        safe (bool): Se True, busca primos seguros (ver `generate_safe_prime`)
+
+    Returns:
+        List[int]: Os primos encontrados, na ordem em que foram encontrados
+    """
+    if workers < 1:
+        raise ValueError("O valor de 'workers' deve ser maior que 0.")
+    # Valida o teste e o expoente antes de iniciar os processos
+    primality_test(primality)
+    check_public_exp(public_exp)
+
+    if current_process().daemon:
+        search = partial(
+            generate_rsa_prime,
+            nbit=nbit,
+            public_exp=public_exp,
+            primality=primality,
+            safe=safe,
+        )
+        return _distinct(iter(search, None), count)
+
+    results = Queue()
+    processes = [
+        Process(
+            target=_search,
+            args=(nbit, public_exp, primality, safe, results),
+        )
+        for _ in range(workers)
+    ]
+    try:
+        for process in processes:
+            process.start()
+        return _distinct(iter(results.get, None), count)
+    finally:
+        # Cancela imediatamente as buscas em andamento
+        for process in processes:
+            if process.pid is not None:
+                process.terminate()
+                process.join()
+        results.close()
+
+
+def generate_prime_parallel(
+    nbit: int,
+    workers: int = 2,
+    public_exp: int = 65537,
+    primality: str = 'miller-rabin',
+    safe: bool = False,
+) -> int:
+    """
+    Gera um número primo utilizando `workers` processos em paralelo, onde o primeiro
+    primo encontrado é retornado e as demais buscas são canceladas.
+
+    Arguments:
+        nbit (int): Número de bits para o número primo
+        workers (int): Quantidade de processos utilizados na busca
+        public_exp (int): O expoente público, 'p - 1' será coprimo com ele
+        primality (str): O teste de primalidade (ver `generate_prime`)
+        safe (bool): Se True, busca um primo seguro (ver `generate_safe_prime`)
+
+    Returns:
+        Número primo que foi gerado
+    """
+    return search_primes(
+        nbit=nbit,
+        count=1,
+        workers=workers,
+        public_exp=public_exp,
+        primality=primality,
+        safe=safe,
+    )[0]
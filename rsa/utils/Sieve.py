@@ -0,0 +1,167 @@
+from math import gcd, prod
+from typing import Iterator, List, Tuple
+
+# Limite dos primos utilizados na peneira da janela de candidatos
+SIEVE_LIMIT = 2048
+
+# Limite dos primos que compõem o primorial do pré-filtro via MDC
+PRIMORIAL_LIMIT = 8192
+
+# Quantidade de candidatos ímpares analisados em cada janela
+SIEVE_WINDOW = 4096
+
+
+def _small_primes(limit: int) -> List[int]:
+    """
+    Gera todos os números primos menores que `limit` através do Crivo de Eratóstenes.
+
+    Arguments:
+        limit (int): O limite superior (exclusivo) para os primos gerados
+
+    Returns:
+        List[int]: Uma lista com os números primos menores que `limit`
+
+    Examples:
+        >>> _small_primes(30)
+        [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    """
+    table = bytearray([1]) * limit
+    table[0:2] = b'\x00\x00'
+    for num in range(2, int(limit**0.5) + 1):
+        if table[num]:
+            table[num * num :: num] = bytes(len(range(num * num, limit, num)))
+    return [num for num, is_prime in enumerate(table) if is_prime]
+
+
+_PRIMES = _small_primes(PRIMORIAL_LIMIT)
+
+# Primos ímpares utilizados para marcar os compostos da janela
+SMALL_PRIMES: Tuple[int, ...] = tuple(
+    p for p in _PRIMES if 2 < p < SIEVE_LIMIT
+)
+
+# Produto dos primos entre `SIEVE_LIMIT` e `PRIMORIAL_LIMIT`
+PRIMORIAL: int = prod(p for p in _PRIMES if p >= SIEVE_LIMIT)
+
+
+def sieve_window(start: int, size: int = SIEVE_WINDOW) -> bytearray:
+    """
+    Realiza a peneira de uma janela de candidatos ímpares `start, start + 2, ..., start + 2 * (size - 1)`.
+
+    Cada posição do bitmap indica se o candidato correspondente sobreviveu à divisão por todos os
+    primos de `SMALL_PRIMES`. O próprio primo nunca é marcado como composto.
+
+    Arguments:
+        start (int): O primeiro candidato da janela, ímpar
+        size (int): A quantidade de candidatos da janela
+
+    Returns:
+        bytearray: Um bitmap onde 1 indica um candidato sobrevivente e 0 um composto
+
+    Examples:
+        >>> list(sieve_window(start=3, size=6))
+        [1, 1, 1, 0, 1, 1]
+    """
+    bitmap = bytearray([1]) * size
+    for p in SMALL_PRIMES:
+        # Índice 'i' tal que start + 2i ≡ 0 (mod p), utilizando o inverso de 2 mod p
+        index = (-start * ((p + 1) >> 1)) % p
+        if start + 2 * index == p:
+            index += p
+        if index < size:
+            bitmap[index::p] = bytes(len(range(index, size, p)))
+    return bitmap
+
+
+def candidates(start: int, window: int = SIEVE_WINDOW) -> Iterator[int]:
+    """
+    Gera, de forma contínua, os candidatos a primo a partir de `start` que sobreviveram à peneira
+    e ao pré-filtro via MDC com o primorial. Somente estes candidatos precisam ser validados pelo
+    teste de Miller Rabin.
+
+    Arguments:
+        start (int): O valor a partir do qual os candidatos serão gerados
+        window (int): A quantidade de candidatos ímpares peneirados por vez
+
+    Returns:
+        Iterator[int]: Os candidatos sobreviventes, em ordem crescente
+
+    Examples:
+        >>> from itertools import islice
+        >>> list(islice(candidates(start=90), 5))
+        [97, 101, 103, 107, 109]
+    """
+    start |= 1  # Somente candidatos ímpares
+    while True:
+        bitmap = sieve_window(start=start, size=window)
+        for index, survivor in enumerate(bitmap):
+            if not survivor:
+                continue
+            num = start + 2 * index
+            if num >= PRIMORIAL_LIMIT and gcd(num, PRIMORIAL) != 1:
+                continue
+            yield num
+        start += 2 * window
+
+
+def safe_sieve_window(start: int, size: int = SIEVE_WINDOW) -> bytearray:
+    """
+    Realiza a peneira dupla de uma janela de candidatos ímpares 'q' para primos seguros 'p = 2q + 1'.
+
+    Cada primo pequeno 'r' marca os candidatos com q ≡ 0 (mod r) e os candidatos com
+    2q + 1 ≡ 0 (mod r), ou seja, q ≡ (r - 1) / 2 (mod r), de forma que os sobreviventes não
+    possuem fatores pequenos nem em 'q' nem em 'p'.
+
+    Arguments:
+        start (int): O primeiro candidato 'q' da janela, ímpar
+        size (int): A quantidade de candidatos da janela
+
+    Returns:
+        bytearray: Um bitmap onde 1 indica um candidato sobrevivente e 0 um composto
+
+    Examples:
+        >>> list(safe_sieve_window(start=3, size=6))  # q = 3, 5, 7, 9, 11, 13
+        [1, 1, 0, 0, 1, 0]
+    """
+    bitmap = sieve_window(start=start, size=size)
+    for p in SMALL_PRIMES:
+        # Índice 'i' tal que 2 * (start + 2i) + 1 ≡ 0 (mod p)
+        index = ((p - 1) // 2 - start) * ((p + 1) >> 1) % p
+        if 2 * (start + 2 * index) + 1 == p:
+            index += p
+        if index < size:
+            bitmap[index::p] = bytes(len(range(index, size, p)))
+    return bitmap
+
+
+def safe_candidates(start: int, window: int = SIEVE_WINDOW) -> Iterator[int]:
+    """
+    Gera, de forma contínua, os candidatos 'q' a partir de `start` em que 'q' e '2q + 1' sobreviveram
+    à peneira dupla e ao pré-filtro via MDC com o primorial.
+
+    Arguments:
+        start (int): O valor a partir do qual os candidatos serão gerados
+        window (int): A quantidade de candidatos ímpares peneirados por vez
+
+    Returns:
+        Iterator[int]: Os candidatos 'q' sobreviventes, em ordem crescente
+
+    Examples:
+        >>> from itertools import islice
+        >>> list(islice(safe_candidates(start=10), 5))
+        [11, 23, 29, 41, 53]
+    """
+    start |= 1  # Somente candidatos ímpares
+    while True:
+        bitmap = safe_sieve_window(start=start, size=window)
+        for index, survivor in enumerate(bitmap):
+            if not survivor:
+                continue
+            num = start + 2 * index
+            if (
+                num >= PRIMORIAL_LIMIT
+                and gcd(num * (2 * num + 1), PRIMORIAL) != 1
+            ):
+                continue
+            yield num
+        start += 2 * window
@@ -0,0 +1,120 @@
+from codecs import getincrementaldecoder
+from typing import BinaryIO, Iterable, Iterator
+
+# Byte adicionado no início de cada bloco, preservando os zeros à esquerda do bloco
+BLOCK_MARKER = b'\x01'
+
+
+def payload_size(key_size: int) -> int:
+    """
+    Calcula a quantidade de bytes de mensagem em cada bloco para um módulo de `key_size` bytes.
+
+    O bloco cifrado é `BLOCK_MARKER + payload`, com `key_size - 1` bytes, sempre menor que o módulo.
+
+    Arguments:
+        key_size (int): O tamanho do módulo, em bytes
+
+    Returns:
+        int: A quantidade de bytes de mensagem por bloco
+
+    Examples:
+        >>> payload_size(256)
+        254
+    """
+    if key_size < 3:
+        raise ValueError(
+            'O módulo da chave é pequeno demais para a cifração por blocos.'
+        )
+    return key_size - 2
+
+
+def pack_block(chunk: bytes) -> int:
+    """
+    Converte um bloco de mensagem para o inteiro que será cifrado.
+
+    Arguments:
+        chunk (bytes): O bloco de mensagem
+
+    Returns:
+        int: O inteiro correspondente a `BLOCK_MARKER + chunk`
+
+    Examples:
+        >>> pack_block(b'\\x00a')
+        65633
+    """
+    return int.from_bytes(BLOCK_MARKER + chunk, 'big')
+
+
+def unpack_block(value: int) -> bytes:
+    """
+    Converte um inteiro decifrado para o bloco de mensagem.
+
+    Blocos sem o `BLOCK_MARKER` (criptogramas gerados antes da cifração por blocos, com a
+    mensagem inteira em um único inteiro) são retornados integralmente.
+
+    Arguments:
+        value (int): O inteiro decifrado
+
+    Returns:
+        bytes: O bloco de mensagem
+
+    Examples:
+        >>> unpack_block(65633)
+        b'\\x00a'
+
+        >>> unpack_block(int.from_bytes(b'legado', 'big'))
+        b'legado'
+    """
+    block = value.to_bytes((value.bit_length() + 7) // 8, 'big')
+    return block[1:] if block[:1] == BLOCK_MARKER else block
+
+
+def iter_chunks(source: BinaryIO, size: int) -> Iterator[bytes]:
+    """
+    Realiza a leitura de `source` em blocos de `size` bytes, sem carregar todo o conteúdo em memória.
+
+    Arguments:
+        source (BinaryIO): O arquivo, aberto em modo binário
+        size (int): O tamanho de cada bloco
+
+    Returns:
+        Iterator[bytes]: Os blocos lidos, o último podendo ser menor que `size`
+
+    Examples:
+        >>> from io import BytesIO
+        >>> list(iter_chunks(BytesIO(b'abcde'), 2))
+        [b'ab', b'cd', b'e']
+    """
+    while True:
+        chunk = source.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_text(
+    chunks: Iterable[bytes], encoding: str = 'utf-8'
+) -> Iterator[str]:
+    """
+    Decodifica os blocos de bytes para texto de forma incremental, tratando os caracteres
+    multibyte divididos entre dois blocos.
+
+    Arguments:
+        chunks (Iterable[bytes]): Os blocos de bytes
+        encoding (str): A codificação do texto
+
+    Returns:
+        Iterator[str]: O texto decodificado de cada bloco
+
+    Examples:
+        >>> ''.join(iter_text([b'ol\\xc3', b'\\xa1']))
+        'olá'
+    """
+    decoder = getincrementaldecoder(encoding)()
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
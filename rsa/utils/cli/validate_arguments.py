@@ -4,6 +4,10 @@ from typer import BadParameter, Context
 
 
 def validate_message(context: Context, value: str):
+    # No modo em lote, as mensagens são os arquivos de `--input-dir`
+    if context.params.get('input_dir'):
+        return value
+
     # Se nenhum dos valores forem setados
     if not context.params.get('message_file') and not value:
         raise BadParameter(
@@ -19,6 +23,16 @@ def validate_message(context: Context, value: str):
     return value
 
 
+def validate_public_exp(value: int):
+    # Importado somente na execução do comando, sem custo na inicialização do CLI
+    from rsa.utils.GenPrimeNumber import check_public_exp
+
+    try:
+        return check_public_exp(value)
+    except ValueError as error:
+        raise BadParameter(str(error))
+
+
 def validate_public_key(context: Context, value: str):
     # Se nenhum dos valores forem setados
     if not context.params.get('key_file') and not value:
@@ -36,6 +50,10 @@ def validate_public_key(context: Context, value: str):
 
 
 def validate_criptogram_param(context: Context, value: Optional[str]):
+    # No modo em lote, os criptogramas são os arquivos de `--input-dir`
+    if context.params.get('input_dir'):
+        return value
+
     # Se nenhum dos valores forem setados
     if not context.params.get('criptogram_file') and not value:
         raise BadParameter(
@@ -1,7 +1,16 @@
 import os
+import sys
+from base64 import b64encode
+from contextlib import contextmanager
+from typing import BinaryIO, Iterable, Iterator
 
+from rsa.utils.cli.read_files import STDIO
+from rsa.utils.container import write_container
 from rsa.utils.logging.config import log
 
+# Quantidade de caracteres de cada linha do base64 dos arquivos PEM
+PEM_LINE_SIZE = 64
+
 
 def _create_dir(path: str) -> dict[str, str]:
     """
@@ -27,6 +36,21 @@ def _create_dir(path: str) -> dict[str, str]:
         return {'ok': 'dir exists'}
 
 
+def _pem_body(der: bytes) -> str:
+    """
+    Função privada que codifica os bytes DER em base64, em linhas de 64 caracteres (RFC 7468).
+
+    Examples:
+        >>> _pem_body(bytes.fromhex('300702020ca1020111'))
+        'MAcCAgyhAgER'
+    """
+    encoded = b64encode(der).decode('ascii')
+    return '\n'.join(
+        encoded[index : index + PEM_LINE_SIZE]
+        for index in range(0, len(encoded), PEM_LINE_SIZE)
+    )
+
+
 def write_key_file(
     key_file_path: str, key_filename: str, content: str, key_type: str
 ) -> dict[str, str]:
@@ -62,7 +86,7 @@ def write_key_file(
             if extension == '.pem':
                 file.write(f'{pem_header}\n')
                 file.write(f'{content}\n')
-                file.write(f'{pem_footer}')
+                file.write(f'{pem_footer}\n')
             else:
                 file.write(f'{content}')
         log.info('Conteúdo escrito com sucesso!')
@@ -72,6 +96,51 @@ def write_key_file(
         return {'nok': str(e)}
 
 
+def write_key_pair(
+    key_file_path: str,
+    file_prefix: str,
+    private_key: str,
+    public_key: str,
+    output_type: str = 'hex',
+) -> None:
+    """
+    Realiza a escrita de um par de chaves RSA nos arquivos `<file_prefix>_private_key` e `<file_prefix>_public_key`.
+
+    Arguments:
+        key_file_path (str): O diretório onde os arquivos serão criados
+        file_prefix (str): O prefixo dos arquivos de chaves
+        private_key (str): A chave privada, codificada em hexadecimal
+        public_key (str): A chave pública, codificada em hexadecimal
+        output_type (str): O formato de saída das chaves ["hex", "pem"]. No formato `pem`, a chave privada é escrita no formato PKCS#1, lido pelo OpenSSL
+    """
+    # Se o tipo de output for `pem`, realiza o encode em base64 dos bytes DER
+    if output_type == 'pem':
+        from rsa.utils.decode_rsa_key import to_pkcs1_private_key
+
+        private_key = _pem_body(
+            to_pkcs1_private_key(bytes.fromhex(private_key))
+        )
+        public_key = _pem_body(bytes.fromhex(public_key))
+
+    # Define a extensão que será utilizada para o arquivo da chave
+    extension = 'pem' if output_type == 'pem' else 'txt'
+
+    # Dicionário com relação arquivo: conteúdo
+    keys_files = {
+        f'{file_prefix}_private_key.{extension}': str(private_key),
+        f'{file_prefix}_public_key.{extension}': str(public_key),
+    }
+
+    # Realiza a escrita das chaves
+    for file, content in keys_files.items():
+        write_key_file(
+            key_file_path=key_file_path,
+            key_filename=file,
+            content=content,
+            key_type='private' if 'private' in file else 'public',
+        )
+
+
 def write_file(path: str, filename: str, content: str) -> dict[str, str]:
     """
     Realiza a escrita de arquivos para a saída do CLI
@@ -97,3 +166,83 @@ def write_file(path: str, filename: str, content: str) -> dict[str, str]:
     except Exception as e:
         log.error(f'Erro para escrever no arquivo {filename}: {e}')
         return {'nok': str(e)}
+
+
+@contextmanager
+def _open_output(path: str, filename: str) -> Iterator[BinaryIO]:
+    """
+    Função privada que abre o arquivo de saída em modo binário, criando o diretório, ou retorna a
+    saída padrão se `filename` for '-' (sem criar o diretório).
+    """
+    if filename == STDIO:
+        log.info('Escrevendo conteúdo na saída padrão')
+        yield sys.stdout.buffer
+        sys.stdout.buffer.flush()
+        return
+
+    _create_dir(path=path)
+
+    absolute_path = os.path.join(path, filename)
+
+    log.info(f'Escrevendo conteúdo em {absolute_path}')
+    with open(absolute_path, 'wb') as file:
+        yield file
+
+
+def write_stream(
+    path: str, filename: str, chunks: Iterable[bytes]
+) -> dict[str, str]:
+    """
+    Realiza a escrita incremental de arquivos para a saída do CLI, em modo binário.
+
+    Cada bloco é escrito assim que é gerado, sem manter o conteúdo inteiro em memória. Na saída
+    padrão, cada bloco é enviado imediatamente (flush), para o próximo comando do pipeline.
+
+    Arguments:
+        path (str): O diretório onde o arquivo será criado
+        filename (str): O nome do arquivo, ou '-' para a saída padrão
+        chunks (Iterable[bytes]): Os blocos que serão escritos no arquivo.
+
+    Returns:
+        Um dicionário com mensagem de falha ou sucesso
+    """
+    with _open_output(path=path, filename=filename) as file:
+        for chunk in chunks:
+            file.write(chunk)
+            if filename == STDIO:
+                file.flush()
+    log.info('Conteúdo escrito com sucesso!')
+    return {'ok': 'success'}
+
+
+def write_container_file(
+    path: str,
+    filename: str,
+    fingerprint: bytes,
+    block_size: int,
+    criptograms: Iterable[int],
+) -> dict[str, str]:
+    """
+    Realiza a escrita incremental dos criptogramas no formato binário (ver `rsa.utils.container`).
+
+    Na saída padrão, que não permite `seek`, a quantidade de blocos não é registrada no cabeçalho.
+
+    Arguments:
+        path (str): O diretório onde o arquivo será criado
+        filename (str): O nome do arquivo, ou '-' para a saída padrão
+        fingerprint (bytes): O fingerprint da chave utilizada na cifração
+        block_size (int): O tamanho de cada bloco, em bytes
+        criptograms (Iterable[int]): Os criptogramas, em ordem
+
+    Returns:
+        Um dicionário com mensagem de falha ou sucesso
+    """
+    with _open_output(path=path, filename=filename) as file:
+        count = write_container(
+            output=file,
+            fingerprint=fingerprint,
+            block_size=block_size,
+            criptograms=criptograms,
+        )
+    log.info(f'{count} blocos escritos com sucesso!')
+    return {'ok': 'success'}
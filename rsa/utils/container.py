@@ -0,0 +1,164 @@
+"""
+Formato binário para os criptogramas cifrados por blocos.
+
+Cabeçalho (big-endian, 49 bytes):
+
+| Campo        | Tamanho  | Descrição                                               |
+|--------------|----------|---------------------------------------------------------|
+| magic        | 4 bytes  | `RSAC`                                                  |
+| version      | 1 byte   | Versão do formato                                       |
+| fingerprint  | 32 bytes | SHA-256 do módulo da chave (`RSAPublicKey.fingerprint`) |
+| block_size   | 4 bytes  | Tamanho de cada bloco, em bytes (tamanho do módulo)     |
+| block_count  | 8 bytes  | Quantidade de blocos, ou `UNKNOWN_COUNT`                |
+
+Em seguida, os blocos cifrados com `block_size` bytes cada, em big-endian.
+"""
+from struct import Struct
+from typing import BinaryIO, Iterable, Iterator, NamedTuple
+
+MAGIC = b'RSAC'
+VERSION = 1
+
+# Utilizado quando a saída não permite voltar ao cabeçalho (ex: stdout)
+UNKNOWN_COUNT = 2**64 - 1
+
+# Quantidade de blocos escritos ou lidos por vez
+BATCH_BLOCKS = 256
+
+_HEADER = Struct('>4sB32sIQ')
+HEADER_SIZE = _HEADER.size
+
+
+class ContainerHeader(NamedTuple):
+    fingerprint: bytes
+    block_size: int
+    block_count: int
+
+
+def is_container(prefix: bytes) -> bool:
+    """
+    Verifica se os primeiros bytes de um arquivo correspondem ao formato binário.
+
+    Arguments:
+        prefix (bytes): Os primeiros bytes do arquivo
+
+    Returns:
+        bool: True se o arquivo estiver no formato binário
+
+    Examples:
+        >>> is_container(b'RSAC\\x01')
+        True
+
+        >>> is_container(b'12345')
+        False
+    """
+    return prefix[: len(MAGIC)] == MAGIC
+
+
+def write_container(
+    output: BinaryIO,
+    fingerprint: bytes,
+    block_size: int,
+    criptograms: Iterable[int],
+) -> int:
+    """
+    Escreve os criptogramas no formato binário, de forma incremental.
+
+    Os blocos são convertidos com `int.to_bytes` para um buffer pré-alocado de `BATCH_BLOCKS` blocos,
+    escrito de uma única vez. Se `output` permitir `seek`, a quantidade de blocos é atualizada no
+    cabeçalho ao final, caso contrário permanece `UNKNOWN_COUNT`.
+
+    Arguments:
+        output (BinaryIO): O arquivo de saída, aberto em modo binário
+        fingerprint (bytes): O fingerprint da chave utilizada na cifração
+        block_size (int): O tamanho de cada bloco, em bytes
+        criptograms (Iterable[int]): Os criptogramas, em ordem
+
+    Returns:
+        int: A quantidade de blocos escritos
+    """
+    seekable = output.seekable()
+    start = output.tell() if seekable else 0
+    output.write(
+        _HEADER.pack(MAGIC, VERSION, fingerprint, block_size, UNKNOWN_COUNT)
+    )
+
+    buffer = bytearray(block_size * BATCH_BLOCKS)
+    view = memoryview(buffer)
+    count = filled = 0
+    for criptogram in criptograms:
+        offset = filled * block_size
+        view[offset : offset + block_size] = criptogram.to_bytes(
+            block_size, 'big'
+        )
+        filled += 1
+        count += 1
+        if filled == BATCH_BLOCKS:
+            output.write(view)
+            filled = 0
+    output.write(view[: filled * block_size])
+
+    if seekable:
+        end = output.tell()
+        output.seek(start)
+        output.write(
+            _HEADER.pack(MAGIC, VERSION, fingerprint, block_size, count)
+        )
+        output.seek(end)
+    return count
+
+
+def read_header(source: BinaryIO) -> ContainerHeader:
+    """
+    Realiza a leitura do cabeçalho do formato binário.
+
+    Arguments:
+        source (BinaryIO): O arquivo, aberto em modo binário, posicionado no início do cabeçalho
+
+    Returns:
+        ContainerHeader: O fingerprint, o tamanho dos blocos e a quantidade de blocos
+
+    Raises:
+        ValueError: Se o cabeçalho for inválido, ou de uma versão não suportada
+    """
+    data = source.read(HEADER_SIZE)
+    if len(data) < HEADER_SIZE or not is_container(data):
+        raise ValueError('O arquivo não está no formato binário esperado!')
+
+    _, version, fingerprint, block_size, block_count = _HEADER.unpack(data)
+    if version != VERSION:
+        raise ValueError(
+            f'Versão {version} do formato binário não é suportada!'
+        )
+    return ContainerHeader(fingerprint, block_size, block_count)
+
+
+def read_blocks(source: BinaryIO, header: ContainerHeader) -> Iterator[int]:
+    """
+    Realiza a leitura dos criptogramas após o cabeçalho, `BATCH_BLOCKS` blocos por vez.
+
+    Arguments:
+        source (BinaryIO): O arquivo, posicionado após o cabeçalho
+        header (ContainerHeader): O cabeçalho lido com `read_header`
+
+    Returns:
+        Iterator[int]: Os criptogramas, em ordem
+
+    Raises:
+        ValueError: Se o arquivo terminar no meio de um bloco
+    """
+    block_size = header.block_size
+    count = 0
+    while True:
+        data = source.read(block_size * BATCH_BLOCKS)
+        if not data:
+            break
+        if len(data) % block_size:
+            raise ValueError('O arquivo binário está truncado!')
+        view = memoryview(data)
+        for offset in range(0, len(data), block_size):
+            yield int.from_bytes(view[offset : offset + block_size], 'big')
+        count += len(data) // block_size
+
+    if header.block_count not in (UNKNOWN_COUNT, count):
+        raise ValueError('O arquivo binário está truncado!')
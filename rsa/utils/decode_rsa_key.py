@@ -1,19 +1,123 @@
-from pyasn1.codec.der.decoder import decode
+from typing import Dict
 
-from rsa.utils.der.DataTypes.PrivateKey import PrivateKeyRSA
+from pyasn1.error import PyAsn1Error
 
+from rsa.utils.der.codec import PKCS1_FIELDS
+from rsa.utils.der.codec import decode_private_key as decode_der_private_key
+from rsa.utils.der.codec import encode_sequence
+from rsa.utils.ModArith import inv_mod
 
-def decode_private_key(private_key_bytes: bytes):
+# Nomes dos campos da chave PKCS#1 do OpenSSL (ver `PrivateKeyRSA`)
+PKCS1_NAMES = (
+    'version',
+    'modulus',
+    'publicExponent',
+    'privateExponent',
+    'prime1',
+    'prime2',
+    'exponent1',
+    'exponent2',
+    'coefficient',
+)
+
+
+def decode_private_key(private_key_bytes: bytes) -> Dict[str, int]:
     """
-    Função utilizada para fazer o Decode de uma chave RSA privada.
+    Função utilizada para fazer o Decode de uma chave RSA privada PKCS#1 do OpenSSL.
 
     Arguments:
         private_key_bytes (bytes): A chave privada, em bytes.
 
     Returns:
-        A chave privada decodificada.
+        Dict[str, int]: Os campos da chave decodificada, com os nomes do PKCS#1
+
+    Raises:
+        PyAsn1Error: Se a chave não for uma chave PKCS#1
+    """
+    infos = decode_der_private_key(private_key_bytes)
+    if tuple(infos) != PKCS1_FIELDS:
+        raise PyAsn1Error('A chave não está no formato PKCS#1 esperado!')
+    return dict(zip(PKCS1_NAMES, infos.values()))
+
+
+def decode_crt_private_key(private_key_bytes: bytes) -> Dict[str, int]:
+    """
+    Função utilizada para fazer o Decode de uma chave RSA privada, retornando os valores
+    utilizados na decifração via Teorema Chinês do Resto (CRT).
+
+    São aceitas as chaves do projeto, com ou sem os valores pré-computados do CRT, e as
+    chaves PKCS#1 do OpenSSL. Para as chaves sem os valores pré-computados, eles são calculados.
+
+    Arguments:
+        private_key_bytes (bytes): A chave privada codificada em DER, em bytes.
+
+    Returns:
+        Dict[str, int]: Um dicionário com 'n', 'd', 'p', 'q', 'dp', 'dq' e 'qinv'
+
+    Raises:
+        PyAsn1Error: Se a chave não estiver em nenhum dos formatos aceitos
+    """
+    decoded = decode_der_private_key(private_key_bytes)
+    infos = {
+        name: decoded[name]
+        for name in ('n', 'd', 'p', 'q', 'dp', 'dq', 'qinv')
+        if name in decoded
+    }
+
+    if 'dp' not in infos:
+        infos.update(crt_params(d=infos['d'], p=infos['p'], q=infos['q']))
+    return infos
+
+
+def crt_params(d: int, p: int, q: int) -> Dict[str, int]:
+    """
+    Calcula os valores pré-computados da decifração via CRT.
+
+    Arguments:
+        d (int): O expoente privado
+        p (int): O primeiro primo da chave
+        q (int): O segundo primo da chave
+
+    Returns:
+        Dict[str, int]: 'dp' = d mod (p - 1), 'dq' = d mod (q - 1) e 'qinv' = q^-1 mod p
+
+    Examples:
+        >>> crt_params(d=2753, p=61, q=53)
+        {'dp': 53, 'dq': 49, 'qinv': 38}
+    """
+    return {
+        'dp': d % (p - 1),
+        'dq': d % (q - 1),
+        'qinv': inv_mod(num=q % p, mod=p),
+    }
+
+
+def to_pkcs1_private_key(private_key_bytes: bytes) -> bytes:
     """
-    decoded_priv_key, _ = decode(
-        substrate=private_key_bytes, asn1Spec=PrivateKeyRSA()
-    )
-    return decoded_priv_key
+    Converte uma chave privada do projeto para o formato PKCS#1 (`PrivateKeyRSA`), lido pelo
+    OpenSSL. O expoente público, que não faz parte da chave do projeto, é o inverso de 'd' módulo
+    'phi'. As chaves que já estão no formato PKCS#1 são retornadas sem alteração.
+
+    Arguments:
+        private_key_bytes (bytes): A chave privada codificada em DER, em bytes.
+
+    Returns:
+        bytes: A chave privada PKCS#1 codificada em DER
+
+    Raises:
+        PyAsn1Error: Se a chave não estiver em nenhum dos formatos aceitos
+
+    Examples:
+        >>> from rsa.utils.der.codec import encode_private_key
+        >>> der = encode_private_key(n=3233, d=2753, p=61, q=53, phi=3120)
+        >>> decode_private_key(to_pkcs1_private_key(der))['publicExponent']
+        17
+    """
+    infos = decode_der_private_key(private_key_bytes)
+    if tuple(infos) == PKCS1_FIELDS:
+        return bytes(private_key_bytes)
+
+    if 'dp' not in infos:
+        infos.update(crt_params(d=infos['d'], p=infos['p'], q=infos['q']))
+    infos.update(version=0, e=inv_mod(num=infos['d'], mod=infos['phi']))
+    return encode_sequence([infos[name] for name in PKCS1_FIELDS])
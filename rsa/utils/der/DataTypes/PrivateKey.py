@@ -1,14 +1,25 @@
-from pyasn1.type.namedtype import NamedType, NamedTypes
+from pyasn1.type.namedtype import NamedType, NamedTypes, OptionalNamedType
 from pyasn1.type.univ import Integer, Sequence
 
 
+class CRTParams(Sequence):
+    componentType = NamedTypes(
+        NamedType('exponent1', Integer()),
+        NamedType('exponent2', Integer()),
+        NamedType('coefficient', Integer()),
+    )
+
+
 class PrivateKey(Sequence):
+    # O componente opcional 'crt' (valores pré-computados para a decifração via CRT)
+    # está presente somente nas chaves geradas a partir da versão com suporte ao CRT
     componentType = NamedTypes(
         NamedType('modulus', Integer()),
         NamedType('private_expoent', Integer()),
         NamedType('p', Integer()),
         NamedType('q', Integer()),
         NamedType('phi', Integer()),
+        OptionalNamedType('crt', CRTParams()),
     )
 
 
@@ -0,0 +1,320 @@
+"""
+Codec DER nativo das estruturas de chaves do projeto: SEQUENCEs de INTEGERs (`PublicKey`,
+`PrivateKey`, com a SEQUENCE opcional `crt`, e `PrivateKeyRSA`, o PKCS#1 do OpenSSL).
+
+A codificação é idêntica, byte a byte, à do `pyasn1`. A decodificação percorre um `memoryview`
+dos bytes, sem cópias, e aceita somente DER estrito (comprimentos e inteiros positivos na forma
+mínima); as entradas fora do DER estrito (ex.: BER de outras ferramentas) são decodificadas pelo
+`pyasn1`, mantido como alternativa.
+"""
+from typing import Dict, List, Sequence, Tuple, Union
+
+# Tags das estruturas suportadas
+INTEGER = 0x02
+SEQUENCE = 0x30
+
+# Campos de cada estrutura, na ordem da SEQUENCE
+PUBLIC_KEY_FIELDS = ('n', 'e')
+PRIVATE_KEY_FIELDS = ('n', 'd', 'p', 'q', 'phi')
+CRT_FIELDS = ('dp', 'dq', 'qinv')
+PKCS1_FIELDS = ('version', 'n', 'e', 'd', 'p', 'q', 'dp', 'dq', 'qinv')
+
+Bytes = Union[bytes, bytearray, memoryview]
+Values = List[Union[int, 'Values']]
+
+
+class DERError(ValueError):
+    """
+    Erro de decodificação: a entrada não é uma estrutura suportada em DER estrito.
+    """
+
+
+def _encode_length(length: int) -> bytes:
+    """
+    Função privada que codifica o comprimento, na forma curta (até 127) ou na forma longa mínima.
+    """
+    if length < 0x80:
+        return bytes((length,))
+    size = (length.bit_length() + 7) // 8
+    return bytes((0x80 | size,)) + length.to_bytes(size, 'big')
+
+
+def _encode_integer(value: int) -> bytes:
+    """
+    Função privada que codifica um INTEGER, em complemento de dois. Como no `pyasn1`, as potências
+    de 2 negativas recebem um byte a mais (ex.: -128 é codificado como 'ff80').
+    """
+    content = value.to_bytes(
+        abs(value).bit_length() // 8 + 1, 'big', signed=True
+    )
+    return bytes((INTEGER,)) + _encode_length(len(content)) + content
+
+
+def encode_sequence(values: Sequence[Union[int, Sequence]]) -> bytes:
+    """
+    Codifica uma SEQUENCE de INTEGERs, com SEQUENCEs aninhadas para os itens que são sequências.
+
+    Arguments:
+        values (Sequence[Union[int, Sequence]]): Os inteiros, ou sequências de inteiros
+
+    Returns:
+        bytes: A SEQUENCE codificada em DER
+
+    Examples:
+        >>> encode_sequence([3233, 17]).hex()
+        '300702020ca1020111'
+
+        >>> encode_sequence([128, [0, -1]]).hex()
+        '300c0202008030060201000201ff'
+    """
+    content = b''.join(
+        _encode_integer(value)
+        if isinstance(value, int)
+        else encode_sequence(value)
+        for value in values
+    )
+    return bytes((SEQUENCE,)) + _encode_length(len(content)) + content
+
+
+def _read_header(data: memoryview, offset: int) -> Tuple[int, int, int]:
+    """
+    Função privada que lê a tag e o comprimento na posição `offset`, validando a forma mínima.
+
+    Returns:
+        Tuple[int, int, int]: A tag, o início e o fim do conteúdo
+    """
+    if offset + 2 > len(data):
+        raise DERError('Estrutura DER truncada')
+
+    tag, length = data[offset], data[offset + 1]
+    offset += 2
+    if length & 0x80:
+        size = length & 0x7F
+        if size == 0 or offset + size > len(data) or data[offset] == 0:
+            raise DERError('Comprimento DER inválido')
+        length = int.from_bytes(data[offset : offset + size], 'big')
+        if length < 0x80:
+            raise DERError('Comprimento DER fora da forma mínima')
+        offset += size
+
+    end = offset + length
+    if end > len(data):
+        raise DERError('Estrutura DER truncada')
+    return tag, offset, end
+
+
+def _decode_items(data: memoryview, start: int, end: int) -> Values:
+    """
+    Função privada que decodifica os itens do conteúdo de uma SEQUENCE.
+    """
+    values: Values = []
+    offset = start
+    while offset < end:
+        tag, content, offset = _read_header(data[:end], offset)
+        if tag == INTEGER:
+            if content == offset:
+                raise DERError('INTEGER sem conteúdo')
+            # Zeros à esquerda desnecessários (os negativos seguem o `_encode_integer`)
+            if (
+                offset - content > 1
+                and data[content] == 0x00
+                and data[content + 1] < 0x80
+            ):
+                raise DERError('INTEGER fora da forma mínima')
+            values.append(
+                int.from_bytes(data[content:offset], 'big', signed=True)
+            )
+        elif tag == SEQUENCE:
+            values.append(_decode_items(data, content, offset))
+        else:
+            raise DERError(f'Tag DER não suportada: {tag:#04x}')
+    return values
+
+
+def decode_sequence(data: Bytes) -> Tuple[Values, memoryview]:
+    """
+    Decodifica uma SEQUENCE de INTEGERs (e de SEQUENCEs aninhadas), sem copiar os bytes.
+
+    Arguments:
+        data (Bytes): Os bytes DER
+
+    Returns:
+        Tuple[Values, memoryview]: Os valores, e os bytes após a SEQUENCE
+
+    Raises:
+        DERError: Se a entrada não for uma SEQUENCE de INTEGERs em DER estrito
+
+    Examples:
+        >>> values, rest = decode_sequence(bytes.fromhex('300c0202008030060201000201ff'))
+        >>> values, bytes(rest)
+        ([128, [0, -1]], b'')
+    """
+    view = memoryview(data)
+    tag, start, end = _read_header(view, 0)
+    if tag != SEQUENCE:
+        raise DERError('A estrutura DER não é uma SEQUENCE')
+    return _decode_items(view, start, end), view[end:]
+
+
+def _is_integers(values: Values, count: int) -> bool:
+    """
+    Função privada que verifica se `values` possui exatamente `count` inteiros.
+    """
+    return len(values) == count and all(
+        isinstance(value, int) for value in values
+    )
+
+
+def encode_public_key(n: int, e: int) -> bytes:
+    """
+    Codifica a chave pública do projeto (`PublicKey`).
+
+    Arguments:
+        n (int): O módulo
+        e (int): O expoente público
+
+    Returns:
+        bytes: A chave codificada em DER
+
+    Examples:
+        >>> encode_public_key(n=3233, e=17).hex()
+        '300702020ca1020111'
+    """
+    return encode_sequence((n, e))
+
+
+def encode_private_key(
+    n: int, d: int, p: int, q: int, phi: int, **crt: int
+) -> bytes:
+    """
+    Codifica a chave privada do projeto (`PrivateKey`), com a SEQUENCE `crt` se os valores
+    pré-computados 'dp', 'dq' e 'qinv' forem informados.
+
+    Arguments:
+        n (int): O módulo
+        d (int): O expoente privado
+        p (int): O primeiro primo
+        q (int): O segundo primo
+        phi (int): O totiente de Euler do módulo
+        crt (int): Os valores 'dp', 'dq' e 'qinv' (ver `rsa.utils.decode_rsa_key.crt_params`)
+
+    Returns:
+        bytes: A chave codificada em DER
+    """
+    values: List = [n, d, p, q, phi]
+    if crt:
+        values.append([crt[name] for name in CRT_FIELDS])
+    return encode_sequence(values)
+
+
+def decode_public_key(data: Bytes) -> Dict[str, int]:
+    """
+    Decodifica a chave pública do projeto (`PublicKey`), com o `pyasn1` como alternativa para as
+    entradas fora do DER estrito.
+
+    Arguments:
+        data (Bytes): A chave codificada em DER
+
+    Returns:
+        Dict[str, int]: O módulo 'n' e o expoente público 'e'
+
+    Raises:
+        PyAsn1Error: Se a chave não for uma `PublicKey`
+
+    Examples:
+        >>> decode_public_key(bytes.fromhex('300702020ca1020111'))
+        {'n': 3233, 'e': 17}
+    """
+    try:
+        values, _ = decode_sequence(data)
+        if not _is_integers(values, len(PUBLIC_KEY_FIELDS)):
+            raise DERError('A estrutura DER não é uma chave pública')
+    except DERError:
+        return _pyasn1_public_key(data)
+    return dict(zip(PUBLIC_KEY_FIELDS, values))
+
+
+def decode_private_key(data: Bytes) -> Dict[str, int]:
+    """
+    Decodifica uma chave privada: do projeto (`PrivateKey`, com ou sem a SEQUENCE `crt`) ou
+    PKCS#1 do OpenSSL (`PrivateKeyRSA`), com o `pyasn1` como alternativa para as entradas fora do
+    DER estrito.
+
+    Arguments:
+        data (Bytes): A chave codificada em DER
+
+    Returns:
+        Dict[str, int]: Os campos da chave: `PRIVATE_KEY_FIELDS` (e `CRT_FIELDS`, se presentes) ou `PKCS1_FIELDS`
+
+    Raises:
+        PyAsn1Error: Se a chave não estiver em nenhum dos formatos
+
+    Examples:
+        >>> der = encode_private_key(n=3233, d=2753, p=61, q=53, phi=3120)
+        >>> decode_private_key(der)
+        {'n': 3233, 'd': 2753, 'p': 61, 'q': 53, 'phi': 3120}
+    """
+    try:
+        values, _ = decode_sequence(data)
+    except DERError:
+        return _pyasn1_private_key(data)
+
+    if _is_integers(values, len(PKCS1_FIELDS)):
+        return dict(zip(PKCS1_FIELDS, values))
+
+    size = len(PRIVATE_KEY_FIELDS)
+    if _is_integers(values[:size], size) and (
+        len(values) == size
+        or (
+            len(values) == size + 1
+            and isinstance(values[size], list)
+            and _is_integers(values[size], len(CRT_FIELDS))
+        )
+    ):
+        infos = dict(zip(PRIVATE_KEY_FIELDS, values))
+        if len(values) > size:
+            infos.update(zip(CRT_FIELDS, values[size]))
+        return infos
+    return _pyasn1_private_key(data)
+
+
+def _pyasn1_public_key(data: Bytes) -> Dict[str, int]:
+    """
+    Função privada que decodifica a chave pública com o `pyasn1`.
+    """
+    from pyasn1.codec.der.decoder import decode
+
+    from rsa.utils.der.DataTypes.PublicKey import PublicKey
+
+    pub_key, _ = decode(bytes(data), asn1Spec=PublicKey())
+    return {
+        'n': int(pub_key['modulus']),
+        'e': int(pub_key['public_expoent']),
+    }
+
+
+def _pyasn1_private_key(data: Bytes) -> Dict[str, int]:
+    """
+    Função privada que decodifica a chave privada com o `pyasn1`, no formato do projeto ou PKCS#1.
+    """
+    from pyasn1.codec.der.decoder import decode
+    from pyasn1.error import PyAsn1Error
+
+    from rsa.utils.der.DataTypes.PrivateKey import PrivateKey, PrivateKeyRSA
+
+    try:
+        priv_key, _ = decode(bytes(data), asn1Spec=PrivateKey())
+    except PyAsn1Error:
+        priv_key, _ = decode(bytes(data), asn1Spec=PrivateKeyRSA())
+        return dict(zip(PKCS1_FIELDS, map(int, priv_key.values())))
+
+    infos = {
+        'n': int(priv_key['modulus']),
+        'd': int(priv_key['private_expoent']),
+        'p': int(priv_key['p']),
+        'q': int(priv_key['q']),
+        'phi': int(priv_key['phi']),
+    }
+    if priv_key['crt'].isValue:
+        infos.update(zip(CRT_FIELDS, map(int, priv_key['crt'].values())))
+    return infos
@@ -1,11 +1,36 @@
 import logging
 
-from rich.logging import RichHandler
-
 FORMAT = '%(message)s'
 
+
+class LazyRichHandler(logging.Handler):
+    """
+    Handler que importa o `rich` e cria o `RichHandler` somente no primeiro registro de log, de
+    forma que a importação dos módulos do projeto não carrega o `rich`.
+
+    Os registros são escritos na saída de erro, de forma que a saída padrão contém somente o
+    resultado dos comandos (ex.: `rsa cript -` em um pipeline).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._handler = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._handler is None:
+            from rich.console import Console
+            from rich.logging import RichHandler
+
+            self._handler = RichHandler(console=Console(stderr=True))
+            self._handler.setFormatter(self.formatter)
+        self._handler.emit(record)
+
+
 logging.basicConfig(
-    level='NOTSET', format=FORMAT, datefmt='[%X]', handlers=[RichHandler()]
+    level='NOTSET',
+    format=FORMAT,
+    datefmt='[%X]',
+    handlers=[LazyRichHandler()],
 )
 
 log = logging.getLogger('rich')
@@ -0,0 +1,264 @@
+"""
+Contadores e cronômetros das operações críticas (geração de primos, testes de primalidade, inverso
+modular, DER, cifração e decifração), desligados por padrão.
+
+Fora de um bloco `collect`, `incr` e as funções decoradas com `timed` custam somente a verificação
+de uma variável global. As métricas são coletadas no processo atual; as operações executadas pelos
+processos de um pool (`workers` maior que 1) não são contabilizadas.
+
+Examples:
+    >>> from rsa.utils.GenPrimeNumber import generate_prime
+    >>> with collect() as metrics:
+    ...     _ = generate_prime(nbit=128)
+    >>> metrics.calls['prime.generate']
+    1
+"""
+import cProfile
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from math import ceil, log2
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+class Metrics:
+    """
+    Os contadores e os tempos acumulados durante um bloco `collect`.
+
+    Attributes:
+        counters (Counter): Os contadores, por nome (ex.: 'modexp', 'miller_rabin.rounds')
+        calls (Counter): Quantidade de chamadas de cada operação cronometrada
+        seconds (Dict[str, float]): Tempo total, em segundos, de cada operação cronometrada
+    """
+
+    def __init__(self):
+        self.counters: Counter = Counter()
+        self.calls: Counter = Counter()
+        self.seconds: Dict[str, float] = {}
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """
+        Acumula uma chamada de `seconds` segundos da operação `name`.
+
+        Arguments:
+            name (str): O nome da operação
+            seconds (float): A duração da chamada
+        """
+        self.calls[name] += 1
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retorna as métricas em um dicionário, para serialização.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Os contadores e, para cada operação, as chamadas e o tempo total
+
+        Examples:
+            >>> metrics = Metrics()
+            >>> metrics.counters['modexp'] += 3
+            >>> metrics.add_time('rsa.cript', 0.5)
+            >>> metrics.as_dict()
+            {'counters': {'modexp': 3}, 'timers': {'rsa.cript': {'calls': 1, 'seconds': 0.5}}}
+        """
+        return {
+            'counters': dict(self.counters),
+            'timers': {
+                name: {'calls': self.calls[name], 'seconds': seconds}
+                for name, seconds in self.seconds.items()
+            },
+        }
+
+    def summary(self) -> List[str]:
+        """
+        Retorna o resumo das métricas, uma linha por contador e por operação cronometrada.
+
+        Returns:
+            List[str]: As linhas do resumo, em ordem alfabética
+
+        Examples:
+            >>> metrics = Metrics()
+            >>> metrics.counters['modexp'] += 3
+            >>> metrics.add_time('rsa.cript', 0.5)
+            >>> metrics.summary()
+            ['modexp = 3', 'rsa.cript: 1 chamadas, 500.000 ms']
+        """
+        lines = [
+            f'{name} = {value}'
+            for name, value in sorted(self.counters.items())
+        ]
+        lines += [
+            f'{name}: {self.calls[name]} chamadas, {seconds * 1000:.3f} ms'
+            for name, seconds in sorted(self.seconds.items())
+        ]
+        return lines
+
+
+class Histogram:
+    """
+    Histograma de latências com memória constante, para processos de longa duração (ver
+    `rsa.core.RSAServer`). As durações são agrupadas em buckets logarítmicos, `BUCKETS_PER_OCTAVE`
+    por potência de 2, e os percentis são o limite superior do bucket, com erro de até 19%.
+
+    Attributes:
+        buckets (Counter): Quantidade de durações de cada bucket
+        count (int): Quantidade de durações
+        total (float): Soma das durações, em segundos
+        max (float): A maior duração, em segundos
+
+    Examples:
+        >>> histogram = Histogram()
+        >>> for ms in range(1, 101):
+        ...     histogram.add(ms / 1000)
+        >>> round(histogram.percentile(0.5) * 1000, 1), histogram.max
+        (55.1, 0.1)
+    """
+
+    BUCKETS_PER_OCTAVE = 4
+
+    # Menor duração registrada, em segundos (1 µs)
+    RESOLUTION = 1e-6
+
+    def __init__(self):
+        self.buckets: Counter = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        """
+        Registra uma duração.
+
+        Arguments:
+            seconds (float): A duração, em segundos
+        """
+        index = ceil(
+            log2(max(seconds, self.RESOLUTION) / self.RESOLUTION)
+            * self.BUCKETS_PER_OCTAVE
+        )
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Retorna o percentil das durações (ex.: 0.99 para o p99).
+
+        Arguments:
+            fraction (float): O percentil, entre 0 e 1
+
+        Returns:
+            float: O limite superior do bucket do percentil, em segundos (0 sem durações)
+        """
+        rank = fraction * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                upper = self.RESOLUTION * 2 ** (
+                    index / self.BUCKETS_PER_OCTAVE
+                )
+                return min(upper, self.max)
+        return 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Retorna o resumo do histograma, para serialização.
+
+        Returns:
+            Dict[str, float]: A quantidade, o p50, o p99, a média e o máximo, em segundos
+        """
+        return {
+            'count': self.count,
+            'p50': self.percentile(0.5),
+            'p99': self.percentile(0.99),
+            'mean': self.total / self.count if self.count else 0.0,
+            'max': self.max,
+        }
+
+
+# As métricas do bloco `collect` ativo, ou None quando a coleta está desligada
+_current: Optional[Metrics] = None
+
+
+@contextmanager
+def collect() -> Iterator[Metrics]:
+    """
+    Liga a coleta das métricas durante o bloco. Os blocos podem ser aninhados; cada bloco recebe
+    somente as métricas das operações executadas dentro dele.
+
+    Returns:
+        Iterator[Metrics]: As métricas coletadas no bloco
+    """
+    global _current
+    previous, _current = _current, Metrics()
+    try:
+        yield _current
+    finally:
+        _current = previous
+
+
+def incr(name: str, value: int = 1) -> None:
+    """
+    Incrementa um contador, se a coleta estiver ligada.
+
+    Arguments:
+        name (str): O nome do contador
+        value (int): O valor do incremento
+    """
+    if _current is not None:
+        _current.counters[name] += value
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """
+    Decorador que cronometra as chamadas da função, se a coleta estiver ligada.
+
+    Arguments:
+        name (str): O nome da operação
+
+    Returns:
+        Callable[[F], F]: O decorador
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics = _current
+            if metrics is None:
+                return func(*args, **kwargs)
+
+            begin = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.add_time(name, perf_counter() - begin)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextmanager
+def profiling(path: str) -> Iterator[cProfile.Profile]:
+    """
+    Executa o bloco com o `cProfile` e salva o perfil em `path`, para leitura com `pstats` ou
+    ferramentas como o `snakeviz`.
+
+    Arguments:
+        path (str): O arquivo onde o perfil será salvo
+
+    Returns:
+        Iterator[cProfile.Profile]: O profiler do bloco
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
@@ -0,0 +1,76 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def batched(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Agrupa os itens de `iterable` em listas de até `size` itens.
+
+    Arguments:
+        iterable (Iterable[T]): Os itens
+        size (int): A quantidade máxima de itens por lista
+
+    Returns:
+        Iterator[List[T]]: As listas de itens, em ordem
+
+    Examples:
+        >>> list(batched(range(5), 2))
+        [[0, 1], [2, 3], [4]]
+    """
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def ordered_map(
+    func: Callable[[List[T]], List[R]],
+    iterable: Iterable[T],
+    workers: int,
+    chunk_size: int = 64,
+    max_in_flight: Optional[int] = None,
+    initializer: Optional[Callable] = None,
+    initargs: Tuple = (),
+) -> Iterator[R]:
+    """
+    Aplica `func` a lotes de `chunk_size` itens em um pool de `workers` processos.
+
+    Os lotes são processados fora de ordem pelos processos, mas os resultados são retornados na
+    ordem original. No máximo `max_in_flight` lotes (por padrão `2 * workers`) ficam em andamento,
+    de forma que a memória utilizada não depende do tamanho de `iterable`.
+
+    Arguments:
+        func (Callable[[List[T]], List[R]]): Função, de nível de módulo, aplicada a cada lote
+        iterable (Iterable[T]): Os itens que serão processados
+        workers (int): Quantidade de processos
+        chunk_size (int): Quantidade de itens por lote
+        max_in_flight (Optional[int]): Quantidade máxima de lotes em andamento
+        initializer (Optional[Callable]): Função executada ao iniciar cada processo
+        initargs (Tuple): Argumentos de `initializer`
+
+    Returns:
+        Iterator[R]: Os resultados, na ordem dos itens
+    """
+    max_in_flight = max_in_flight or 2 * workers
+    batches = batched(iterable, chunk_size)
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as executor:
+        pending = deque(
+            executor.submit(func, batch)
+            for batch in islice(batches, max_in_flight)
+        )
+        while pending:
+            results = pending.popleft().result()
+            # Repõe o lote retirado antes de retornar os resultados
+            for batch in islice(batches, 1):
+                pending.append(executor.submit(func, batch))
+            yield from results
@@ -0,0 +1,198 @@
+"""
+Protocolo do servidor do `rsa` (`rsa serve`), sobre um socket Unix.
+
+Cada mensagem é um frame: o tamanho do corpo (4 bytes, big-endian) seguido do corpo, um objeto
+JSON em UTF-8. As requisições possuem um 'id', escolhido pelo cliente, e a operação ('op'); as
+respostas possuem o mesmo 'id' e o 'result' ou o 'error' da operação. Os bytes são enviados em
+hexadecimal.
+
+O cliente pode enviar várias requisições sem esperar as respostas (pipelining); as respostas são
+enviadas assim que cada operação termina, não necessariamente na ordem das requisições.
+
+Examples:
+    >>> frame = encode_frame({'id': 1, 'op': 'stats'})
+    >>> frame[:HEADER.size], decode_body(frame[HEADER.size:])
+    (b'\\x00\\x00\\x00\\x15', {'id': 1, 'op': 'stats'})
+"""
+import json
+import os
+import stat
+import tempfile
+from asyncio import StreamReader
+from struct import Struct
+from typing import Any, BinaryIO, Dict
+
+# O tamanho do corpo de cada frame
+HEADER = Struct('>I')
+
+# Tamanho máximo do corpo de um frame, em bytes
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+# O diretório do socket padrão, um por usuário, acessível somente pelo usuário (ver `secure_socket_dir`)
+SOCKET_DIR = (
+    os.path.join(os.environ['XDG_RUNTIME_DIR'], 'rsa')
+    if os.environ.get('XDG_RUNTIME_DIR')
+    else os.path.join(tempfile.gettempdir(), f'rsa-{os.getuid()}')
+)
+
+# O socket padrão do servidor
+DEFAULT_SOCKET = os.path.join(SOCKET_DIR, 'rsa.sock')
+
+
+class ProtocolError(ValueError):
+    """
+    Erro de protocolo: frame maior que `MAX_FRAME_SIZE`, ou corpo que não é um objeto JSON.
+    """
+
+
+class ServerError(RuntimeError):
+    """
+    Erro retornado pelo servidor na resposta de uma requisição.
+    """
+
+
+def encode_frame(message: Dict[str, Any]) -> bytes:
+    """
+    Codifica uma mensagem em um frame.
+
+    Arguments:
+        message (Dict[str, Any]): A mensagem
+
+    Returns:
+        bytes: O frame, com o tamanho e o corpo
+
+    Raises:
+        ProtocolError: Se o corpo for maior que `MAX_FRAME_SIZE`
+    """
+    body = json.dumps(message, separators=(',', ':')).encode()
+    if len(body) > MAX_FRAME_SIZE:
+        raise ProtocolError(
+            f'A mensagem possui {len(body)} bytes, acima do máximo de {MAX_FRAME_SIZE}'
+        )
+    return HEADER.pack(len(body)) + body
+
+
+def decode_body(body: bytes) -> Dict[str, Any]:
+    """
+    Decodifica o corpo de um frame.
+
+    Arguments:
+        body (bytes): O corpo do frame
+
+    Returns:
+        Dict[str, Any]: A mensagem
+
+    Raises:
+        ProtocolError: Se o corpo não for um objeto JSON
+    """
+    try:
+        message = json.loads(body)
+    except ValueError as error:
+        raise ProtocolError(f'Frame inválido: {error}')
+    if not isinstance(message, dict):
+        raise ProtocolError('O frame não possui um objeto JSON')
+    return message
+
+
+def _body_size(header: bytes) -> int:
+    """
+    Função privada que lê o tamanho do corpo no cabeçalho do frame.
+    """
+    (size,) = HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ProtocolError(
+            f'O frame possui {size} bytes, acima do máximo de {MAX_FRAME_SIZE}'
+        )
+    return size
+
+
+async def read_frame(reader: StreamReader) -> Dict[str, Any]:
+    """
+    Lê um frame de um stream do `asyncio`.
+
+    Arguments:
+        reader (StreamReader): O stream
+
+    Returns:
+        Dict[str, Any]: A mensagem
+
+    Raises:
+        IncompleteReadError: Se o stream terminar antes do fim do frame (ou antes do início)
+        ProtocolError: Se o frame for inválido
+    """
+    size = _body_size(await reader.readexactly(HEADER.size))
+    return decode_body(await reader.readexactly(size))
+
+
+def recv_frame(file: BinaryIO) -> Dict[str, Any]:
+    """
+    Lê um frame de um arquivo (ex.: `socket.makefile('rb')`), de forma bloqueante.
+
+    Arguments:
+        file (BinaryIO): O arquivo
+
+    Returns:
+        Dict[str, Any]: A mensagem
+
+    Raises:
+        EOFError: Se o arquivo terminar antes do fim do frame
+        ProtocolError: Se o frame for inválido
+    """
+    header = file.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise EOFError('A conexão foi encerrada pelo servidor')
+    size = _body_size(header)
+    body = file.read(size)
+    if len(body) < size:
+        raise EOFError('A conexão foi encerrada pelo servidor')
+    return decode_body(body)
+
+
+def secure_socket_dir(path: str, create: bool = False) -> str:
+    """
+    Verifica se o diretório de um socket é acessível somente pelo usuário: um diretório (e não um
+    link simbólico) do usuário, sem permissões para o grupo e os demais.
+
+    Arguments:
+        path (str): O diretório
+        create (bool): Se True, o diretório é criado com permissão 0700, caso não exista
+
+    Returns:
+        str: O diretório
+
+    Raises:
+        PermissionError: Se o diretório pertencer a outro usuário, ou permitir o acesso de outros usuários
+    """
+    if create:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise PermissionError(
+            f'O diretório {path} deve pertencer ao usuário e possuir permissão 0700'
+        )
+    return path
+
+
+def remove_socket(path: str) -> None:
+    """
+    Remove um socket, caso exista, deixado por uma execução anterior do servidor.
+
+    Arguments:
+        path (str): O caminho do socket
+
+    Raises:
+        FileExistsError: Se o caminho não for um socket do usuário
+    """
+    try:
+        info = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+        raise FileExistsError(
+            f'O caminho {path} existe e não é um socket do usuário'
+        )
+    os.remove(path)
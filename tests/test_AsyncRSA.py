@@ -0,0 +1,147 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import raises
+
+from rsa.core.AsyncRSA import BATCH_SIZE, AsyncRSA
+from rsa.core.RSA import RSA
+from rsa.core.RSAKey import load_private_key, load_public_key
+from rsa.utils.GenPrimeNumber import generate_prime, generate_rsa_prime
+
+priv, pub = RSA(key_size=256).generate_keys()
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """
+    Executor que registra a quantidade de tarefas submetidas e o máximo de tarefas simultâneas.
+    """
+
+    def __init__(self, max_workers):
+        super().__init__(max_workers=max_workers)
+        self.submitted = 0
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def submit(self, func, *args, **kwargs):
+        self.submitted += 1
+
+        def counted():
+            with self._lock:
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.running -= 1
+
+        return super().submit(counted)
+
+
+def test_chaves_geradas_devem_cifrar_e_decifrar():
+    async def main():
+        async with AsyncRSA(key_size=256, workers=2) as rsa:
+            private_key, public_key = await rsa.generate_keys()
+            criptogram = await rsa.encrypt(public_key, 'mensagem')
+            return (
+                private_key,
+                public_key,
+                await rsa.decrypt(private_key, criptogram, encoding='utf-8'),
+            )
+
+    private_key, public_key, msg = asyncio.run(main())
+
+    assert msg == 'mensagem'
+    assert load_public_key(public_key).n == load_private_key(private_key).n
+    assert load_public_key(public_key).n.bit_length() in (511, 512)
+
+
+def test_lotes_devem_ser_iguais_aos_do_rsa():
+    messages = [f'token-{i}'.encode() for i in range(2 * BATCH_SIZE + 10)]
+    messages[0] = b'\x00\x01token'
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            rsa = AsyncRSA(executor=executor)
+            criptograms = await rsa.encrypt_batch(pub, messages)
+            return criptograms, await rsa.decrypt_batch(priv, criptograms)
+
+    criptograms, decrypted = asyncio.run(main())
+
+    assert criptograms == list(RSA().encrypt_batch(pub, messages))
+    assert decrypted == messages
+
+
+def test_mensagem_maior_que_o_modulo_deve_levantar_value_error():
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await AsyncRSA(executor=executor).encrypt(pub, b'\xff' * 65)
+
+    with raises(ValueError):
+        asyncio.run(main())
+
+
+def test_cancelamento_deve_interromper_a_busca_dos_primos():
+    async def main():
+        with CountingExecutor(max_workers=1) as executor:
+            rsa = AsyncRSA(key_size=2048, executor=executor)
+            task = asyncio.ensure_future(rsa.generate_keys())
+            while executor.submitted < 2:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with raises(asyncio.CancelledError):
+                await task
+
+            # Aguarda a etapa em andamento; nenhuma nova etapa deve ser submetida
+            submitted = executor.submitted
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(executor, int)
+            await asyncio.sleep(0.05)
+            return submitted, executor.submitted, rsa.in_flight
+
+    submitted, after, in_flight = asyncio.run(main())
+
+    assert after == submitted + 1
+    assert in_flight == 0
+
+
+def test_concorrencia_deve_ser_limitada():
+    messages = [b'token'] * (8 * BATCH_SIZE)
+
+    async def main():
+        with CountingExecutor(max_workers=8) as executor:
+            rsa = AsyncRSA(executor=executor, max_concurrency=2)
+            results = await asyncio.gather(
+                *(rsa.encrypt_batch(pub, messages) for _ in range(3)),
+                rsa.generate_keys(),
+            )
+            return results, executor.max_running
+
+    results, max_running = asyncio.run(main())
+
+    assert results[0] == results[1] == results[2]
+    assert max_running <= 2
+
+
+def test_max_concurrency_invalido_deve_levantar_value_error():
+    with raises(ValueError):
+        AsyncRSA(max_concurrency=0)
+
+
+def test_expoente_publico_par_deve_levantar_value_error():
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await AsyncRSA(key_size=64, executor=executor).generate_keys(
+                public_exp=4
+            )
+
+    with raises(ValueError):
+        asyncio.run(main())
+
+
+def test_busca_limitada_deve_retornar_none_sem_candidatos():
+    assert generate_prime(nbit=512, max_candidates=0) is None
+    assert generate_rsa_prime(nbit=512, max_candidates=0) is None
+    assert generate_rsa_prime(nbit=16, safe=True, max_candidates=10**6)
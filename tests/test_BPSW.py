@@ -0,0 +1,45 @@
+from pytest import mark
+
+from rsa.utils.BPSW import BPSW, jacobi
+from rsa.utils.Sieve import _small_primes
+
+
+def test_deve_classificar_todos_os_numeros_menores_que_20000():
+    primos = set(_small_primes(20000))
+    bpsw = BPSW()
+
+    assert all(bpsw.verify(num) == (num in primos) for num in range(20000))
+
+
+@mark.parametrize(
+    'num',
+    [
+        2047,  # Pseudoprimo forte para a base 2
+        3215031751,
+        5459,  # Pseudoprimo forte de Lucas
+        5777,
+        561,  # Número de Carmichael
+        (2**127 - 1) * (2**89 - 1),
+        (2**61 - 1) ** 2,  # Quadrado perfeito
+    ],
+)
+def test_deve_retornar_false_para_pseudoprimos(num):
+    assert BPSW().verify(num=num) is False
+
+
+@mark.parametrize('num', [2**61 - 1, 2**127 - 1, 2**521 - 1])
+def test_deve_retornar_true_para_primos_grandes(num):
+    assert BPSW().verify(num=num) is True
+
+
+@mark.parametrize('a,n', [(2, 7), (7, 19), (-7, 19), (1001, 9907)])
+def test_jacobi_deve_ser_igual_ao_criterio_de_euler_para_n_primo(a, n):
+    assert jacobi(a, n) % n == pow(a, (n - 1) // 2, n)
+
+
+def test_jacobi_deve_retornar_0_para_a_e_n_nao_coprimos():
+    assert jacobi(6, 15) == 0
+
+
+def test_verify_many_deve_retornar_somente_os_primos():
+    assert list(BPSW().verify_many([2047, 2053, 5459, 5477])) == [2053, 5477]
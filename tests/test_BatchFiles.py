@@ -0,0 +1,173 @@
+import os
+from types import SimpleNamespace
+
+from pytest import raises
+from typer.testing import CliRunner
+
+from rsa.core.BatchFiles import MANIFEST, find_files, process_dir
+from rsa.core.cli import cli
+from rsa.core.RSA import RSA
+from rsa.core.RSAKey import load_private_key, load_public_key
+from rsa.utils.cli.write_files import write_key_pair
+from rsa.utils.container import MAGIC
+
+runner = CliRunner()
+
+priv, pub = RSA(key_size=256).generate_keys()
+pub_key, priv_key = load_public_key(pub), load_private_key(priv)
+
+
+def create_files(directory, count=5):
+    contents = {}
+    for index in range(count):
+        path = f'sub{index % 2}/arquivo-{index}.bin'
+        contents[path] = os.urandom(100 * index)
+        (directory / path).parent.mkdir(parents=True, exist_ok=True)
+        (directory / path).write_bytes(contents[path])
+    return contents
+
+
+def test_arquivos_devem_ser_cifrados_e_decifrados(tmp_path):
+    contents = create_files(tmp_path / 'entrada')
+
+    cript = process_dir(
+        'cript', pub_key, str(tmp_path / 'entrada'), str(tmp_path / 'cifrados')
+    )
+    dcript = process_dir(
+        'dcript',
+        priv_key,
+        str(tmp_path / 'cifrados'),
+        str(tmp_path / 'decifrados'),
+        workers=2,
+    )
+
+    assert cript.processed == dcript.processed == len(contents)
+    assert cript.total_bytes == sum(map(len, contents.values()))
+    for path, content in contents.items():
+        assert (tmp_path / 'cifrados' / path).read_bytes().startswith(MAGIC)
+        assert (tmp_path / 'decifrados' / path).read_bytes() == content
+
+
+def test_arquivos_atualizados_devem_ser_ignorados(tmp_path):
+    create_files(tmp_path / 'entrada')
+    args = (
+        'cript',
+        pub_key,
+        str(tmp_path / 'entrada'),
+        str(tmp_path / 'saida'),
+    )
+
+    process_dir(*args)
+    unchanged = process_dir(*args)
+    (tmp_path / 'entrada' / 'sub0' / 'arquivo-0.bin').write_bytes(b'novo')
+    (tmp_path / 'saida' / 'sub1' / 'arquivo-1.bin').unlink()
+    changed = process_dir(*args)
+    other_format = process_dir(*args, output_format='decimal')
+
+    assert (unchanged.processed, unchanged.skipped) == (0, 5)
+    assert (changed.processed, changed.skipped) == (2, 3)
+    assert other_format.processed == 5
+
+
+def test_falhas_nao_devem_interromper_o_lote(tmp_path):
+    create_files(tmp_path / 'entrada', count=3)
+    (tmp_path / 'entrada' / 'invalido.bin').write_bytes(b'texto')
+
+    report = process_dir(
+        'dcript', priv_key, str(tmp_path / 'entrada'), str(tmp_path / 'saida')
+    )
+
+    assert report.processed == 1  # O arquivo vazio
+    assert len(report.failed) == 3
+    assert not list((tmp_path / 'saida').rglob('*.tmp'))
+    assert 'invalido.bin' not in (tmp_path / 'saida' / MANIFEST).read_text()
+
+
+def test_diretorio_de_saida_igual_ao_de_entrada_deve_levantar_value_error(
+    tmp_path,
+):
+    with raises(ValueError):
+        process_dir('cript', pub_key, str(tmp_path), str(tmp_path))
+
+
+def test_padroes_devem_filtrar_os_arquivos(tmp_path):
+    create_files(tmp_path)
+    (tmp_path / 'saida').mkdir()
+    (tmp_path / 'saida' / 'x.bin').write_bytes(b'x')
+
+    assert find_files(str(tmp_path), ['sub0/*', '**/arquivo-1.bin']) == [
+        'sub0/arquivo-0.bin',
+        'sub0/arquivo-2.bin',
+        'sub0/arquivo-4.bin',
+        'sub1/arquivo-1.bin',
+    ]
+    assert 'saida/x.bin' not in find_files(
+        str(tmp_path), ['**/*'], exclude=str(tmp_path / 'saida')
+    )
+
+
+def test_cli_deve_processar_o_diretorio(tmp_path):
+    contents = create_files(tmp_path / 'entrada')
+    write_key_pair(str(tmp_path), 'chave', priv, pub, output_type='pem')
+
+    cript = runner.invoke(
+        cli,
+        [
+            'cript',
+            '--input-dir',
+            f'{tmp_path / "entrada"}',
+            '--output-dir',
+            f'{tmp_path / "cifrados"}',
+            '--glob',
+            'sub0/*',
+            '--key-file',
+            f'{tmp_path / "chave_public_key.pem"}',
+        ],
+    )
+    dcript = runner.invoke(
+        cli,
+        [
+            'dcript',
+            '--input-dir',
+            f'{tmp_path / "cifrados"}',
+            '--output-dir',
+            f'{tmp_path / "decifrados"}',
+            '--workers',
+            '2',
+            '--key-file',
+            f'{tmp_path / "chave_private_key.pem"}',
+        ],
+    )
+
+    assert cript.exit_code == dcript.exit_code == 0
+    assert '3 arquivos processados' in cript.stdout
+    assert 'MB/s' in cript.stdout
+    assert sorted(
+        str(path.relative_to(tmp_path / 'decifrados'))
+        for path in (tmp_path / 'decifrados').rglob('*.bin')
+    ) == sorted(path for path in contents if path.startswith('sub0'))
+
+
+def test_cli_deve_exibir_o_resumo_com_tempo_nulo(tmp_path, monkeypatch):
+    create_files(tmp_path / 'entrada')
+    write_key_pair(str(tmp_path), 'chave', priv, pub, output_type='pem')
+    # Relógio de baixa resolução: o processamento termina no mesmo instante
+    monkeypatch.setattr(
+        'rsa.core.BatchFiles.time', SimpleNamespace(perf_counter=lambda: 1.0)
+    )
+
+    result = runner.invoke(
+        cli,
+        [
+            'cript',
+            '--input-dir',
+            f'{tmp_path / "entrada"}',
+            '--output-dir',
+            f'{tmp_path / "cifrados"}',
+            '--key-file',
+            f'{tmp_path / "chave_public_key.pem"}',
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert '0.0 arquivos/s' in result.output
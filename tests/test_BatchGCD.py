@@ -0,0 +1,33 @@
+from math import gcd, prod
+from random import getrandbits, seed
+
+from pytest import mark, raises
+
+from rsa.utils.BatchGCD import batch_gcd, chunked_batch_gcd
+
+seed(13)
+modulos = [getrandbits(256) | 1 for _ in range(200)]
+esperado = [
+    gcd(modulo, prod(modulos[:i] + modulos[i + 1 :]))
+    for i, modulo in enumerate(modulos)
+]
+
+
+def test_batch_gcd_deve_retornar_o_mdc_com_o_produto_dos_outros_modulos():
+    assert batch_gcd(modulos) == esperado
+
+
+@mark.parametrize('chunk_size', [1, 7, 64, 500])
+def test_chunked_batch_gcd_deve_retornar_o_mesmo_que_batch_gcd(chunk_size):
+    assert list(chunked_batch_gcd(modulos, chunk_size=chunk_size)) == esperado
+
+
+def test_chunked_batch_gcd_com_workers_deve_manter_a_ordem_dos_modulos():
+    resultado = chunked_batch_gcd(modulos, chunk_size=16, workers=2)
+
+    assert list(resultado) == esperado
+
+
+def test_chunked_batch_gcd_deve_retornar_erro_para_chunk_size_menor_que_1():
+    with raises(ValueError):
+        list(chunked_batch_gcd(modulos, chunk_size=0))
@@ -2,8 +2,11 @@ import os
 
 from typer.testing import CliRunner
 
+from rsa.bench.startup import heavy_imports
 from rsa.core.cli import cli
+from rsa.core.RSA import RSA
 from rsa.utils.cli.read_files import read_file
+from rsa.utils.container import MAGIC, write_container
 
 runner = CliRunner()
 
@@ -357,3 +360,288 @@ def test_rsa_cli_o_conteudo_do_arquivo_decifrado_deve_ser_igual_a_mensagem():
     content = read_file(file_path=message_path)
 
     assert mensagem == content
+
+
+def test_rsa_cli_deve_retornar_erro_para_expoente_publico_par(tmp_path):
+    result = runner.invoke(
+        cli,
+        [
+            'generate-keys',
+            '--file-prefix',
+            'pytest-key-par',
+            '--output-path',
+            f'{tmp_path}',
+            '--key-size',
+            '64',
+            '--public-exp',
+            '4',
+        ],
+    )
+
+    assert result.exit_code == 2
+    assert 'ímpar' in result.output
+
+
+def test_rsa_cli_deve_criar_count_pares_de_chaves():
+    filepath = os.path.join(cript_filespath, 'cript')
+
+    result = runner.invoke(
+        cli,
+        [
+            'generate-keys',
+            '--file-prefix',
+            'pytest-key-many',
+            '--output-path',
+            f'{cript_filespath}',
+            '--key-size',
+            '128',
+            '--count',
+            '3',
+            '--workers',
+            '2',
+        ],
+    )
+
+    assert result.exit_code == 0
+    for index in range(3):
+        assert os.path.isfile(
+            f'{filepath}/pytest-key-many_{index}_public_key.txt'
+        )
+        assert os.path.isfile(
+            f'{filepath}/pytest-key-many_{index}_private_key.txt'
+        )
+
+
+def test_rsa_cli_deve_cifrar_e_decifrar_arquivos_por_blocos(tmp_path):
+    key_path = os.path.join(cript_filespath, 'cript')
+    files_path = tmp_path / 'cript' / 'files'
+    message_file = tmp_path / 'mensagem.txt'
+    conteudo = ('Mensagem longa, com acentuação e 日本語.\n' * 500).encode()
+    message_file.write_bytes(conteudo)
+
+    runner.invoke(
+        cli,
+        [
+            'cript',
+            '--message-file',
+            f'{message_file}',
+            '--output-filename',
+            'criptograma.txt',
+            '--output-path',
+            f'{tmp_path}',
+            '--key-file',
+            f'{key_path}/{public_key_hex_file}',
+        ],
+    )
+    runner.invoke(
+        cli,
+        [
+            'dcript',
+            '--criptogram-file',
+            f'{files_path / "criptograma.txt"}',
+            '--output-filename',
+            'mensagem.txt',
+            '--output-path',
+            f'{tmp_path}',
+            '--key-file',
+            f'{key_path}/{private_key_hex_file}',
+        ],
+    )
+
+    assert (files_path / 'criptograma.txt').read_bytes().startswith(MAGIC)
+    assert (files_path / 'mensagem.txt').read_bytes() == conteudo
+
+
+def test_rsa_cli_deve_decifrar_criptogramas_no_formato_decimal(tmp_path):
+    key_path = os.path.join(cript_filespath, 'cript')
+    files_path = tmp_path / 'cript' / 'files'
+
+    runner.invoke(
+        cli,
+        [
+            'cript',
+            'Mensagem em decimal',
+            '--output-filename',
+            'criptograma.txt',
+            '--output-path',
+            f'{tmp_path}',
+            '--output-format',
+            'decimal',
+            '--key-file',
+            f'{key_path}/{public_key_hex_file}',
+        ],
+    )
+    runner.invoke(
+        cli,
+        [
+            'dcript',
+            '--criptogram-file',
+            f'{files_path / "criptograma.txt"}',
+            '--output-filename',
+            'mensagem.txt',
+            '--output-path',
+            f'{tmp_path}',
+            '--key-file',
+            f'{key_path}/{private_key_hex_file}',
+        ],
+    )
+
+    assert (files_path / 'criptograma.txt').read_text().strip().isdigit()
+    assert (files_path / 'mensagem.txt').read_text() == 'Mensagem em decimal'
+
+
+def test_rsa_cli_deve_recusar_criptograma_binario_de_outra_chave(tmp_path):
+    key_path = os.path.join(cript_filespath, 'cript')
+    criptogram_file = tmp_path / 'criptograma.bin'
+    with open(criptogram_file, 'wb') as file:
+        write_container(file, bytes(32), 128, [1, 2])
+
+    result = runner.invoke(
+        cli,
+        [
+            'dcript',
+            '--criptogram-file',
+            f'{criptogram_file}',
+            '--output-filename',
+            'mensagem.txt',
+            '--output-path',
+            f'{tmp_path}',
+            '--key-file',
+            f'{key_path}/{private_key_hex_file}',
+        ],
+    )
+
+    assert isinstance(result.exception, ValueError)
+    assert 'outra chave' in str(result.exception)
+
+
+def test_rsa_cli_deve_cifrar_e_decifrar_uma_mensagem_por_linha(tmp_path):
+    key_path = os.path.join(cript_filespath, 'cript')
+    files_path = tmp_path / 'cript' / 'files'
+    message_file = tmp_path / 'tokens.txt'
+    tokens = [f'token-{i}' for i in range(50)]
+    message_file.write_text('\n'.join(tokens) + '\n')
+
+    runner.invoke(
+        cli,
+        [
+            'cript',
+            '--lines',
+            '--message-file',
+            f'{message_file}',
+            '--output-filename',
+            'tokens.cript',
+            '--output-path',
+            f'{tmp_path}',
+            '--key-file',
+            f'{key_path}/{public_key_hex_file}',
+        ],
+    )
+    runner.invoke(
+        cli,
+        [
+            'dcript',
+            '--lines',
+            '--criptogram-file',
+            f'{files_path / "tokens.cript"}',
+            '--output-filename',
+            'tokens.txt',
+            '--output-path',
+            f'{tmp_path}',
+            '--key-file',
+            f'{key_path}/{private_key_hex_file}',
+        ],
+    )
+
+    assert len((files_path / 'tokens.cript').read_text().splitlines()) == 50
+    assert (files_path / 'tokens.txt').read_text().splitlines() == tokens
+
+
+def test_rsa_cli_audit_keys_deve_retornar_1_para_chaves_comprometidas(
+    tmp_path,
+):
+    rsa = RSA()
+    for name, modulus in [('a', 3 * 5), ('b', 5 * 7), ('c', 11 * 13)]:
+        (tmp_path / f'{name}_public_key.txt').write_text(
+            rsa.der_public_key({'n': modulus, 'e': 65537})
+        )
+
+    result = runner.invoke(cli, ['audit-keys', '--key-dir', f'{tmp_path}'])
+
+    assert result.exit_code == 1
+    assert 'a_public_key.txt <-> ' in result.stdout
+    assert '1 pares de chaves comprometidos' in result.stdout
+
+
+def test_rsa_cli_deve_criar_chaves_com_primos_seguros(tmp_path):
+    result = runner.invoke(
+        cli,
+        [
+            'generate-keys',
+            '--file-prefix',
+            'pytest-key-safe',
+            '--output-path',
+            f'{tmp_path}',
+            '--key-size',
+            '128',
+            '--safe-primes',
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert (tmp_path / 'cript' / 'pytest-key-safe_private_key.txt').is_file()
+
+
+def test_rsa_cli_nao_deve_importar_modulos_pesados_na_inicializacao():
+    assert heavy_imports() == []
+
+
+def test_rsa_cli_deve_cifrar_e_decifrar_pela_entrada_e_saida_padrao(tmp_path):
+    from rsa.utils.cli.write_files import write_key_pair
+
+    private_key, public_key = RSA(key_size=256).generate_keys()
+    write_key_pair(
+        str(tmp_path), 'chave', private_key, public_key, output_type='pem'
+    )
+    stdio_runner = CliRunner(mix_stderr=False)
+    conteudo = bytes(range(256)) * 40
+
+    cifrado = stdio_runner.invoke(
+        cli,
+        ['cript', '-', '--key-file', f'{tmp_path / "chave_public_key.pem"}'],
+        input=conteudo,
+    )
+    decifrado = stdio_runner.invoke(
+        cli,
+        [
+            'dcript',
+            '--criptogram-file',
+            '-',
+            '--output-filename',
+            '-',
+            '--key-file',
+            f'{tmp_path / "chave_private_key.pem"}',
+        ],
+        input=cifrado.stdout_bytes,
+    )
+
+    assert cifrado.stdout_bytes.startswith(MAGIC)
+    assert decifrado.stdout_bytes == conteudo
+    assert not (tmp_path / 'cript' / 'files').exists()
+
+
+def test_rsa_cli_deve_escrever_uma_linha_decimal_por_mensagem_na_saida_padrao(
+    tmp_path,
+):
+    private_key, public_key = RSA(key_size=256).generate_keys()
+
+    result = CliRunner(mix_stderr=False).invoke(
+        cli,
+        ['cript', '-', '--lines', '--public-key', public_key],
+        input='token-1\ntoken-2\n',
+    )
+    criptograms = [int(line) for line in result.stdout.splitlines()]
+
+    assert list(
+        RSA().decrypt_batch(private_key, criptograms, encoding='utf-8')
+    ) == ['token-1', 'token-2']
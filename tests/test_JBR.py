@@ -34,3 +34,16 @@ def test_deve_retornar_erro_para_num_sem_inverso_modular(num, mod):
     with raises(ZeroDivisionError) as error:
         result = jbr.invMod(num=num)
     assert msg_error == error.value.args[0]
+
+
+def test_a_mesma_instancia_deve_ser_reutilizada_entre_chamadas():
+    jbr = JBR(mod=256)
+
+    assert jbr.invMod(num=123) == jbr.invMod(num=123) == 179
+
+
+def test_deve_calcular_o_inverso_modular_de_operandos_grandes():
+    modulo = 2**4423 - 1  # Primo de Mersenne
+    num = 3**2000
+
+    assert (JBR(mod=modulo).invMod(num=num) * num) % modulo == 1
@@ -0,0 +1,57 @@
+from pytest import fixture
+
+from rsa.core.KeyAudit import SharedFactor, find_shared_factors, read_moduli
+from rsa.core.RSA import RSA
+from rsa.utils.GenPrimeNumber import generate_prime
+
+rsa = RSA()
+
+
+@fixture
+def key_dir(tmp_path):
+    p, q, r, s, t = [generate_prime(nbit=128) for _ in range(5)]
+    keys = {
+        'a_public_key.txt': p * q,
+        'b_public_key.txt': p * r,
+        'c_public_key.txt': s * t,
+        'sub/d_public_key.txt': s * t,
+    }
+    for name, modulus in keys.items():
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(rsa.der_public_key({'n': modulus, 'e': 65537}))
+    (tmp_path / 'a_private_key.txt').write_text('não é uma chave pública')
+    return tmp_path, p
+
+
+def test_read_moduli_deve_ignorar_arquivos_que_nao_sao_chaves_publicas(
+    key_dir,
+):
+    directory, _ = key_dir
+
+    moduli = read_moduli(str(directory))
+
+    assert sum(len(paths) for paths in moduli.values()) == 4
+    assert len(moduli) == 3
+
+
+def test_find_shared_factors_deve_retornar_os_pares_comprometidos(key_dir):
+    directory, p = key_dir
+    moduli = read_moduli(str(directory))
+
+    shared = find_shared_factors(moduli, chunk_size=2)
+    pairs = {
+        (pair.first.split('/')[-1], pair.second.split('/')[-1]): pair.factor
+        for pair in shared
+    }
+
+    assert len(shared) == 2
+    assert pairs[('a_public_key.txt', 'b_public_key.txt')] == p
+    assert ('c_public_key.txt', 'd_public_key.txt') in pairs
+
+
+def test_find_shared_factors_sem_pares_comprometidos():
+    assert find_shared_factors({15: ['a'], 77: ['b']}) == []
+    assert isinstance(
+        find_shared_factors({15: ['a'], 35: ['b']})[0], SharedFactor
+    )
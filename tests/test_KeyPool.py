@@ -0,0 +1,105 @@
+from multiprocessing import Pool
+
+from pytest import fixture, raises
+
+from rsa.core.KeyPool import KeyPool
+
+
+@fixture
+def key_pool(tmp_path):
+    return KeyPool(
+        directory=str(tmp_path),
+        key_size=64,
+        low_watermark=2,
+        high_watermark=4,
+    )
+
+
+def _checkout(directory):
+    return KeyPool(directory=directory, key_size=64).checkout()
+
+
+def test_deve_repor_o_pool_ate_a_marca_maxima(key_pool):
+    assert key_pool.refill() == 4
+    assert key_pool.depth() == 4
+
+
+def test_nao_deve_repor_o_pool_acima_da_marca_minima(key_pool):
+    key_pool.refill()
+    key_pool.checkout()
+
+    assert key_pool.refill() == 0
+    assert key_pool.depth() == 3
+
+
+def test_cada_par_deve_ser_entregue_uma_unica_vez(key_pool):
+    key_pool.refill()
+
+    with Pool(4) as pool:
+        pairs = pool.map(_checkout, [key_pool.directory] * 4)
+
+    assert len(set(pairs)) == 4
+    assert key_pool.stats()['misses'] == 0
+    assert key_pool.depth() == 0
+
+
+def test_deve_gerar_o_par_na_hora_com_o_pool_vazio(key_pool):
+    private_key, public_key = key_pool.checkout()
+    stats = key_pool.stats()
+
+    assert private_key and public_key
+    assert stats['misses'] == 1
+    assert stats['checked_out'] == 1
+
+
+def test_processo_em_segundo_plano_deve_abastecer_o_pool(key_pool):
+    from time import sleep
+
+    key_pool.start(interval=0.05)
+    for _ in range(100):
+        if key_pool.depth() >= 4:
+            break
+        sleep(0.05)
+    key_pool.stop()
+
+    assert key_pool.depth() == 4
+    assert key_pool.stats()['refill_rate'] > 0
+
+
+def test_processo_em_segundo_plano_deve_repor_com_varios_workers(tmp_path):
+    from time import sleep
+
+    key_pool = KeyPool(
+        directory=str(tmp_path),
+        key_size=64,
+        low_watermark=2,
+        high_watermark=6,
+        workers=2,
+    )
+    key_pool.start(interval=0.05)
+    for _ in range(200):
+        if key_pool.depth() >= 6:
+            break
+        sleep(0.05)
+    key_pool.stop()
+
+    assert key_pool.depth() == 6
+    assert key_pool.stats()['generated'] == 6
+
+
+def test_chaves_privadas_devem_ser_acessiveis_somente_pelo_usuario(key_pool):
+    import os
+    import stat
+
+    key_pool.refill()
+    ready = os.path.join(key_pool.directory, 'ready')
+
+    assert stat.S_IMODE(os.stat(ready).st_mode) == 0o700
+    for filename in os.listdir(ready):
+        mode = os.stat(os.path.join(ready, filename)).st_mode
+        assert stat.S_IMODE(mode) == 0o600
+
+
+def test_deve_retornar_erro_para_marcas_invalidas(tmp_path):
+    with raises(ValueError):
+        KeyPool(directory=str(tmp_path), low_watermark=5, high_watermark=2)
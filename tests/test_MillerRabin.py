@@ -1,6 +1,6 @@
 from pytest import mark, raises
 
-from rsa.utils.MillerRabin import MillerRabin
+from rsa.utils.MillerRabin import MillerRabin, mr_rounds
 
 
 @mark.parametrize(
@@ -39,3 +39,48 @@ def test_deve_retornar_erro_para_iterations_maior_ou_igual_a_num():
     with raises(Exception) as error:
         miller_rabin.verify(num=num)
     assert msg_erro == error.value.args[0]
+
+
+@mark.parametrize(
+    'num', [561, 1105, 3215031751, 3825123056546413051, 2**62 - 1]
+)
+def test_deve_retornar_false_para_pseudoprimos_fortes_menores_que_2_64(num):
+    assert MillerRabin().verify(num=num) is False
+
+
+@mark.parametrize(
+    'num', [2, 2**31 - 1, 2**61 - 1, 2**64 - 59, 2**127 - 1]
+)
+def test_deve_retornar_true_para_primos_grandes(num):
+    assert MillerRabin().verify(num=num) is True
+
+
+@mark.parametrize('bits,rounds', [(256, 40), (512, 7), (1024, 5), (4096, 4)])
+def test_deve_escolher_as_rodadas_pelo_numero_de_bits(bits, rounds):
+    assert mr_rounds(bits) == rounds
+
+
+def test_deve_encerrar_na_primeira_base_que_prova_que_num_e_composto(
+    monkeypatch,
+):
+    miller_rabin = MillerRabin()
+    bases = []
+    is_witness = miller_rabin._is_witness
+
+    def _is_witness(a, *args):
+        bases.append(a)
+        return is_witness(a, *args)
+
+    monkeypatch.setattr(miller_rabin, '_is_witness', _is_witness)
+
+    assert miller_rabin.verify(num=(2**127 - 1) * (2**89 - 1)) is False
+    assert len(bases) == 1
+
+
+def test_verify_many_deve_retornar_somente_os_primos():
+    candidatos = range(5, 200, 2)
+
+    primos = list(MillerRabin().verify_many(candidatos))
+
+    assert primos == [n for n in candidatos if MillerRabin().verify(n)]
+    assert primos[:5] == [5, 7, 11, 13, 17]
@@ -0,0 +1,60 @@
+from math import gcd
+from random import getrandbits, seed
+
+from pytest import mark, raises
+
+from rsa.utils.ModArith import (
+    batch_inv_mod,
+    binary_gcd,
+    egcd,
+    inv_mod,
+    lehmer_gcd,
+)
+
+seed(12)
+pares = [
+    (getrandbits(bits_a), getrandbits(bits_b))
+    for bits_a, bits_b in [(8, 8), (64, 64), (300, 120), (2048, 2048)]
+] + [(2**1000 * 3, 2**900 * 9), (0, 15), (15, 0)]
+
+
+@mark.parametrize('a,b', pares)
+def test_os_algoritmos_de_mdc_devem_retornar_o_mesmo_valor(a, b):
+    assert lehmer_gcd(a, b) == binary_gcd(a, b) == gcd(a, b)
+
+
+@mark.parametrize('a,b', pares)
+def test_egcd_deve_retornar_os_coeficientes_de_bezout(a, b):
+    g, x, y = egcd(a, b)
+
+    assert g == gcd(a, b)
+    assert a * x + b * y == g
+
+
+@mark.parametrize(
+    'num,mod,esperado', [(7, 2, 1), (123, 56, 51), (315, 256, 243)]
+)
+def test_inv_mod_deve_retornar_o_inverso_modular_de_num(num, mod, esperado):
+    assert inv_mod(num=num, mod=mod) == esperado
+
+
+@mark.parametrize('num,mod', [(315, 560), (0, 256), (250, 315)])
+def test_inv_mod_deve_retornar_erro_para_num_sem_inverso_modular(num, mod):
+    with raises(ZeroDivisionError):
+        inv_mod(num=num, mod=mod)
+
+
+def test_batch_inv_mod_deve_retornar_os_mesmos_inversos_de_inv_mod():
+    modulo = 2**521 - 1  # Primo de Mersenne
+    nums = [getrandbits(520) + 1 for _ in range(100)]
+
+    assert batch_inv_mod(nums, modulo) == [inv_mod(n, modulo) for n in nums]
+
+
+def test_batch_inv_mod_deve_retornar_erro_se_algum_num_nao_tiver_inverso():
+    with raises(ZeroDivisionError):
+        batch_inv_mod([3, 5, 256], 512)
+
+
+def test_batch_inv_mod_deve_retornar_lista_vazia():
+    assert batch_inv_mod([], 11) == []
@@ -0,0 +1,45 @@
+from multiprocessing import Pool
+
+from pytest import raises
+
+from rsa.core.RSA import RSA
+from rsa.utils.MillerRabin import MillerRabin
+from rsa.utils.ParallelPrime import generate_prime_parallel, search_primes
+
+
+def test_deve_retornar_primo_com_a_quantidade_correta_de_bits():
+    prime = generate_prime_parallel(nbit=128, workers=2)
+
+    assert prime.bit_length() == 128
+    assert MillerRabin().verify(num=prime)
+
+
+def test_deve_retornar_a_quantidade_de_primos_distintos_solicitada():
+    primes = search_primes(nbit=64, count=3, workers=2, public_exp=3)
+
+    assert len(set(primes)) == 3
+    assert all((prime - 1) % 3 != 0 for prime in primes)
+
+
+def test_deve_retornar_erro_para_workers_menor_que_1():
+    with raises(ValueError):
+        search_primes(nbit=64, workers=0)
+
+
+def test_deve_retornar_primos_seguros_em_paralelo():
+    primes = search_primes(nbit=64, count=2, workers=2, safe=True)
+
+    assert all(MillerRabin().verify(num=(prime - 1) // 2) for prime in primes)
+
+
+def _generate_in_worker(key_size):
+    return RSA(key_size=key_size, workers=2).generate_keys()
+
+
+def test_deve_buscar_os_primos_em_um_processo_daemon():
+    with Pool(processes=1) as pool:
+        primes = pool.apply(search_primes, (64,), {'count': 2})
+        private_key, public_key = pool.apply(_generate_in_worker, (128,))
+
+    assert len(set(primes)) == 2
+    assert RSA().dcript(private_key, RSA().cript(public_key, 'ok')) == 'ok'
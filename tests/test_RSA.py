@@ -52,6 +52,11 @@ def test_deve_cifrar_e_decifrar_a_mensagem():
     assert mensagem == msg_decifrada
 
 
+def test_cript_deve_retornar_erro_para_mensagem_maior_que_o_modulo():
+    with raises(ValueError):
+        rsa.cript(public_key=pub, msg='\xff' * 512)
+
+
 def test_deve_retornar_erro_se_a_chave_publica_nao_estiver_no_formato_correto():
     # hexadecimal incorreto
     pub_key = '82010a02820101009686ab71705c873a381e3eb9ada1cbb2149788e3ab1f403dc4146b1a179938bbac521ff6286439f5938c1d5888a69dc3f1e3fef169dfc4ab285a9e7195576cdecf902eb0fa1fb62a8146e4a87aac8aec42842a5d972c659010dbde7384ebb666b14804ddf15445f04087c1afb38b9e576f74caf3f569d81d746ae2f2dfc827c202170aee55640adeb2475453be395ce9e7aedaa7a5d9de97eacbe390958b6e82f58a8c7d28edbba285057c7375062d66125938444675cc68513c0348c752caf5cb8ef8d4de3aa4e444cef40c2c30a68b3693761ec0445ade25d5885fa14e66ab04bb9be6806397ae09f638bd64fa52213df2dad8eb6d9be870c8aba1cbb7c40f0203010001'
@@ -75,3 +80,228 @@ def test_deve_retornar_erro_se_a_chave_privada_nao_estiver_no_formato_correto():
         result = rsa.dcript(private_key=private_key, criptogram=criptogram)
 
     assert msg_erro == error.value.args[0]
+
+
+def test_deve_gerar_p_e_q_em_paralelo_com_mais_de_um_worker():
+    priv_key_hex, _ = RSA(key_size=256, workers=2).generate_keys()
+    priv_key, _ = decode(bytes.fromhex(priv_key_hex), asn1Spec=PrivateKey())
+
+    p, q = int(priv_key['p']), int(priv_key['q'])
+
+    assert p != q
+    assert int(priv_key['modulus']) == p * q
+
+
+def test_p_menos_1_e_q_menos_1_devem_ser_coprimos_com_o_expoente_publico():
+    public_exp = 3
+    priv_key_hex, _ = RSA(key_size=128).generate_keys(public_exp=public_exp)
+    priv_key, _ = decode(bytes.fromhex(priv_key_hex), asn1Spec=PrivateKey())
+
+    assert (int(priv_key['p']) - 1) % public_exp != 0
+    assert (int(priv_key['q']) - 1) % public_exp != 0
+
+
+def test_deve_retornar_erro_para_workers_menor_que_1():
+    msg_erro = "O valor de 'workers' deve ser maior que 0."
+
+    with raises(ValueError) as error:
+        RSA(workers=0)
+
+    assert msg_erro == error.value.args[0]
+
+
+def test_deve_retornar_erro_para_expoente_publico_par_ou_menor_que_2():
+    for public_exp in (4, 1, 0, -3):
+        with raises(ValueError):
+            RSA(key_size=64).generate_keys(public_exp=public_exp)
+        with raises(ValueError):
+            next(
+                RSA(key_size=64).generate_many(count=2, public_exp=public_exp)
+            )
+    with raises(ValueError):
+        RSA(key_size=64, workers=2).generate_keys(public_exp=4)
+
+
+def test_generate_many_deve_retornar_a_quantidade_de_pares_solicitada():
+    pairs = list(RSA(key_size=128).generate_many(count=5, workers=2))
+    modulus = set()
+
+    for priv_key_hex, pub_key_hex in pairs:
+        public_key, _ = decode(
+            bytes.fromhex(pub_key_hex), asn1Spec=PublicKey()
+        )
+        modulus.add(int(public_key['modulus']))
+
+    assert len(pairs) == 5
+    assert len(modulus) == 5
+
+
+def test_chave_privada_deve_conter_os_valores_do_crt():
+    priv_key, _ = decode(bytes.fromhex(priv), asn1Spec=PrivateKey())
+    p, q = int(priv_key['p']), int(priv_key['q'])
+    d = int(priv_key['private_expoent'])
+
+    assert int(priv_key['crt']['exponent1']) == d % (p - 1)
+    assert int(priv_key['crt']['exponent2']) == d % (q - 1)
+    assert (int(priv_key['crt']['coefficient']) * q) % p == 1
+
+
+def test_deve_decifrar_com_chave_privada_sem_os_valores_do_crt():
+    mensagem = 'chave antiga'
+    priv_key, _ = decode(bytes.fromhex(priv), asn1Spec=PrivateKey())
+    legacy_priv = rsa.der_private_key(
+        private_infos={
+            'n': int(priv_key['modulus']),
+            'd': int(priv_key['private_expoent']),
+            'p': int(priv_key['p']),
+            'q': int(priv_key['q']),
+            'phi': int(priv_key['phi']),
+        }
+    )
+
+    cifra = rsa.cript(public_key=pub, msg=mensagem)
+
+    legacy_key, _ = decode(bytes.fromhex(legacy_priv), asn1Spec=PrivateKey())
+    assert not legacy_key['crt'].isValue
+    assert rsa.dcript(private_key=legacy_priv, criptogram=cifra) == mensagem
+
+
+def test_deve_decifrar_com_chave_privada_pkcs1_do_openssl():
+    from pyasn1.codec.der.encoder import encode
+
+    from rsa.utils.der.DataTypes.PrivateKey import PrivateKeyRSA
+
+    mensagem = 'chave openssl'
+    priv_key, _ = decode(bytes.fromhex(priv), asn1Spec=PrivateKey())
+    public_key, _ = decode(bytes.fromhex(pub), asn1Spec=PublicKey())
+
+    pkcs1 = PrivateKeyRSA()
+    pkcs1['version'] = 0
+    pkcs1['modulus'] = priv_key['modulus']
+    pkcs1['publicExponent'] = public_key['public_expoent']
+    pkcs1['privateExponent'] = priv_key['private_expoent']
+    pkcs1['prime1'] = priv_key['p']
+    pkcs1['prime2'] = priv_key['q']
+    pkcs1['exponent1'] = priv_key['crt']['exponent1']
+    pkcs1['exponent2'] = priv_key['crt']['exponent2']
+    pkcs1['coefficient'] = priv_key['crt']['coefficient']
+
+    cifra = rsa.cript(public_key=pub, msg=mensagem)
+
+    assert rsa.dcript(private_key=encode(pkcs1), criptogram=cifra) == mensagem
+
+
+def test_deve_cifrar_e_decifrar_mensagens_maiores_que_o_modulo_por_blocos():
+    from io import BytesIO
+
+    mensagem = ('blocos com acentuação: ção, 日本語 ' * 200).encode()
+
+    criptogramas = list(
+        rsa.encrypt_stream(public_key=pub, source=BytesIO(mensagem))
+    )
+    blocos = rsa.decrypt_stream(private_key=priv, criptograms=criptogramas)
+
+    assert len(criptogramas) > 1
+    assert b''.join(blocos) == mensagem
+
+
+def test_decrypt_stream_deve_tratar_caracteres_divididos_entre_blocos():
+    from io import BytesIO
+
+    mensagem = 'ã' * 1000  # 2 bytes por caractere, com blocos de tamanho par
+
+    criptogramas = rsa.encrypt_stream(
+        public_key=pub, source=BytesIO(mensagem.encode())
+    )
+    texto = rsa.decrypt_stream(
+        private_key=priv, criptograms=criptogramas, encoding='utf-8'
+    )
+
+    assert ''.join(texto) == mensagem
+
+
+def test_decrypt_stream_deve_aceitar_criptogramas_do_formato_anterior():
+    mensagem = 'formato anterior'
+    cifra = rsa.cript(public_key=pub, msg=mensagem)
+
+    blocos = rsa.decrypt_stream(private_key=priv, criptograms=[cifra])
+
+    assert b''.join(blocos) == mensagem.encode()
+
+
+def test_decrypt_stream_com_workers_deve_manter_a_ordem_dos_blocos():
+    from io import BytesIO
+
+    mensagem = bytes(range(256)) * 64
+
+    criptogramas = rsa.encrypt_stream(public_key=pub, source=BytesIO(mensagem))
+    blocos = rsa.decrypt_stream(
+        private_key=priv, criptograms=criptogramas, workers=2
+    )
+
+    assert b''.join(blocos) == mensagem
+
+
+def test_encrypt_batch_e_decrypt_batch_devem_manter_as_mensagens():
+    mensagens = [f'token-{i}' for i in range(100)]
+
+    criptogramas = list(rsa.encrypt_batch(public_key=pub, messages=mensagens))
+    decifradas = rsa.decrypt_batch(
+        private_key=priv, criptograms=criptogramas, encoding='utf-8'
+    )
+
+    assert list(decifradas) == mensagens
+
+
+def test_encrypt_batch_deve_preservar_os_zeros_a_esquerda():
+    mensagens = [b'\x00\x01tok', b'\x00', b'', b'\x01legado']
+
+    for workers in (1, 2):
+        criptogramas = rsa.encrypt_batch(
+            public_key=pub, messages=mensagens, workers=workers
+        )
+        decifradas = rsa.decrypt_batch(
+            private_key=priv, criptograms=criptogramas, workers=workers
+        )
+
+        assert list(decifradas) == mensagens
+
+
+def test_encrypt_batch_com_workers_deve_manter_a_ordem_das_mensagens():
+    mensagens = [f'token-{i}'.encode() for i in range(500)]
+
+    criptogramas = rsa.encrypt_batch(
+        public_key=pub, messages=mensagens, workers=2, chunk_size=64
+    )
+    decifradas = rsa.decrypt_batch(
+        private_key=priv, criptograms=criptogramas, workers=2, chunk_size=64
+    )
+
+    assert list(decifradas) == mensagens
+
+
+def test_encrypt_batch_deve_retornar_erro_para_mensagem_maior_que_o_modulo():
+    with raises(ValueError):
+        list(rsa.encrypt_batch(public_key=pub, messages=[b'\xff' * 512]))
+
+
+def test_deve_gerar_chaves_com_o_teste_bpsw():
+    priv_bpsw, pub_bpsw = RSA(key_size=256, primality='bpsw').generate_keys()
+
+    cifra = rsa.cript(public_key=pub_bpsw, msg='bpsw')
+
+    assert rsa.dcript(private_key=priv_bpsw, criptogram=cifra) == 'bpsw'
+
+
+def test_deve_retornar_erro_para_teste_de_primalidade_desconhecido():
+    with raises(ValueError):
+        RSA(primality='fermat')
+
+
+def test_deve_gerar_chaves_com_primos_seguros():
+    priv_key_hex, _ = RSA(key_size=128, safe_primes=True).generate_keys()
+    priv_key, _ = decode(bytes.fromhex(priv_key_hex), asn1Spec=PrivateKey())
+
+    for prime in (int(priv_key['p']), int(priv_key['q'])):
+        assert prime.bit_length() == 128
+        assert MillerRabin().verify(num=(prime - 1) // 2)
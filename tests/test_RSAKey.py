@@ -0,0 +1,75 @@
+import pickle
+
+from pytest import raises
+
+from rsa.core.RSA import RSA
+from rsa.core.RSAKey import (
+    RSAPrivateKey,
+    RSAPublicKey,
+    _decode_private_key,
+    _decode_public_key,
+    load_private_key,
+    load_public_key,
+)
+
+rsa = RSA(key_size=256)
+priv, pub = rsa.generate_keys()
+
+
+def test_chaves_do_mesmo_par_devem_ter_o_mesmo_fingerprint():
+    assert load_public_key(pub).fingerprint == (
+        load_private_key(priv).fingerprint
+    )
+
+
+def test_a_mesma_chave_deve_ser_decodificada_uma_unica_vez():
+    _decode_public_key.cache_clear()
+    _decode_private_key.cache_clear()
+
+    for _ in range(10):
+        load_public_key(pub)
+        load_private_key(bytes.fromhex(priv))
+
+    assert _decode_public_key.cache_info().misses == 1
+    assert _decode_private_key.cache_info().misses == 1
+    assert load_public_key(pub) is load_public_key(pub)
+
+
+def test_formas_diferentes_da_mesma_chave_devem_usar_o_cache():
+    _decode_public_key.cache_clear()
+    der = bytes.fromhex(pub)
+
+    keys = [
+        load_public_key(key)
+        for key in (pub, pub.upper(), der, bytearray(der), memoryview(der))
+    ]
+
+    assert _decode_public_key.cache_info().misses == 1
+    assert all(key is keys[0] for key in keys)
+
+
+def test_as_chaves_devem_ser_imutaveis():
+    pub_key = load_public_key(pub)
+
+    with raises(AttributeError):
+        pub_key.e = 3
+    with raises(AttributeError):
+        pub_key.extra = 1
+
+
+def test_as_chaves_devem_ser_serializaveis_com_pickle():
+    priv_key = load_private_key(priv)
+
+    assert pickle.loads(pickle.dumps(priv_key)) == priv_key
+
+
+def test_cript_e_dcript_devem_aceitar_as_chaves_decodificadas():
+    mensagem = 'chave decodificada'
+    pub_key, priv_key = load_public_key(pub), load_private_key(priv)
+
+    cifra = rsa.cript(public_key=pub_key, msg=mensagem)
+
+    assert isinstance(pub_key, RSAPublicKey)
+    assert isinstance(priv_key, RSAPrivateKey)
+    assert cifra == rsa.cript(public_key=pub, msg=mensagem)
+    assert rsa.dcript(private_key=priv_key, criptogram=cifra) == mensagem
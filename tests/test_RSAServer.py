@@ -0,0 +1,334 @@
+import asyncio
+import os
+import socket
+import stat
+import threading
+import time
+from io import BytesIO
+
+from pytest import raises
+from typer.testing import CliRunner
+
+from rsa.core.cli import cli
+from rsa.core.RSA import RSA
+from rsa.core.RSAClient import RSAClient
+from rsa.core.RSAKey import load_private_key, load_public_key
+from rsa.core.RSAServer import RSAServer
+from rsa.utils.blocks import payload_size
+from rsa.utils.cli.read_files import read_criptograms
+from rsa.utils.cli.write_files import write_key_pair
+from rsa.utils.container import write_container
+from rsa.utils.protocol import (
+    HEADER,
+    MAX_FRAME_SIZE,
+    ProtocolError,
+    ServerError,
+    decode_body,
+    encode_frame,
+    recv_frame,
+    secure_socket_dir,
+)
+
+runner = CliRunner()
+
+priv, pub = RSA(key_size=256).generate_keys()
+
+
+def run_with_server(tmp_path, scenario, **options):
+    """
+    Executa o servidor no event loop e `scenario(server, socket_path, stop)` em uma thread.
+    """
+    socket_path = str(tmp_path / 'rsa.sock')
+    server = RSAServer(socket_path=socket_path, workers=1, **options)
+
+    async def main():
+        ready = asyncio.Event()
+        serving = asyncio.ensure_future(server.serve(ready=ready))
+        await ready.wait()
+        loop = asyncio.get_running_loop()
+
+        def stop():
+            loop.call_soon_threadsafe(server.stop)
+
+        try:
+            return await loop.run_in_executor(
+                None, scenario, server, socket_path, stop
+            )
+        finally:
+            server.stop()
+            await serving
+
+    return asyncio.run(main())
+
+
+def test_cifracao_pelo_servidor_deve_ser_igual_a_local(tmp_path):
+    data = os.urandom(1000)
+    pub_key = load_public_key(pub)
+
+    def scenario(server, socket_path, stop):
+        with RSAClient(socket_path) as client:
+            size = payload_size(pub_key.size) * 3
+            chunks = [data[i : i + size] for i in range(0, len(data), size)]
+            criptograms = [
+                c
+                for part in client.encrypt_chunks(chunks, key=pub)
+                for c in part
+            ]
+            return criptograms, b''.join(
+                client.decrypt_chunks(criptograms, key=priv)
+            )
+
+    criptograms, decrypted = run_with_server(tmp_path, scenario)
+
+    assert criptograms == list(RSA().encrypt_stream(pub_key, BytesIO(data)))
+    assert decrypted == data
+
+
+def test_requisicoes_em_pipeline_devem_retornar_na_ordem(tmp_path):
+    messages = [f'token-{i}'.encode() for i in range(700)]
+    messages[0] = b'\x00\x01token'
+
+    def scenario(server, socket_path, stop):
+        with RSAClient(socket_path) as client:
+            criptograms = list(client.encrypt_batch(messages, key=pub))
+            return list(client.decrypt_batch(criptograms, key=priv))
+
+    assert run_with_server(tmp_path, scenario, max_concurrency=1) == messages
+
+
+def test_chaves_devem_ser_lidas_dos_arquivos_uma_unica_vez(tmp_path):
+    write_key_pair(str(tmp_path), 'chave', priv, pub, output_type='pem')
+    key_file = str(tmp_path / 'chave_public_key.pem')
+
+    def scenario(server, socket_path, stop):
+        with RSAClient(socket_path) as client:
+            infos = [client.key_info(key_file=key_file) for _ in range(3)]
+        return infos, len(server._key_files)
+
+    infos, loaded = run_with_server(tmp_path, scenario)
+
+    assert infos[0] == (load_public_key(pub).fingerprint, 64)
+    assert infos.count(infos[0]) == 3
+    assert loaded == 1
+
+
+def test_erro_deve_ser_retornado_sem_encerrar_a_conexao(tmp_path):
+    def scenario(server, socket_path, stop):
+        with RSAClient(socket_path) as client:
+            with raises(ServerError, match='desconhecida'):
+                client.request('inexistente')
+            with raises(ServerError):
+                client.request('encrypt', key='00', data='00')
+            return client.request('key_info', key=pub)
+
+    assert run_with_server(tmp_path, scenario)['size'] == 64
+
+
+def test_stats_deve_retornar_p50_e_p99_das_operacoes(tmp_path):
+    def scenario(server, socket_path, stop):
+        with RSAClient(socket_path) as client:
+            list(client.generate_keys(count=2, key_size=64))
+            return client.stats()
+
+    stats = run_with_server(tmp_path, scenario)
+
+    assert stats['generate_keys']['count'] == 2
+    assert 0 < stats['generate_keys']['p50'] <= stats['generate_keys']['p99']
+
+
+def wait_until(condition, timeout=10.0):
+    """
+    Aguarda `condition()` ser verdadeira, falhando após `timeout` segundos.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'Tempo de espera esgotado'
+        time.sleep(0.01)
+
+
+def test_encerramento_deve_concluir_as_requisicoes_recebidas(tmp_path):
+    release = threading.Event()
+
+    def scenario(server, socket_path, stop):
+        # As operações ficam em andamento até o encerramento do servidor
+        generate_keys = server._operations['generate_keys']
+
+        async def held(request):
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, release.wait, 10)
+            return await generate_keys(request)
+
+        server._operations['generate_keys'] = held
+
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.settimeout(10)
+            sock.connect(socket_path)
+            sock.sendall(
+                b''.join(
+                    encode_frame(
+                        {'id': i, 'op': 'generate_keys', 'key_size': 128}
+                    )
+                    for i in range(3)
+                )
+            )
+            # Aguarda a leitura das requisições pelo servidor
+            wait_until(lambda: server.in_flight == 3)
+            stop()
+            wait_until(server._stopping.is_set)
+            release.set()
+
+            with sock.makefile('rb') as file:
+                responses = [recv_frame(file) for _ in range(3)]
+                with raises(EOFError):
+                    recv_frame(file)
+            return responses
+
+    responses = run_with_server(tmp_path, scenario)
+
+    assert sorted(response['id'] for response in responses) == [0, 1, 2]
+    assert all('result' in response for response in responses)
+    assert not os.path.exists(tmp_path / 'rsa.sock')
+
+
+def test_socket_deve_ser_acessivel_somente_pelo_usuario(tmp_path):
+    umask = os.umask(0o022)
+    try:
+
+        def scenario(server, socket_path, stop):
+            return stat.S_IMODE(os.stat(socket_path).st_mode), os.umask(0o022)
+
+        mode, umask_during_serve = run_with_server(tmp_path, scenario)
+    finally:
+        os.umask(umask)
+
+    assert mode == 0o600
+    assert umask_during_serve == 0o022
+
+
+def test_servidor_nao_deve_remover_caminho_que_nao_e_socket(tmp_path):
+    (tmp_path / 'rsa.sock').write_text('dados')
+    server = RSAServer(socket_path=str(tmp_path / 'rsa.sock'), workers=1)
+
+    with raises(FileExistsError):
+        asyncio.run(server.serve())
+    assert (tmp_path / 'rsa.sock').read_text() == 'dados'
+
+
+def test_diretorio_padrao_deve_ser_criado_somente_para_o_usuario(
+    tmp_path, monkeypatch
+):
+    directory = tmp_path / 'rsa'
+    monkeypatch.setattr('rsa.core.RSAServer.SOCKET_DIR', str(directory))
+    monkeypatch.setattr('rsa.core.RSAClient.SOCKET_DIR', str(directory))
+
+    def scenario(server, socket_path, stop):
+        with RSAClient(socket_path) as client:
+            client.stats()
+        return stat.S_IMODE(os.stat(directory).st_mode)
+
+    assert run_with_server(directory, scenario) == 0o700
+
+
+def test_diretorio_padrao_com_acesso_de_outros_usuarios_deve_ser_recusado(
+    tmp_path, monkeypatch
+):
+    directory = tmp_path / 'rsa'
+    directory.mkdir()
+    directory.chmod(0o755)
+    (tmp_path / 'link').symlink_to(tmp_path / 'privado')
+    (tmp_path / 'privado').mkdir(mode=0o700)
+    monkeypatch.setattr('rsa.core.RSAClient.SOCKET_DIR', str(directory))
+
+    with raises(PermissionError):
+        secure_socket_dir(str(directory))
+    with raises(PermissionError):
+        secure_socket_dir(str(tmp_path / 'link'))
+    with raises(ConnectionError, match='0700'):
+        RSAClient(str(directory / 'rsa.sock'))
+
+
+def test_frames_invalidos_devem_levantar_protocol_error():
+    with raises(ProtocolError):
+        decode_body(b'[1, 2]')
+    with raises(ProtocolError):
+        decode_body(b'{"id": ')
+    with raises(ProtocolError):
+        recv_frame(BytesIO(HEADER.pack(MAX_FRAME_SIZE + 1)))
+
+
+def test_cli_deve_usar_o_servidor(tmp_path):
+    write_key_pair(str(tmp_path), 'chave', priv, pub, output_type='hex')
+
+    def scenario(server, socket_path, stop):
+        result = runner.invoke(
+            cli,
+            [
+                'cript',
+                'mensagem pelo servidor',
+                '--key-file',
+                str(tmp_path / 'chave_public_key.txt'),
+                '--output-path',
+                str(tmp_path),
+                '--output-filename',
+                'cifra.bin',
+                '--server',
+                socket_path,
+            ],
+        )
+        return result.exit_code, server.latencies['encrypt'].count
+
+    exit_code, requests = run_with_server(tmp_path, scenario)
+    criptograms = read_criptograms(
+        str(tmp_path / 'cript' / 'files' / 'cifra.bin'),
+        fingerprint=load_public_key(pub).fingerprint,
+    )
+
+    assert exit_code == 0
+    assert requests == 1
+    assert (
+        b''.join(RSA().decrypt_stream(load_private_key(priv), criptograms))
+        == b'mensagem pelo servidor'
+    )
+
+
+def test_dcript_pelo_servidor_deve_encerrar_a_conexao_em_caso_de_erro(
+    tmp_path, monkeypatch
+):
+    other_priv, _ = RSA(key_size=256).generate_keys()
+    write_key_pair(str(tmp_path), 'outra', other_priv, pub, output_type='hex')
+    criptogram_file = tmp_path / 'cifra.bin'
+    with open(criptogram_file, 'wb') as file:
+        write_container(
+            output=file,
+            fingerprint=load_public_key(pub).fingerprint,
+            block_size=load_public_key(pub).size,
+            criptograms=RSA().encrypt_stream(pub, BytesIO(b'mensagem')),
+        )
+    closed = []
+    close = RSAClient.close
+    monkeypatch.setattr(
+        RSAClient, 'close', lambda self: closed.append(1) or close(self)
+    )
+
+    def scenario(server, socket_path, stop):
+        return runner.invoke(
+            cli,
+            [
+                'dcript',
+                '--criptogram-file',
+                str(criptogram_file),
+                '--key-file',
+                str(tmp_path / 'outra_private_key.txt'),
+                '--output-path',
+                str(tmp_path),
+                '--output-filename',
+                'mensagem.txt',
+                '--server',
+                socket_path,
+            ],
+        )
+
+    result = run_with_server(tmp_path, scenario)
+
+    assert isinstance(result.exception, ValueError)
+    assert closed == [1]
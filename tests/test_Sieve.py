@@ -0,0 +1,85 @@
+from itertools import takewhile
+
+from pytest import mark
+
+from rsa.utils.MillerRabin import MillerRabin
+from rsa.utils.Sieve import (
+    SMALL_PRIMES,
+    candidates,
+    safe_candidates,
+    safe_sieve_window,
+    sieve_window,
+)
+
+
+@mark.parametrize('start', [3, 1001, 2**64 + 1, 2**127 + 1])
+def test_a_peneira_deve_descartar_somente_multiplos_de_primos_pequenos(start):
+    bitmap = sieve_window(start=start, size=512)
+
+    for index, survivor in enumerate(bitmap):
+        num = start + 2 * index
+        composite = any(num % p == 0 and num != p for p in SMALL_PRIMES)
+        assert survivor == (not composite)
+
+
+def test_a_peneira_nao_deve_descartar_os_primos_pequenos():
+    bitmap = sieve_window(start=3, size=20)
+    survivors = [3 + 2 * i for i, survivor in enumerate(bitmap) if survivor]
+
+    assert survivors == [3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+
+
+def test_candidatos_devem_incluir_todos_os_primos_da_janela():
+    start = 2**64 + 1
+    miller_rabin = MillerRabin(iterations=5)
+    esperado = [
+        num
+        for num in range(start, start + 20000, 2)
+        if miller_rabin.verify(num=num)
+    ]
+
+    result = list(
+        takewhile(
+            lambda num: num < start + 20000,
+            candidates(start=start, window=256),
+        )
+    )
+
+    assert set(esperado) <= set(result)
+    assert all(num % 2 == 1 for num in result)
+
+
+@mark.parametrize('start', [3, 1001, 2**64 + 1])
+def test_a_peneira_dupla_deve_descartar_q_e_2q_mais_1_com_fatores_pequenos(
+    start,
+):
+    bitmap = safe_sieve_window(start=start, size=512)
+
+    for index, survivor in enumerate(bitmap):
+        q = start + 2 * index
+        composite = any(
+            num % p == 0 and num != p
+            for p in SMALL_PRIMES
+            for num in (q, 2 * q + 1)
+        )
+        assert survivor == (not composite)
+
+
+def test_candidatos_seguros_devem_incluir_todos_os_primos_seguros_da_janela():
+    start = 2**64 + 1
+    miller_rabin = MillerRabin(iterations=5)
+    esperado = [
+        q
+        for q in range(start, start + 200000, 2)
+        if miller_rabin.verify(num=q) and miller_rabin.verify(num=2 * q + 1)
+    ]
+
+    result = list(
+        takewhile(
+            lambda num: num < start + 200000,
+            safe_candidates(start=start, window=256),
+        )
+    )
+
+    assert esperado
+    assert set(esperado) <= set(result)
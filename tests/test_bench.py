@@ -0,0 +1,163 @@
+import json
+from contextlib import contextmanager
+
+from pytest import raises
+from typer.testing import CliRunner
+
+from rsa.bench.suite import (
+    Benchmark,
+    benchmarks,
+    compare,
+    load_report,
+    make_report,
+    percentile,
+    run_benchmark,
+    save_report,
+    select,
+)
+from rsa.core.cli import cli
+from rsa.utils.MillerRabin import MillerRabin
+
+runner = CliRunner()
+
+
+def _result(name, median, peak_memory=100):
+    return {'name': name, 'median': median, 'peak_memory': peak_memory}
+
+
+def test_percentil_deve_usar_o_posto_mais_proximo():
+    assert percentile(list(range(1, 101)), 95) == 95
+    assert percentile([7], 95) == 7
+
+
+def test_select_deve_filtrar_pelos_padroes_glob():
+    suite = benchmarks()
+
+    selected = select(suite, ['prime.*', 'rsa.cript'])
+
+    assert [benchmark.name for benchmark in selected] == [
+        'prime.generate.512',
+        'prime.generate.1024',
+        'prime.generate.2048',
+        'rsa.cript',
+    ]
+    assert select(suite) == suite
+
+
+def test_suite_deve_comparar_os_testes_de_primalidade_e_os_primos_seguros():
+    names = [benchmark.name for benchmark in benchmarks()]
+
+    for bits in (1024, 2048):
+        for kind in ('prime', 'composite'):
+            assert f'miller_rabin.verify.{kind}.{bits}' in names
+            assert f'bpsw.verify.{kind}.{bits}' in names
+        assert f'prime.generate.{bits}' in names
+        assert f'bpsw.generate.{bits}' in names
+    assert 'safe_prime.generate.512' in names
+
+    for name in ('bpsw.verify.composite.1024', 'safe_prime.generate.256'):
+        (benchmark,) = select(benchmarks(), [name])
+        assert run_benchmark(benchmark, repeat=1, warmup=0).runs == 1
+
+
+def test_run_benchmark_deve_calcular_as_estatisticas():
+    calls = []
+
+    @contextmanager
+    def setup():
+        yield lambda: calls.append(1)
+
+    result = run_benchmark(
+        Benchmark('contador', setup, nbytes=1024), repeat=5, warmup=2
+    )
+
+    # Aquecimento, execuções medidas e a execução do pico de memória
+    assert len(calls) == 2 + 5 + 1
+    assert result.runs == 5
+    assert result.min <= result.median <= result.p95
+    assert result.peak_memory is not None
+    assert result.throughput == 1024 / result.median
+
+
+def test_run_benchmark_deve_preparar_os_mesmos_dados_com_a_mesma_semente(
+    monkeypatch,
+):
+    benchmark = select(benchmarks(), ['miller_rabin.verify.composite.1024'])[0]
+    nums = []
+    monkeypatch.setattr(
+        MillerRabin, 'verify', lambda self, num: nums.append(num) or False
+    )
+
+    for _ in range(2):
+        run_benchmark(benchmark, repeat=1, warmup=0, seed=7)
+
+    assert nums[: len(nums) // 2] == nums[len(nums) // 2 :]
+
+
+def test_run_benchmark_deve_retornar_erro_para_repeat_menor_que_1():
+    with raises(ValueError):
+        run_benchmark(benchmarks()[0], repeat=0)
+
+
+def test_compare_deve_apontar_somente_as_metricas_acima_do_limite():
+    baseline = {
+        'results': [_result('a', 1.0), _result('b', 1.0), _result('c', 1.0)]
+    }
+    current = {
+        'results': [
+            _result('a', 1.05),
+            _result('b', 2.0),
+            _result('c', 1.0, peak_memory=200),
+            _result('d', 9.0),
+        ]
+    }
+
+    regressions = compare(current, baseline, threshold=0.1)
+
+    assert [(r.name, r.metric) for r in regressions] == [
+        ('b', 'median'),
+        ('c', 'peak_memory'),
+    ]
+
+
+def test_relatorio_deve_ser_salvo_e_lido_em_json(tmp_path):
+    result = run_benchmark(select(benchmarks(), ['jbr.*'])[0], repeat=2)
+    report = make_report([result], repeat=2, warmup=1, seed=0)
+    path = tmp_path / 'bench.json'
+
+    save_report(report, str(path))
+
+    assert load_report(str(path)) == json.loads(json.dumps(report))
+    assert load_report(str(path))['results'][0]['name'] == 'jbr.inv_mod.2048'
+
+
+def test_rsa_cli_bench_deve_salvar_o_relatorio_e_apontar_regressoes(tmp_path):
+    output = tmp_path / 'atual.json'
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(
+        json.dumps({'results': [_result('jbr.inv_mod.2048', 1e-12, None)]})
+    )
+
+    result = runner.invoke(
+        cli,
+        ['bench', '--only', 'jbr.*', '--repeat', '2', '--output', f'{output}'],
+    )
+
+    assert result.exit_code == 0
+    assert load_report(str(output))['results'][0]['runs'] == 2
+
+    result = runner.invoke(
+        cli,
+        [
+            'bench',
+            '--only',
+            'jbr.*',
+            '--repeat',
+            '2',
+            '--baseline',
+            f'{baseline}',
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert 'regressões' in result.output
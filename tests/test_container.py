@@ -0,0 +1,67 @@
+from io import BytesIO
+
+import pytest
+
+from rsa.utils.container import (
+    BATCH_BLOCKS,
+    HEADER_SIZE,
+    UNKNOWN_COUNT,
+    read_blocks,
+    read_header,
+    write_container,
+)
+
+fingerprint = bytes(range(32))
+criptograms = list(range(1, 2 * BATCH_BLOCKS + 10))
+
+
+class _Stream(BytesIO):
+    def seekable(self):
+        return False
+
+
+def test_write_container_deve_escrever_cabecalho_e_blocos_de_tamanho_fixo():
+    output = BytesIO()
+    count = write_container(output, fingerprint, 128, criptograms)
+
+    assert count == len(criptograms)
+    assert len(output.getvalue()) == HEADER_SIZE + 128 * len(criptograms)
+
+
+def test_read_blocks_deve_retornar_os_criptogramas_escritos():
+    output = BytesIO()
+    write_container(output, fingerprint, 128, criptograms)
+    output.seek(0)
+
+    header = read_header(output)
+
+    assert header.fingerprint == fingerprint
+    assert header.block_size == 128
+    assert header.block_count == len(criptograms)
+    assert list(read_blocks(output, header)) == criptograms
+
+
+def test_write_container_deve_manter_quantidade_desconhecida_sem_seek():
+    output = _Stream()
+    write_container(output, fingerprint, 128, criptograms)
+
+    source = BytesIO(output.getvalue())
+    header = read_header(source)
+
+    assert header.block_count == UNKNOWN_COUNT
+    assert list(read_blocks(source, header)) == criptograms
+
+
+def test_read_blocks_deve_retornar_erro_para_arquivo_truncado():
+    output = BytesIO()
+    write_container(output, fingerprint, 128, criptograms)
+    source = BytesIO(output.getvalue()[:-128])
+    header = read_header(source)
+
+    with pytest.raises(ValueError):
+        list(read_blocks(source, header))
+
+
+def test_read_header_deve_retornar_erro_para_formato_invalido():
+    with pytest.raises(ValueError):
+        read_header(BytesIO(b'123456\n'))
@@ -0,0 +1,163 @@
+import random
+
+from pyasn1.codec.der.decoder import decode
+from pyasn1.codec.der.encoder import encode
+from pyasn1.error import PyAsn1Error
+from pyasn1.type.univ import Integer, SequenceOf
+from pytest import mark, raises
+
+from rsa.core.RSA import RSA
+from rsa.utils.decode_rsa_key import decode_private_key as decode_pkcs1
+from rsa.utils.der.codec import (
+    CRT_FIELDS,
+    PKCS1_FIELDS,
+    PRIVATE_KEY_FIELDS,
+    DERError,
+    decode_private_key,
+    decode_public_key,
+    decode_sequence,
+    encode_private_key,
+    encode_public_key,
+    encode_sequence,
+)
+from rsa.utils.der.DataTypes.PrivateKey import PrivateKey, PrivateKeyRSA
+from rsa.utils.der.DataTypes.PublicKey import PublicKey
+
+
+def _random_int(rng: random.Random) -> int:
+    # Inteiros de tamanhos variados, incluindo os limites de cada byte e os negativos
+    bits = rng.choice((0, 1, 7, 8, 9, 15, 16, 64, 127, 128, 1024, 2048))
+    value = rng.getrandbits(bits) if bits else 0
+    value = rng.choice((value, 2**bits, 2**bits - 1))
+    return -value if rng.random() < 0.2 else value
+
+
+def _asn1(spec, values):
+    asn1 = spec.clone()
+    for index, value in enumerate(values):
+        asn1.setComponentByPosition(index, value)
+    return asn1
+
+
+@mark.parametrize('seed', range(20))
+def test_codificacao_deve_ser_identica_a_do_pyasn1(seed):
+    rng = random.Random(seed)
+    public = [_random_int(rng) for _ in range(2)]
+    private = [_random_int(rng) for _ in range(5)]
+    crt = dict(zip(CRT_FIELDS, (_random_int(rng) for _ in range(3))))
+    pkcs1 = [_random_int(rng) for _ in range(9)]
+
+    assert encode_public_key(*public) == encode(_asn1(PublicKey(), public))
+    assert encode_private_key(*private) == encode(_asn1(PrivateKey(), private))
+
+    with_crt = _asn1(PrivateKey(), private)
+    with_crt['crt'].setComponents(*crt.values())
+    assert encode_private_key(*private, **crt) == encode(with_crt)
+
+    assert encode_sequence(pkcs1) == encode(_asn1(PrivateKeyRSA(), pkcs1))
+
+
+@mark.parametrize('seed', range(20))
+def test_decodificacao_deve_retornar_os_valores_codificados(seed):
+    rng = random.Random(seed)
+    private = dict(
+        zip(
+            PRIVATE_KEY_FIELDS + CRT_FIELDS,
+            (_random_int(rng) for _ in range(8)),
+        )
+    )
+    pkcs1 = [_random_int(rng) for _ in range(9)]
+
+    assert decode_public_key(encode_public_key(n=private['n'], e=3)) == {
+        'n': private['n'],
+        'e': 3,
+    }
+    assert decode_private_key(encode_private_key(**private)) == private
+    assert decode_private_key(encode_sequence(pkcs1)) == dict(
+        zip(PKCS1_FIELDS, pkcs1)
+    )
+
+
+@mark.parametrize('seed', range(50))
+def test_entradas_corrompidas_devem_ser_rejeitadas_ou_decodificadas_como_no_pyasn1(
+    seed,
+):
+    rng = random.Random(seed)
+    der = bytearray(
+        encode_sequence([_random_int(rng) for _ in range(rng.randint(1, 6))])
+    )
+    if rng.random() < 0.5:
+        der = der[: rng.randrange(len(der))]
+    else:
+        for _ in range(rng.randint(1, 3)):
+            der[rng.randrange(len(der))] = rng.randrange(256)
+
+    try:
+        values, rest = decode_sequence(der)
+    except DERError:
+        return
+
+    # O que o codec nativo aceita, o pyasn1 também aceita, com os mesmos valores
+    expected, expected_rest = decode(
+        bytes(der), asn1Spec=SequenceOf(componentType=Integer())
+    )
+    assert values == [int(value) for value in expected]
+    assert bytes(rest) == expected_rest
+
+
+def test_der_truncado_deve_levantar_der_error():
+    der = encode_public_key(n=3233, e=17)
+
+    for size in range(len(der)):
+        with raises(DERError):
+            decode_sequence(der[:size])
+
+
+def test_comprimento_fora_da_forma_minima_deve_ser_decodificado_pelo_pyasn1():
+    # Comprimento 7 na forma longa ('8107'), aceito somente pelo BER
+    ber = bytes.fromhex('30810702020ca1020111')
+
+    with raises(DERError):
+        decode_sequence(ber)
+    assert decode_public_key(ber) == {'n': 3233, 'e': 17}
+
+
+def test_chave_em_formato_desconhecido_deve_levantar_pyasn1_error():
+    with raises(PyAsn1Error):
+        decode_private_key(encode_sequence([1, 2, 3]))
+
+    with raises(PyAsn1Error):
+        decode_public_key(encode_sequence([1, 2, 3]))
+
+
+def test_chaves_geradas_devem_ser_decodificadas_como_no_pyasn1():
+    priv, pub = RSA(key_size=512).generate_keys()
+
+    expected_pub, _ = decode(bytes.fromhex(pub), asn1Spec=PublicKey())
+    expected_priv, _ = decode(bytes.fromhex(priv), asn1Spec=PrivateKey())
+
+    assert decode_public_key(bytes.fromhex(pub)) == {
+        'n': int(expected_pub['modulus']),
+        'e': int(expected_pub['public_expoent']),
+    }
+    infos = decode_private_key(bytes.fromhex(priv))
+    assert infos['d'] == int(expected_priv['private_expoent'])
+    assert [infos[name] for name in CRT_FIELDS] == [
+        int(value) for value in expected_priv['crt'].values()
+    ]
+
+
+def test_decode_rsa_key_deve_usar_os_nomes_do_pkcs1():
+    pkcs1 = list(range(9))
+
+    assert decode_pkcs1(encode_sequence(pkcs1)) == {
+        'version': 0,
+        'modulus': 1,
+        'publicExponent': 2,
+        'privateExponent': 3,
+        'prime1': 4,
+        'prime2': 5,
+        'exponent1': 6,
+        'exponent2': 7,
+        'coefficient': 8,
+    }
@@ -1,4 +1,10 @@
-from rsa.utils.GenPrimeNumber import generate_prime
+from pytest import raises
+
+from rsa.utils.GenPrimeNumber import (
+    generate_prime,
+    generate_rsa_prime,
+    generate_safe_prime,
+)
 from rsa.utils.MillerRabin import MillerRabin
 
 
@@ -17,3 +23,41 @@ def test_deve_retornar_num_primo():
     miller_rabin = MillerRabin()
 
     assert miller_rabin.verify(num=prime) == True
+
+
+def test_p_menos_1_deve_ser_coprimo_com_o_expoente_publico():
+    prime = generate_rsa_prime(nbit=64, public_exp=3)
+
+    assert (prime - 1) % 3 != 0
+
+
+def test_deve_gerar_num_primo_com_o_teste_bpsw():
+    prime = generate_prime(nbit=256, primality='bpsw')
+
+    assert prime.bit_length() == 256
+    assert MillerRabin().verify(num=prime)
+
+
+def test_deve_retornar_erro_para_teste_de_primalidade_desconhecido():
+    with raises(ValueError):
+        generate_prime(nbit=64, primality='fermat')
+
+
+def test_deve_gerar_primo_seguro():
+    prime = generate_safe_prime(nbit=128)
+
+    assert prime.bit_length() == 128
+    assert MillerRabin().verify(num=prime)
+    assert MillerRabin().verify(num=(prime - 1) // 2)
+
+
+def test_deve_gerar_primo_seguro_com_o_teste_bpsw():
+    prime = generate_rsa_prime(nbit=96, primality='bpsw', safe=True)
+
+    assert prime.bit_length() == 96
+    assert MillerRabin().verify(num=(prime - 1) // 2)
+
+
+def test_deve_retornar_erro_para_primo_seguro_com_menos_de_3_bits():
+    with raises(ValueError):
+        generate_safe_prime(nbit=2)
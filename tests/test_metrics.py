@@ -0,0 +1,110 @@
+import pstats
+
+from typer.testing import CliRunner
+
+from rsa.core.cli import cli
+from rsa.core.RSA import RSA
+from rsa.utils.GenPrimeNumber import generate_prime
+from rsa.utils.metrics import Histogram, collect, incr, profiling, timed
+
+runner = CliRunner()
+
+
+def test_incr_fora_de_collect_nao_deve_registrar_nada():
+    incr('teste')
+
+    with collect() as metrics:
+        pass
+
+    assert metrics.counters == {}
+
+
+def test_timed_deve_contar_as_chamadas_e_retornar_o_valor_da_funcao():
+    @timed('soma')
+    def soma(a, b):
+        return a + b
+
+    assert soma(1, 2) == 3
+    with collect() as metrics:
+        assert soma(2, 3) == 5
+        assert soma(3, 4) == 7
+
+    assert metrics.calls['soma'] == 2
+    assert metrics.seconds['soma'] >= 0
+
+
+def test_collect_aninhado_deve_restaurar_as_metricas_externas():
+    with collect() as outer:
+        incr('externo')
+        with collect() as inner:
+            incr('interno')
+        incr('externo')
+
+    assert outer.counters == {'externo': 2}
+    assert inner.counters == {'interno': 1}
+
+
+def test_deve_contar_candidatos_e_rodadas_na_geracao_de_primos():
+    with collect() as metrics:
+        generate_prime(nbit=256)
+
+    counters = metrics.counters
+    assert metrics.calls['prime.generate'] == 1
+    assert counters['primality.candidates'] >= 1
+    assert counters['miller_rabin.rounds'] >= counters['primality.candidates']
+    assert counters['modexp'] == counters['miller_rabin.rounds']
+
+
+def test_deve_contar_as_exponenciacoes_da_cifracao_e_da_decifracao():
+    rsa = RSA(key_size=128)
+    private_key, public_key = rsa.generate_keys()
+
+    with collect() as metrics:
+        rsa.dcript(private_key, rsa.cript(public_key, 'metricas'))
+
+    assert metrics.calls['rsa.cript'] == 1
+    assert metrics.calls['rsa.dcript'] == 1
+    assert metrics.counters['modexp'] == 1 + 2
+
+
+def test_profiling_deve_salvar_o_perfil_no_arquivo(tmp_path):
+    path = tmp_path / 'perfil.prof'
+
+    with profiling(str(path)):
+        generate_prime(nbit=64)
+
+    assert pstats.Stats(str(path)).total_calls > 0
+
+
+def test_rsa_cli_deve_exibir_as_estatisticas_com_stats(tmp_path):
+    result = runner.invoke(
+        cli,
+        [
+            '--stats',
+            '--profile',
+            f'{tmp_path / "perfil.prof"}',
+            'generate-keys',
+            '--file-prefix',
+            'pytest-stats',
+            '--output-path',
+            f'{tmp_path}',
+            '--key-size',
+            '128',
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert 'prime.generate: 2 chamadas' in result.output
+    assert (tmp_path / 'perfil.prof').is_file()
+
+
+def test_histogram_deve_estimar_os_percentis_com_erro_de_ate_19_porcento():
+    histogram = Histogram()
+    for us in range(1, 10001):
+        histogram.add(us / 1e6)
+
+    assert histogram.count == 10000
+    assert 5e-3 <= histogram.percentile(0.5) <= 5e-3 * 1.19
+    assert 9.9e-3 <= histogram.percentile(0.99) <= 10e-3
+    assert histogram.as_dict()['max'] == 10e-3
+    assert Histogram().percentile(0.5) == 0.0
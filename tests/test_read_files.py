@@ -0,0 +1,124 @@
+import os
+import shutil
+import subprocess
+from base64 import b64encode
+
+from pytest import fixture, mark, raises
+
+from rsa.core.RSA import RSA
+from rsa.core.RSAKey import load_private_key, load_public_key
+from rsa.utils.cli.read_files import read_key_file
+from rsa.utils.cli.write_files import write_key_pair
+
+rsa = RSA(key_size=256)
+priv, pub = rsa.generate_keys()
+
+
+@fixture
+def pem_keys(tmp_path):
+    write_key_pair(
+        key_file_path=str(tmp_path),
+        file_prefix='chave',
+        private_key=priv,
+        public_key=pub,
+        output_type='pem',
+    )
+    return (
+        str(tmp_path / 'chave_private_key.pem'),
+        str(tmp_path / 'chave_public_key.pem'),
+    )
+
+
+def test_pem_deve_conter_o_base64_dos_bytes_der(pem_keys):
+    _, public_path = pem_keys
+
+    with open(public_path) as file:
+        lines = file.read().splitlines()
+
+    assert lines[0] == '-----BEGIN RSA PUBLIC KEY-----'
+    assert lines[-1] == '-----END RSA PUBLIC KEY-----'
+    assert ''.join(lines[1:-1]) == b64encode(bytes.fromhex(pub)).decode()
+    assert all(len(line) <= 64 for line in lines[1:-1])
+
+
+def test_chaves_pem_devem_cifrar_e_decifrar(pem_keys):
+    private_path, public_path = pem_keys
+    pub_key = load_public_key(read_key_file(public_path, key_type='public'))
+    priv_key = load_private_key(
+        read_key_file(private_path, key_type='private')
+    )
+
+    assert pub_key.fingerprint == load_public_key(pub).fingerprint
+    cifra = rsa.cript(public_key=pub_key, msg='teste')
+    assert rsa.dcript(private_key=priv_key, criptogram=cifra) == 'teste'
+
+
+def test_pem_antigo_deve_ser_detectado(tmp_path):
+    path = tmp_path / 'antiga_public_key.pem'
+    path.write_text(
+        '-----BEGIN RSA PUBLIC KEY-----\n'
+        f'{b64encode(pub.encode()).decode()}\n'
+        '-----END RSA PUBLIC KEY-----'
+    )
+
+    assert read_key_file(str(path), key_type='public') == bytes.fromhex(pub)
+
+
+def test_chave_hexadecimal_deve_ser_lida_como_der(tmp_path):
+    path = tmp_path / 'chave_public_key.txt'
+    path.write_text(pub)
+
+    assert read_key_file(str(path), key_type='public') == bytes.fromhex(pub)
+
+
+def test_pem_com_linhas_de_tamanhos_variados_deve_ser_decodificado(tmp_path):
+    encoded = b64encode(bytes.fromhex(pub)).decode()
+    path = tmp_path / 'chave_public_key.pem'
+    path.write_text(
+        '\n-----BEGIN RSA PUBLIC KEY-----\n'
+        + '\n'.join(encoded[i : i + 7] for i in range(0, len(encoded), 7))
+        + '\n-----END RSA PUBLIC KEY-----\n'
+    )
+
+    assert read_key_file(str(path), key_type='public') == bytes.fromhex(pub)
+
+
+def test_pem_sem_a_linha_final_deve_levantar_value_error(tmp_path):
+    path = tmp_path / 'chave_public_key.pem'
+    path.write_text('-----BEGIN RSA PUBLIC KEY-----\nMAcCAgyhAgER\n')
+
+    with raises(ValueError):
+        read_key_file(str(path), key_type='public')
+
+
+@mark.skipif(shutil.which('openssl') is None, reason='OpenSSL não instalado')
+def test_chaves_pem_devem_ser_lidas_pelo_openssl(pem_keys):
+    private_path, public_path = pem_keys
+
+    private = subprocess.run(
+        ['openssl', 'rsa', '-in', private_path, '-check', '-noout'],
+        capture_output=True,
+        text=True,
+    )
+    public = subprocess.run(
+        ['openssl', 'rsa', '-RSAPublicKey_in', '-in', public_path, '-noout'],
+        capture_output=True,
+    )
+
+    assert private.returncode == 0
+    assert 'RSA key ok' in private.stdout
+    assert public.returncode == 0
+
+
+@mark.skipif(shutil.which('openssl') is None, reason='OpenSSL não instalado')
+def test_chave_privada_do_openssl_deve_ser_lida(tmp_path):
+    path = str(tmp_path / 'openssl_private_key.pem')
+    subprocess.run(
+        ['openssl', 'genrsa', '-traditional', '-out', path, '1024'],
+        check=True,
+        capture_output=True,
+    )
+    priv_key = load_private_key(read_key_file(path, key_type='private'))
+
+    assert priv_key.n.bit_length() == 1024
+    assert os.path.getsize(path) < 1000